@@ -0,0 +1,93 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""Rows per second of the dividends parsing of `investpy.get_stock_dividends` and `investpy.get_stocks_dividends`.
+
+The recorded dividends rows from `tests/fixtures` are replicated until they contain as many rows as the
+dividends of a few hundred stocks, and parsed as done before (converting the dates and values of every row
+one by one) and with the vectorized `investpy.utils.dividends.parse_dividends`.
+
+    $ python -m benchmarks.bench_dividends
+
+"""
+
+import os
+import re
+import timeit
+from datetime import datetime
+
+import pandas as pd
+from lxml.html import fromstring
+
+from investpy.utils.dividends import DIVIDEND_TYPES, parse_dividends
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def build_rows(n_rows):
+    with open(os.path.join(FIXTURES, "stock_dividends.html"), encoding="utf-8") as f:
+        html = f.read()
+
+    rows = re.findall(r"<tr event_timestamp.*?</tr>", html, flags=re.S)
+
+    # Every copy of the rows is a week older than the previous one, so that dates are not repeated
+    body = "\n".join(
+        re.sub(
+            r'"(\d{10})"',
+            lambda match: '"' + str(int(match.group(1)) - i // len(rows) * 604800) + '"',
+            rows[i % len(rows)],
+        )
+        for i in range(n_rows)
+    )
+
+    return fromstring("<table><tbody>" + body + "</tbody></table>").xpath(".//tr")
+
+
+def legacy_dividends(rows):
+    # Per-row date conversions, as done before `parse_dividends`
+    objs = list()
+    for elements_ in rows:
+        dividend_date = dividend_value = dividend_type = dividend_payment_date = dividend_yield = None
+        for element_ in elements_.xpath(".//td"):
+            if element_.get("class"):
+                if element_.get("class").__contains__("first"):
+                    dividend_date = datetime.strptime(
+                        str(datetime.fromtimestamp(int(element_.get("data-value"))).date()), "%Y-%m-%d"
+                    )
+                    dividend_value = float(element_.getnext().text_content().replace(",", ""))
+                if element_.get("data-value") in DIVIDEND_TYPES.keys():
+                    dividend_type = DIVIDEND_TYPES[element_.get("data-value")]
+                    try:
+                        value = int(element_.getnext().get("data-value"))
+                        dividend_payment_date = datetime.strptime(
+                            str(datetime.fromtimestamp(value).date()), "%Y-%m-%d"
+                        )
+                    except:
+                        dividend_payment_date = None
+                    dividend_yield = element_.getnext().getnext().text_content()
+        objs.append(
+            {
+                "Date": dividend_date,
+                "Dividend": dividend_value,
+                "Type": dividend_type,
+                "Payment Date": dividend_payment_date,
+                "Yield": dividend_yield,
+            }
+        )
+    return pd.DataFrame(objs)
+
+
+def main(n_rows=20000, repeat=5, number=3):
+    rows = build_rows(n_rows)
+
+    pd.testing.assert_frame_equal(legacy_dividends(rows), parse_dividends(rows))
+
+    print(f"dividends: {len(rows)} rows")
+
+    for name, func in {"legacy": legacy_dividends, "vectorized": parse_dividends}.items():
+        best = min(timeit.repeat(lambda: func(rows), repeat=repeat, number=number)) / number
+        print(f"{name:>10}: {best * 1e3:8.2f} ms {len(rows) / best:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
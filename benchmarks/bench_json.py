@@ -0,0 +1,63 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""Serialization time of the `as_json=True` output of the historical data functions.
+
+The legacy path builds a `Data` object and a `dict` per row and then dumps the whole
+structure, while `investpy.utils.historical.write_json` writes directly from the parsed
+columns; the compact path uses orjson if it is installed.
+
+    $ python -m benchmarks.bench_json
+
+"""
+
+import io
+import json
+import timeit
+from datetime import datetime
+
+from investpy.utils.data import Data
+from investpy.utils.historical import SCHEMAS, orjson, parse_rows, write_json
+from investpy.utils.parsers import historical_rows
+
+from .bench_parsers import build_response
+
+
+def legacy_json(columns):
+    result = list()
+    for row in zip(*[columns[key].tolist() for key in columns]):
+        date = datetime.utcfromtimestamp(row[0] * 86400)
+        data = Data(date, row[1], row[2], row[3], row[4], row[5], "EUR", None)
+        result.append(data.stock_as_json())
+    return json.dumps({"name": "BBVA", "historical": result}, sort_keys=False)
+
+
+def main(n_rows=5000, repeat=5, number=10):
+    schema = SCHEMAS["stock"]
+    columns = parse_rows(
+        schema, historical_rows(build_response(n_rows), text_fallback=True)
+    )
+
+    legacy = dict(columns)
+    legacy["Date"] = columns["Date"].astype("int64")
+
+    writers = {
+        "legacy": lambda: legacy_json(legacy),
+        "columnar": lambda: write_json(schema, columns, "BBVA", "historical", currency="EUR"),
+        "stream": lambda: write_json(
+            schema, columns, "BBVA", "historical", currency="EUR", fp=io.StringIO()
+        ),
+        "compact": lambda: write_json(
+            schema, columns, "BBVA", "historical", currency="EUR", compact=True
+        ),
+    }
+
+    print(f"response: {n_rows} rows, orjson {'installed' if orjson else 'not installed'}")
+
+    for name, func in writers.items():
+        best = min(timeit.repeat(func, repeat=repeat, number=number)) / number
+        print(f"{name:>8}: {best * 1e3:8.2f} ms/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""Memory used by `investpy.utils.search_obj.SearchObj` instances.
+
+The class is compared against a subclass with no `__slots__`, which has a per-instance
+`__dict__` as the class used to have.
+
+    $ python -m benchmarks.bench_memory
+
+"""
+
+import tracemalloc
+
+from investpy.utils.search_obj import SearchObj
+
+
+class DictSearchObj(SearchObj):
+    pass
+
+
+def build_search_obj(cls, n):
+    objs = list()
+    for i in range(n):
+        obj = cls(i, "BBVA", "BBVA", "/equities/bbva", "spain", "stocks", "Madrid")
+        obj.default_currency = "EUR"
+        objs.append(obj)
+    return objs
+
+
+def measure(func, cls, n):
+    tracemalloc.start()
+    objs = func(cls, n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return size
+
+
+def main(n=1000000):
+    before = measure(build_search_obj, DictSearchObj, n)
+    after = measure(build_search_obj, SearchObj, n)
+    print(
+        f"SearchObj: {before / n:6.1f} -> {after / n:6.1f} bytes/instance"
+        f" ({100 * (1 - after / before):.0f}% less)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""Rows per second of the overview table parsing of every product type, e.g. `investpy.get_stocks_overview`.
+
+The recorded overview response of every product type from `tests/fixtures` is replicated until it
+contains as many rows as the biggest overview Investing.com sends (~1000 rows), and the values read
+by its overview function are parsed as done before (an XPath query built per value and a catalog
+scan per row) and with `investpy.utils.parsers.overview_cells` and a catalog lookup by name.
+
+    $ python -m benchmarks.bench_overview
+
+"""
+
+import json
+import os
+import re
+import timeit
+
+from lxml.html import fromstring
+
+import investpy
+from investpy.utils.parsers import overview_cells
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+# Recorded response, cells read per row and catalog (with the column looked up by name) of
+# every overview function, where the name of the product is the first cell
+PRODUCTS = {
+    "bonds": (
+        "overview_bonds.html",
+        ["elp", "flag", "last", "last_close", "high", "low", "pc", "pcp"],
+        None,
+    ),
+    "certificates": (
+        "overview_certificates.html",
+        ["elp", "flag", "symbol", "last", "pcp", "turnover"],
+        None,
+    ),
+    "commodities": (
+        "overview_commodities.html",
+        ["elp", "flag", "last", "last_close", "high", "low", "pc", "pcp"],
+        (lambda: investpy.get_commodities(group="metals"), "currency"),
+    ),
+    "cryptos": (
+        "overview_cryptos.html",
+        [
+            "cryptoName",
+            "symb",
+            "price",
+            "js-market-cap",
+            "js-24h-volume",
+            "js-total-vol",
+            "js-currency-change-24h",
+            "js-currency-change-7d",
+        ],
+        None,
+    ),
+    "currency_crosses": (
+        "overview_currency_crosses.json",
+        ["elp", "bid", "ask", "high", "low", "pc", "pcp"],
+        None,
+    ),
+    "etfs": (
+        "overview_etfs.html",
+        ["elp", "flag", "symbol", "last", "pcp", "turnover"],
+        (lambda: investpy.get_etfs(country="spain"), "currency"),
+    ),
+    "funds": (
+        "overview_funds.html",
+        ["elp", "flag", "symbol", "last", "pcp"],
+        # The funds static data file is not shipped, so there is no catalog to look up
+        None,
+    ),
+    "indices": (
+        "overview_indices.html",
+        ["elp", "flag", "last", "high", "low", "pc", "pcp"],
+        (lambda: investpy.get_indices(country="spain"), "currency"),
+    ),
+    "stocks": (
+        "overview_stocks.html",
+        ["elp", "flag", "last", "high", "low", "pc", "pcp", "turnover"],
+        (lambda: investpy.get_stocks(country="spain"), "symbol"),
+    ),
+}
+
+
+def build_response(fixture, n_rows):
+    with open(os.path.join(FIXTURES, fixture), encoding="utf-8") as f:
+        html = json.load(f)["HTML"] if fixture.endswith(".json") else f.read()
+
+    head, body = html.split("<tbody>", 1)
+    body, tail = body.split("</tbody>", 1)
+    rows = re.findall(r"<tr.*?</tr>", body, flags=re.S)
+
+    body = "\n".join(rows[i % len(rows)] for i in range(n_rows))
+
+    return head + "<tbody>" + body + "</tbody>" + tail
+
+
+def legacy_path(key, pid):
+    # XPath query of every value as built per row before `overview_cells`
+    if key in ["last", "last_close", "high", "low", "bid", "ask"]:
+        return ".//td[@class='" + pid + "-" + key + "']"
+    if key in ["pc", "pcp", "turnover"]:
+        return ".//td[contains(@class, '" + pid + "-" + key + "')]"
+    return ".//td[contains(@class, '" + key + "')]"
+
+
+def legacy_rows(table, keys, catalog, column):
+    # Per-value XPath queries and per-row catalog scans, as done before `overview_cells`
+    result = list()
+    for row in table:
+        pid = "pid-" + row.get("id", "").replace("pair_", "")
+        values = tuple(
+            row.xpath(legacy_path(key, pid))[0].text_content().strip() for key in keys
+        )
+        if catalog is not None:
+            values += (catalog.loc[(catalog["name"] == values[0]).idxmax(), column],)
+        result.append(values)
+    return result
+
+
+def one_pass_rows(table, keys, catalog, column):
+    if catalog is not None:
+        details = dict(zip(catalog["name"][::-1], catalog[column][::-1]))
+        missing = catalog[column].iloc[0]
+
+    result = list()
+    for row in table:
+        cells = overview_cells(row)
+        values = tuple(cells[key].text_content().strip() for key in keys)
+        if catalog is not None:
+            values += (details.get(values[0], missing),)
+        result.append(values)
+    return result
+
+
+def main(n_rows=1000, repeat=5, number=3):
+    for product, (fixture, keys, lookup) in PRODUCTS.items():
+        table = fromstring(build_response(fixture, n_rows)).xpath(".//tbody/tr")
+        catalog, column = (None, None) if lookup is None else (lookup[0](), lookup[1])
+
+        args = (table, keys, catalog, column)
+
+        assert legacy_rows(*args) == one_pass_rows(*args)
+
+        size = "none" if catalog is None else f"{len(catalog)} {product}"
+        print(f"{product}: {len(table)} rows, catalog: {size}")
+
+        for name, func in {"legacy": legacy_rows, "one-pass": one_pass_rows}.items():
+            best = min(timeit.repeat(lambda: func(*args), repeat=repeat, number=number)) / number
+            print(f"{name:>8}: {best * 1e3:8.2f} ms/response {len(table) / best:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""Time and memory of aligning many historical data frames with `investpy.build_panel`.
+
+Every synthetic frame covers a random subset of 20 years of business days, so that the
+frames do not share their dates, and it is compared against `pandas.concat(axis=1)`.
+
+    $ python -m benchmarks.bench_panel
+
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from investpy.panel import build_panel
+
+
+def build_frames(n_frames, n_days=5200, seed=0):
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2000-01-03", periods=n_days, name="Date")
+
+    frames = dict()
+    for i in range(n_frames):
+        index = days[np.sort(rng.choice(n_days, size=int(n_days * 0.9), replace=False))]
+        frames[f"product_{i}"] = pd.DataFrame(
+            {"Close": rng.random(len(index)) * 100}, index=index
+        )
+    return frames
+
+
+def main(n_frames=500, repeat=3, number=1):
+    frames = build_frames(n_frames)
+
+    functions = {
+        "concat": lambda: pd.concat(
+            [frame["Close"].rename(name) for name, frame in frames.items()], axis=1
+        ).sort_index(),
+        "panel": lambda: build_panel(frames),
+        "panel32": lambda: build_panel(frames, dtype="float32"),
+    }
+
+    print(f"frames: {n_frames}")
+
+    for name, func in functions.items():
+        best = min(timeit.repeat(func, repeat=repeat, number=number)) / number
+        size = func().memory_usage(index=False).sum() / 1e6
+        print(f"{name:>8}: {best * 1e3:8.2f} ms {size:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
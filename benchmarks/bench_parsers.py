@@ -0,0 +1,61 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""Throughput (MB/s) of the table extraction engines in `investpy.utils.parsers`.
+
+The recorded `HistoricalDataAjax` response from `tests/fixtures` is replicated until it
+contains as many rows as the biggest response Investing.com sends (~5000 daily rows).
+
+    $ python -m benchmarks.bench_parsers
+
+"""
+
+import os
+import re
+import timeit
+
+from lxml.html import fromstring
+
+from investpy.utils.parsers import PARSER_ENGINES, historical_rows
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def build_response(n_rows):
+    with open(os.path.join(FIXTURES, "historical_data.html"), encoding="utf-8") as f:
+        html = f.read()
+
+    head, body = html.split("<tbody>", 1)
+    body, tail = body.split("</tbody>", 1)
+    rows = re.findall(r"<tr>.*?</tr>", body, flags=re.S)
+
+    body = "\n".join(rows[i % len(rows)] for i in range(n_rows))
+
+    return head + "<tbody>" + body + "</tbody>" + tail
+
+
+def legacy_rows(html):
+    # Per-row and per-cell XPath queries, as done before `investpy.utils.parsers`
+    result = list()
+    for elements_ in fromstring(html).xpath(".//table[@id='curr_table']/tbody/tr"):
+        result.append([nested_.get("data-real-value") for nested_ in elements_.xpath(".//td")])
+    return result
+
+
+def main(n_rows=5000, repeat=5, number=10):
+    html = build_response(n_rows)
+    size = len(html.encode("utf-8")) / 1e6
+
+    engines = {"legacy": legacy_rows}
+    for engine in PARSER_ENGINES:
+        engines[engine] = lambda html, engine=engine: historical_rows(html, engine=engine)
+
+    print(f"response: {n_rows} rows, {size:.2f} MB")
+
+    for name, func in engines.items():
+        best = min(timeit.repeat(lambda: func(html), repeat=repeat, number=number)) / number
+        print(f"{name:>8}: {best * 1e3:8.2f} ms/response {size / best:8.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""Refresh throughput of `investpy.utils.poller.Poller` against a local stand-in server.
+
+A local threaded HTTP server answers every `HistoricalDataAjax` request with the recorded
+response from `tests/fixtures` after a fixed delay (simulating the network latency), and
+the refreshes per second of a watchlist are measured for several `max_workers` values.
+
+    $ python -m benchmarks.bench_poller
+
+"""
+
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from investpy.utils import historical
+from investpy.utils.historical import SCHEMAS
+from investpy.utils.poller import Poller
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def serve(latency):
+    with open(os.path.join(FIXTURES, "historical_data.html"), "rb") as f:
+        body = f.read()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def main(n_instruments=2000, latency=0.02, workers=(1, 8, 32)):
+    server = serve(latency)
+    historical.HISTORICAL_DATA_URL = (
+        f"http://127.0.0.1:{server.server_address[1]}/instruments/HistoricalDataAjax"
+    )
+
+    print(f"instruments: {n_instruments}, server latency: {latency * 1e3:.0f} ms")
+
+    for max_workers in workers:
+        poller = Poller(cadence=60, max_workers=max_workers)
+        for i in range(n_instruments if max_workers > 1 else n_instruments // 10):
+            poller.add_instrument(i, SCHEMAS["stock"], i, "BBVA")
+
+        for name in ["first", "refresh"]:
+            start = time.perf_counter()
+            poller.poll(force=True)
+            elapsed = time.perf_counter() - start
+            print(
+                f"workers {max_workers:>3} {name:>8}:"
+                f" {len(poller.instruments) / elapsed:8.1f} refreshes/s"
+            )
+
+        poller.stop()
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
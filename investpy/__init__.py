@@ -11,6 +11,7 @@ from .bonds import (
     get_bond_recent_data,
     get_bonds,
     get_bonds_dict,
+    get_bonds_information,
     get_bonds_list,
     get_bonds_overview,
     search_bonds,
@@ -22,6 +23,7 @@ from .certificates import (
     get_certificate_recent_data,
     get_certificates,
     get_certificates_dict,
+    get_certificates_information,
     get_certificates_list,
     get_certificates_overview,
     search_certificates,
@@ -29,6 +31,7 @@ from .certificates import (
 from .commodities import (
     get_commodities,
     get_commodities_dict,
+    get_commodities_information,
     get_commodities_list,
     get_commodities_overview,
     get_commodity_groups,
@@ -43,6 +46,7 @@ from .crypto import (
     get_crypto_recent_data,
     get_cryptos,
     get_cryptos_dict,
+    get_cryptos_information,
     get_cryptos_list,
     get_cryptos_overview,
     search_cryptos,
@@ -54,6 +58,7 @@ from .currency_crosses import (
     get_currency_cross_recent_data,
     get_currency_crosses,
     get_currency_crosses_dict,
+    get_currency_crosses_information,
     get_currency_crosses_list,
     get_currency_crosses_overview,
     search_currency_crosses,
@@ -65,6 +70,7 @@ from .etfs import (
     get_etf_recent_data,
     get_etfs,
     get_etfs_dict,
+    get_etfs_information,
     get_etfs_list,
     get_etfs_overview,
     search_etfs,
@@ -76,6 +82,7 @@ from .funds import (
     get_fund_recent_data,
     get_funds,
     get_funds_dict,
+    get_funds_information,
     get_funds_list,
     get_funds_overview,
     search_funds,
@@ -87,12 +94,14 @@ from .indices import (
     get_index_recent_data,
     get_indices,
     get_indices_dict,
+    get_indices_information,
     get_indices_list,
     get_indices_overview,
     search_indices,
 )
 from .news import economic_calendar
-from .search import search_quotes
+from .panel import build_panel
+from .search import iter_search_quotes, retrieve_all, search_quotes
 from .stocks import (
     get_stock_company_profile,
     get_stock_countries,
@@ -102,7 +111,11 @@ from .stocks import (
     get_stock_information,
     get_stock_recent_data,
     get_stocks,
+    get_stocks_company_profile,
     get_stocks_dict,
+    get_stocks_dividends,
+    get_stocks_financial_summary,
+    get_stocks_information,
     get_stocks_list,
     get_stocks_overview,
     search_stocks,
@@ -3,12 +3,10 @@
 
 import json
 import re
-from datetime import date, datetime, timedelta
-from random import randint
+from datetime import date, datetime
 
 import pandas as pd
 import pkg_resources
-import pytz
 import requests
 from lxml.html import fromstring
 from unidecode import unidecode
@@ -19,8 +17,15 @@ from .data.bonds_data import (
     bonds_as_dict,
     bonds_as_list,
 )
-from .utils.data import Data
 from .utils.extra import random_user_agent
+from .utils.historical import SCHEMAS, retrieve_historical_data, retrieve_recent_data
+from .utils.information import (
+    INFORMATION,
+    check_workers,
+    fetch_page,
+    retrieve_information,
+)
+from .utils.parsers import overview_cells
 
 
 def get_bonds(country=None):
@@ -146,7 +151,15 @@ def get_bond_countries():
     return bond_countries_as_list()
 
 
-def get_bond_recent_data(bond, as_json=False, order="ascending", interval="Daily"):
+def get_bond_recent_data(
+    bond,
+    as_json=False,
+    order="ascending",
+    interval="Daily",
+    dtypes=None,
+    fp=None,
+    compact=False,
+):
     """
     This function retrieves recent historical data from the introduced bond from Investing.com. So on, the recent data
     of the introduced bond will be retrieved and returned as a :obj:`pandas.DataFrame` if the parameters are valid and
@@ -161,6 +174,17 @@ def get_bond_recent_data(bond, as_json=False, order="ascending", interval="Daily
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are returned as `float32`, the volume as `int32` (if it fits, `int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, which at least halves the memory usage;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None moves the
+            column to `df.attrs`. Ignored if `as_json` is True, see `investpy.utils.historical.format_data`.
+        fp (:obj:`file`, optional):
+            text file-like object to write the :obj:`json` to instead of returning it, in which case None is returned.
+            Just if `as_json` is True, see `investpy.utils.historical.write_json`.
+        compact (:obj:`bool`, optional):
+            whether to serialize the :obj:`json` with no whitespace (using orjson if installed) or not, which keeps
+            the same values and keys. Just if `as_json` is True, see `investpy.utils.historical.write_json`.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -223,6 +247,23 @@ def get_bond_recent_data(bond, as_json=False, order="ascending", interval="Daily
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
+    if dtypes is not None and dtypes != "compact" and not isinstance(dtypes, dict):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes."
+        )
+
+    if not isinstance(compact, bool):
+        raise ValueError(
+            "ERR#0160: compact argument can just be True or False, bool type."
+        )
+
+    if fp is not None and (as_json is False or not hasattr(fp, "write")):
+        raise ValueError(
+            "ERR#0161: fp argument can just be None or a file-like object, and just"
+            " if as_json is True."
+        )
+
     if order not in ["ascending", "asc", "descending", "desc"]:
         raise ValueError(
             "ERR#0003: order argument can just be ascending (asc) or descending (desc),"
@@ -277,96 +318,31 @@ def get_bond_recent_data(bond, as_json=False, order="ascending", interval="Daily
         (bonds["name"].apply(unidecode).str.lower() == bond).idxmax(), "full_name"
     ]
 
-    header = full_name + " Bond Yield Historical Data"
-
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval.capitalize(),
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data",
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
-        )
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == "No results found":
-                raise IndexError("ERR#0069: bond information unavailable or not found.")
-
-            info = []
-
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get("data-real-value"))
-
-            bond_date = datetime.strptime(
-                str(
-                    datetime.fromtimestamp(int(info[0]), tz=pytz.timezone("GMT")).date()
-                ),
-                "%Y-%m-%d",
-            )
-
-            bond_close = float(info[1].replace(",", ""))
-            bond_open = float(info[2].replace(",", ""))
-            bond_high = float(info[3].replace(",", ""))
-            bond_low = float(info[4].replace(",", ""))
-
-            result.insert(
-                len(result),
-                Data(
-                    bond_date,
-                    bond_open,
-                    bond_high,
-                    bond_low,
-                    bond_close,
-                    None,
-                    None,
-                    None,
-                ),
-            )
-
-        if order in ["ascending", "asc"]:
-            result = result[::-1]
-        elif order in ["descending", "desc"]:
-            result = result
-
-        if as_json is True:
-            json_ = {"name": name, "recent": [value.bond_as_json() for value in result]}
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.bond_to_dict() for value in result])
-            df.set_index("Date", inplace=True)
-
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(
+        SCHEMAS["bond"],
+        id_=id_,
+        name=name,
+        header=full_name,
+        as_json=as_json,
+        order=order,
+        dtypes=dtypes,
+        fp=fp,
+        compact=compact,
+        interval=interval,
+    )
 
 
 def get_bond_historical_data(
-    bond, from_date, to_date, as_json=False, order="ascending", interval="Daily"
+    bond,
+    from_date,
+    to_date,
+    as_json=False,
+    order="ascending",
+    interval="Daily",
+    resample=False,
+    dtypes=None,
+    fp=None,
+    compact=False,
 ):
     """
     This function retrieves historical data from the introduced bond from Investing.com. So on, the historical data
@@ -385,6 +361,21 @@ def get_bond_historical_data(
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        resample (:obj:`bool`, optional):
+            if True and `interval` is either `Weekly` or `Monthly`, the data is resampled locally from the daily data
+            of the same date range if it was already retrieved during the current process, instead of retrieving it
+            again from Investing.com, see `investpy.utils.historical.resample_columns`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are returned as `float32`, the volume as `int32` (if it fits, `int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, which at least halves the memory usage;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None moves the
+            column to `df.attrs`. Ignored if `as_json` is True, see `investpy.utils.historical.format_data`.
+        fp (:obj:`file`, optional):
+            text file-like object to write the :obj:`json` to instead of returning it, in which case None is returned.
+            Just if `as_json` is True, see `investpy.utils.historical.write_json`.
+        compact (:obj:`bool`, optional):
+            whether to serialize the :obj:`json` with no whitespace (using orjson if installed) or not, which keeps
+            the same values and keys. Just if `as_json` is True, see `investpy.utils.historical.write_json`.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -447,6 +438,28 @@ def get_bond_historical_data(
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
+    if dtypes is not None and dtypes != "compact" and not isinstance(dtypes, dict):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes."
+        )
+
+    if not isinstance(compact, bool):
+        raise ValueError(
+            "ERR#0160: compact argument can just be True or False, bool type."
+        )
+
+    if fp is not None and (as_json is False or not hasattr(fp, "write")):
+        raise ValueError(
+            "ERR#0161: fp argument can just be None or a file-like object, and just"
+            " if as_json is True."
+        )
+
+    if not isinstance(resample, bool):
+        raise ValueError(
+            "ERR#0141: resample argument can just be True or False, bool type."
+        )
+
     if order not in ["ascending", "asc", "descending", "desc"]:
         raise ValueError(
             "ERR#0003: order argument can just be ascending (asc) or descending (desc),"
@@ -496,43 +509,6 @@ def get_bond_historical_data(
             " 'dd/mm/yyyy'."
         )
 
-    date_interval = {
-        "intervals": [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                "start": start_date.strftime("%m/%d/%Y"),
-                "end": start_date.replace(year=start_date.year + 19).strftime(
-                    "%m/%d/%Y"
-                ),
-            }
-
-            date_interval["intervals"].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19) + timedelta(
-                days=1
-            )
-        else:
-            obj = {
-                "start": start_date.strftime("%m/%d/%Y"),
-                "end": end_date.strftime("%m/%d/%Y"),
-            }
-
-            date_interval["intervals"].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval["intervals"])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = "investpy"
     resource_path = "/".join(("resources", "bonds.csv"))
     if pkg_resources.resource_exists(resource_package, resource_path):
@@ -561,127 +537,21 @@ def get_bond_historical_data(
         (bonds["name"].apply(unidecode).str.lower() == bond).idxmax(), "full_name"
     ]
 
-    final = list()
-
-    header = full_name + " Bond Yield Historical Data"
-
-    for index in range(len(date_interval["intervals"])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval["intervals"][index]["start"],
-            "end_date": date_interval["intervals"][index]["end"],
-            "interval_sec": interval.capitalize(),
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data",
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError(
-                "ERR#0015: error " + str(req.status_code) + ", try again later."
-            )
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == "No results found":
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError(
-                            "ERR#0069: bond information unavailable or not found."
-                        )
-                else:
-                    data_flag = True
-
-                if data_flag is True:
-                    info = []
-
-                    for nested_ in elements_.xpath(".//td"):
-                        info.append(nested_.get("data-real-value"))
-
-                    bond_date = datetime.strptime(
-                        str(
-                            datetime.fromtimestamp(
-                                int(info[0]), tz=pytz.timezone("GMT")
-                            ).date()
-                        ),
-                        "%Y-%m-%d",
-                    )
-
-                    bond_close = float(info[1].replace(",", ""))
-                    bond_open = float(info[2].replace(",", ""))
-                    bond_high = float(info[3].replace(",", ""))
-                    bond_low = float(info[4].replace(",", ""))
-
-                    result.insert(
-                        len(result),
-                        Data(
-                            bond_date,
-                            bond_open,
-                            bond_high,
-                            bond_low,
-                            bond_close,
-                            None,
-                            None,
-                            None,
-                        ),
-                    )
-
-            if data_flag is True:
-                if order in ["ascending", "asc"]:
-                    result = result[::-1]
-                elif order in ["descending", "desc"]:
-                    result = result
-
-                if as_json is True:
-                    json_list = [value.bond_as_json() for value in result]
-
-                    final.append(json_list)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records(
-                        [value.bond_to_dict() for value in result]
-                    )
-                    df.set_index("Date", inplace=True)
-
-                    final.append(df)
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if order in ["descending", "desc"]:
-        final.reverse()
-
-    if as_json is True:
-        json_ = {
-            "name": name,
-            "historical": [value for json_list in final for value in json_list],
-        }
-        return json.dumps(json_, sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return retrieve_historical_data(
+        SCHEMAS["bond"],
+        id_=id_,
+        name=name,
+        header=full_name,
+        from_date=start_date,
+        to_date=end_date,
+        as_json=as_json,
+        order=order,
+        dtypes=dtypes,
+        fp=fp,
+        compact=compact,
+        interval=interval,
+        resample=resample,
+    )
 
 
 def get_bond_information(bond, as_json=False):
@@ -765,24 +635,104 @@ def get_bond_information(bond, as_json=False):
         (bonds["name"].apply(unidecode).str.lower() == bond).idxmax(), "tag"
     ]
 
-    url = "https://www.investing.com/rates-bonds/" + tag
+    result = _parse_bond_information(fetch_page(tag, "rates-bonds"), name)
 
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    if as_json is True:
+        json_ = result.iloc[0].to_dict()
+        return json_
+    elif as_json is False:
+        return result
 
-    req = requests.get(url, headers=head)
 
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
+def get_bonds_information(
+    bonds, as_json=False, max_workers=8, processes=None, numeric=True
+):
+    """
+    This function retrieves the information of several bonds at once, as retrieved by `get_bond_information` for
+    every bond, so that the bonds are resolved against the static data file just once, their information pages are
+    requested concurrently through the session shared by every request sent to Investing.com and then parsed,
+    optionally in a pool of processes. Note that the bonds that could not be found, retrieved or parsed do not
+    raise any error, but their error message is reported in the `Error` column instead.
+
+    Args:
+        bonds (:obj:`list`): names of the bonds to retrieve the information from.
+        as_json (:obj:`bool`, optional):
+            optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        max_workers (:obj:`int`, optional): maximum number of information pages requested concurrently.
+        processes (:obj:`int`, optional):
+            number of processes used to parse the information pages, which is CPU bound, if None they are
+            parsed in the current process.
+        numeric (:obj:`bool`, optional):
+            whether to convert the information fields into numeric columns or not, so that the suffixes (`K`, `M`,
+            `B`, `T`) and the percentages are applied and the ranges are split into their low and high values, see
+            `investpy.utils.information.normalize_information`; if False, the fields are kept as retrieved.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`list` - bonds_information:
+            The resulting :obj:`pandas.DataFrame` contains a row per introduced bond, in the same order,
+            with the information fields of `get_bond_information` plus the `Error` column, which is null for
+            the bonds whose information was successfully retrieved; it can also be returned as a
+            :obj:`list` of :obj:`dict`, if argument `as_json=True`.
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or errored.
+
+    Examples:
+        >>> data = investpy.get_bonds_information(bonds=['spain 10y', 'germany 10y'])
+        >>> data[data['Error'].isnull()]
+
+    """
+
+    if not isinstance(bonds, (list, tuple)) or len(bonds) == 0:
+        raise ValueError(
+            "ERR#0151: bonds argument can just be a non empty list of bond names."
         )
 
-    root_ = fromstring(req.text)
+    if not isinstance(as_json, bool):
+        raise ValueError(
+            "ERR#0002: as_json argument can just be True or False, bool type."
+        )
+
+    check_workers(max_workers, processes)
+
+    if not isinstance(numeric, bool):
+        raise ValueError(
+            "ERR#0153: numeric argument can just be True or False, bool type."
+        )
+
+    result = retrieve_information(
+        INFORMATION["bond"],
+        bonds,
+        _parse_bond_information,
+        max_workers=max_workers,
+        processes=processes,
+        numeric=numeric,
+    )
+
+    if as_json is True:
+        return json.loads(result.to_json(orient="records"))
+    elif as_json is False:
+        return result
+
+
+def _parse_bond_information(html, name):
+    """
+    This function parses the information page of a bond retrieved from Investing.com, so that it can be
+    used by both `get_bond_information` and `get_bonds_information`.
+
+    Args:
+        html (:obj:`str`): content of the information page of the bond.
+        name (:obj:`str`): name of the bond, as shown in the resulting information.
+
+    Returns:
+        :obj:`pandas.DataFrame` - bond_information: information of the bond, as a single row.
+
+    Raises:
+        RuntimeError: raised if scraping process failed while running.
+
+    """
+
+    root_ = fromstring(html)
     path_ = root_.xpath("//div[contains(@class, 'overviewDataTable')]/div")
 
     result = pd.DataFrame(
@@ -868,11 +818,7 @@ def get_bond_information(bond, as_json=False):
 
         result.replace({"N/A": None}, inplace=True)
 
-        if as_json is True:
-            json_ = result.iloc[0].to_dict()
-            return json_
-        elif as_json is False:
-            return result
+        return result
     else:
         raise RuntimeError("ERR#0004: data retrieval error while scraping.")
 
@@ -972,30 +918,19 @@ def get_bonds_overview(country, as_json=False):
 
     if len(table) > 0:
         for row in table:
-            id_ = row.get("id").replace("pair_", "")
-            country_check = (
-                row.xpath(".//td[@class='flag']/span")[0].get("title").lower()
-            )
-
-            name = (
-                row.xpath(".//td[contains(@class, 'elp')]/a")[0].text_content().strip()
-            )
-
-            pid = "pid-" + id_
-
-            last = row.xpath(".//td[@class='" + pid + "-last']")[0].text_content()
-            last_close = row.xpath(".//td[@class='" + pid + "-last_close']")[
-                0
-            ].text_content()
-            high = row.xpath(".//td[@class='" + pid + "-high']")[0].text_content()
-            low = row.xpath(".//td[@class='" + pid + "-low']")[0].text_content()
-
-            pc = row.xpath(".//td[contains(@class, '" + pid + "-pc')]")[
-                0
-            ].text_content()
-            pcp = row.xpath(".//td[contains(@class, '" + pid + "-pcp')]")[
-                0
-            ].text_content()
+            cells = overview_cells(row)
+
+            country_check = cells["flag"].find("span").get("title").lower()
+
+            name = cells["elp"].find("a").text_content().strip()
+
+            last = cells["last"].text_content()
+            last_close = cells["last_close"].text_content()
+            high = cells["high"].text_content()
+            low = cells["low"].text_content()
+
+            pc = cells["pc"].text_content()
+            pcp = cells["pcp"].text_content()
 
             data = {
                 "country": country_check,
@@ -2,19 +2,24 @@
 # See LICENSE for details.
 
 import json
-from datetime import date, datetime, timedelta
-from random import randint
+from datetime import date, datetime
 
 import pandas as pd
 import pkg_resources
-import pytz
 import requests
 from lxml.html import fromstring
 from unidecode import unidecode
 
 from .data.crypto_data import cryptos_as_df, cryptos_as_dict, cryptos_as_list
-from .utils.data import Data
 from .utils.extra import random_user_agent
+from .utils.historical import SCHEMAS, retrieve_historical_data, retrieve_recent_data
+from .utils.information import (
+    INFORMATION,
+    check_workers,
+    fetch_page,
+    retrieve_information,
+)
+from .utils.parsers import overview_cells
 
 
 def get_cryptos():
@@ -113,7 +118,15 @@ def get_cryptos_dict(columns=None, as_json=False):
     return cryptos_as_dict(columns=columns, as_json=as_json)
 
 
-def get_crypto_recent_data(crypto, as_json=False, order="ascending", interval="Daily"):
+def get_crypto_recent_data(
+    crypto,
+    as_json=False,
+    order="ascending",
+    interval="Daily",
+    dtypes=None,
+    fp=None,
+    compact=False,
+):
     """
     This function retrieves recent historical data from the introduced crypto from Investing.com. So on, the recent data
     of the introduced crypto will be retrieved and returned as a :obj:`pandas.DataFrame` if the parameters are valid
@@ -128,6 +141,17 @@ def get_crypto_recent_data(crypto, as_json=False, order="ascending", interval="D
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are returned as `float32`, the volume as `int32` (if it fits, `int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, which at least halves the memory usage;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None moves the
+            column to `df.attrs`. Ignored if `as_json` is True, see `investpy.utils.historical.format_data`.
+        fp (:obj:`file`, optional):
+            text file-like object to write the :obj:`json` to instead of returning it, in which case None is returned.
+            Just if `as_json` is True, see `investpy.utils.historical.write_json`.
+        compact (:obj:`bool`, optional):
+            whether to serialize the :obj:`json` with no whitespace (using orjson if installed) or not, which keeps
+            the same values and keys. Just if `as_json` is True, see `investpy.utils.historical.write_json`.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -192,6 +216,23 @@ def get_crypto_recent_data(crypto, as_json=False, order="ascending", interval="D
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
+    if dtypes is not None and dtypes != "compact" and not isinstance(dtypes, dict):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes."
+        )
+
+    if not isinstance(compact, bool):
+        raise ValueError(
+            "ERR#0160: compact argument can just be True or False, bool type."
+        )
+
+    if fp is not None and (as_json is False or not hasattr(fp, "write")):
+        raise ValueError(
+            "ERR#0161: fp argument can just be None or a file-like object, and just"
+            " if as_json is True."
+        )
+
     if order not in ["ascending", "asc", "descending", "desc"]:
         raise ValueError(
             "ERR#0003: order argument can just be ascending (asc) or descending (desc),"
@@ -259,102 +300,32 @@ def get_crypto_recent_data(crypto, as_json=False, order="ascending", interval="D
         (cryptos["name"].apply(unidecode).str.lower() == crypto).idxmax(), "currency"
     ]
 
-    header = crypto_name + " Historical Data"
-
-    params = {
-        "curr_id": crypto_id,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval.capitalize(),
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data",
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
-        )
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == "No results found":
-                raise IndexError(
-                    "ERR#0087: crypto information unavailable or not found."
-                )
-
-            info = []
-
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get("data-real-value"))
-
-            crypto_date = datetime.strptime(
-                str(
-                    datetime.fromtimestamp(int(info[0]), tz=pytz.timezone("GMT")).date()
-                ),
-                "%Y-%m-%d",
-            )
-
-            crypto_close = float(info[1].replace(",", ""))
-            crypto_open = float(info[2].replace(",", ""))
-            crypto_high = float(info[3].replace(",", ""))
-            crypto_low = float(info[4].replace(",", ""))
-
-            crypto_volume = int(info[5])
-
-            result.insert(
-                len(result),
-                Data(
-                    crypto_date,
-                    crypto_open,
-                    crypto_high,
-                    crypto_low,
-                    crypto_close,
-                    crypto_volume,
-                    crypto_currency,
-                    None,
-                ),
-            )
-
-        if order in ["ascending", "asc"]:
-            result = result[::-1]
-        elif order in ["descending", "desc"]:
-            result = result
-
-        if as_json is True:
-            json_ = {
-                "name": crypto_name,
-                "recent": [value.crypto_as_json() for value in result],
-            }
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.crypto_to_dict() for value in result])
-            df.set_index("Date", inplace=True)
-
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(
+        SCHEMAS["crypto"],
+        id_=crypto_id,
+        name=crypto_name,
+        header=crypto_name,
+        currency=crypto_currency,
+        as_json=as_json,
+        order=order,
+        dtypes=dtypes,
+        fp=fp,
+        compact=compact,
+        interval=interval,
+    )
 
 
 def get_crypto_historical_data(
-    crypto, from_date, to_date, as_json=False, order="ascending", interval="Daily"
+    crypto,
+    from_date,
+    to_date,
+    as_json=False,
+    order="ascending",
+    interval="Daily",
+    resample=False,
+    dtypes=None,
+    fp=None,
+    compact=False,
 ):
     """
     This function retrieves historical data from the introduced crypto from Investing.com. So on, the historical data
@@ -372,6 +343,21 @@ def get_crypto_historical_data(
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        resample (:obj:`bool`, optional):
+            if True and `interval` is either `Weekly` or `Monthly`, the data is resampled locally from the daily data
+            of the same date range if it was already retrieved during the current process, instead of retrieving it
+            again from Investing.com, see `investpy.utils.historical.resample_columns`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are returned as `float32`, the volume as `int32` (if it fits, `int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, which at least halves the memory usage;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None moves the
+            column to `df.attrs`. Ignored if `as_json` is True, see `investpy.utils.historical.format_data`.
+        fp (:obj:`file`, optional):
+            text file-like object to write the :obj:`json` to instead of returning it, in which case None is returned.
+            Just if `as_json` is True, see `investpy.utils.historical.write_json`.
+        compact (:obj:`bool`, optional):
+            whether to serialize the :obj:`json` with no whitespace (using orjson if installed) or not, which keeps
+            the same values and keys. Just if `as_json` is True, see `investpy.utils.historical.write_json`.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -436,6 +422,28 @@ def get_crypto_historical_data(
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
+    if dtypes is not None and dtypes != "compact" and not isinstance(dtypes, dict):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes."
+        )
+
+    if not isinstance(compact, bool):
+        raise ValueError(
+            "ERR#0160: compact argument can just be True or False, bool type."
+        )
+
+    if fp is not None and (as_json is False or not hasattr(fp, "write")):
+        raise ValueError(
+            "ERR#0161: fp argument can just be None or a file-like object, and just"
+            " if as_json is True."
+        )
+
+    if not isinstance(resample, bool):
+        raise ValueError(
+            "ERR#0141: resample argument can just be True or False, bool type."
+        )
+
     if order not in ["ascending", "asc", "descending", "desc"]:
         raise ValueError(
             "ERR#0003: order argument can just be ascending (asc) or descending (desc),"
@@ -485,43 +493,6 @@ def get_crypto_historical_data(
             " 'dd/mm/yyyy'."
         )
 
-    date_interval = {
-        "intervals": [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                "start": start_date.strftime("%m/%d/%Y"),
-                "end": start_date.replace(year=start_date.year + 19).strftime(
-                    "%m/%d/%Y"
-                ),
-            }
-
-            date_interval["intervals"].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19) + timedelta(
-                days=1
-            )
-        else:
-            obj = {
-                "start": start_date.strftime("%m/%d/%Y"),
-                "end": end_date.strftime("%m/%d/%Y"),
-            }
-
-            date_interval["intervals"].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval["intervals"])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = "investpy"
     resource_path = "/".join(("resources", "cryptos.csv"))
     if pkg_resources.resource_exists(resource_package, resource_path):
@@ -563,129 +534,22 @@ def get_crypto_historical_data(
         (cryptos["name"].apply(unidecode).str.lower() == crypto).idxmax(), "currency"
     ]
 
-    header = crypto_name + " Historical Data"
-
-    final = list()
-
-    for index in range(len(date_interval["intervals"])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": crypto_id,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval["intervals"][index]["start"],
-            "end_date": date_interval["intervals"][index]["end"],
-            "interval_sec": interval.capitalize(),
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data",
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError(
-                "ERR#0015: error " + str(req.status_code) + ", try again later."
-            )
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == "No results found":
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError(
-                            "ERR#0087: crypto information unavailable or not found."
-                        )
-                else:
-                    data_flag = True
-
-                info = []
-
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get("data-real-value"))
-
-                if data_flag is True:
-                    crypto_date = datetime.strptime(
-                        str(
-                            datetime.fromtimestamp(
-                                int(info[0]), tz=pytz.timezone("GMT")
-                            ).date()
-                        ),
-                        "%Y-%m-%d",
-                    )
-
-                    crypto_close = float(info[1].replace(",", ""))
-                    crypto_open = float(info[2].replace(",", ""))
-                    crypto_high = float(info[3].replace(",", ""))
-                    crypto_low = float(info[4].replace(",", ""))
-
-                    crypto_volume = int(info[5] or 0)
-
-                    result.insert(
-                        len(result),
-                        Data(
-                            crypto_date,
-                            crypto_open,
-                            crypto_high,
-                            crypto_low,
-                            crypto_close,
-                            crypto_volume,
-                            crypto_currency,
-                            None,
-                        ),
-                    )
-
-            if data_flag is True:
-                if order in ["ascending", "asc"]:
-                    result = result[::-1]
-                elif order in ["descending", "desc"]:
-                    result = result
-
-                if as_json is True:
-                    json_list = [value.crypto_as_json() for value in result]
-
-                    final.append(json_list)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records(
-                        [value.crypto_to_dict() for value in result]
-                    )
-                    df.set_index("Date", inplace=True)
-
-                    final.append(df)
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if order in ["descending", "desc"]:
-        final.reverse()
-
-    if as_json is True:
-        json_ = {
-            "name": crypto_name,
-            "historical": [value for json_list in final for value in json_list],
-        }
-        return json.dumps(json_, sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return retrieve_historical_data(
+        SCHEMAS["crypto"],
+        id_=crypto_id,
+        name=crypto_name,
+        header=crypto_name,
+        from_date=start_date,
+        to_date=end_date,
+        currency=crypto_currency,
+        as_json=as_json,
+        order=order,
+        dtypes=dtypes,
+        fp=fp,
+        compact=compact,
+        interval=interval,
+        resample=resample,
+    )
 
 
 def get_crypto_information(crypto, as_json=False):
@@ -781,24 +645,107 @@ def get_crypto_information(crypto, as_json=False):
         (cryptos["name"].apply(unidecode).str.lower() == crypto).idxmax(), "tag"
     ]
 
-    url = "https://www.investing.com/crypto/" + tag
+    result = _parse_crypto_information(fetch_page(tag, "crypto"), name, currency)
 
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    if as_json is True:
+        json_ = result.iloc[0].to_dict()
+        return json_
+    elif as_json is False:
+        return result
 
-    req = requests.get(url, headers=head)
 
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
+def get_cryptos_information(
+    cryptos, as_json=False, max_workers=8, processes=None, numeric=True
+):
+    """
+    This function retrieves the information of several crypto currencies at once, as retrieved by
+    `get_crypto_information` for every crypto currency, so that the crypto currencies are resolved against the
+    static data file just once, their information pages are requested concurrently through the session shared by
+    every request sent to Investing.com and then parsed, optionally in a pool of processes. Note that the crypto
+    currencies that could not be found, retrieved or parsed do not raise any error, but their error message is
+    reported in the `Error` column instead.
+
+    Args:
+        cryptos (:obj:`list`): names of the crypto currencies to retrieve the information from.
+        as_json (:obj:`bool`, optional):
+            optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        max_workers (:obj:`int`, optional): maximum number of information pages requested concurrently.
+        processes (:obj:`int`, optional):
+            number of processes used to parse the information pages, which is CPU bound, if None they are
+            parsed in the current process.
+        numeric (:obj:`bool`, optional):
+            whether to convert the information fields into numeric columns or not, so that the suffixes (`K`, `M`,
+            `B`, `T`) and the percentages are applied and the ranges are split into their low and high values, see
+            `investpy.utils.information.normalize_information`; if False, the fields are kept as retrieved.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`list` - cryptos_information:
+            The resulting :obj:`pandas.DataFrame` contains a row per introduced crypto currency, in the same order,
+            with the information fields of `get_crypto_information` plus the `Error` column, which is null for
+            the crypto currencies whose information was successfully retrieved; it can also be returned as a
+            :obj:`list` of :obj:`dict`, if argument `as_json=True`.
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or errored.
+
+    Examples:
+        >>> data = investpy.get_cryptos_information(cryptos=['bitcoin', 'ethereum'])
+        >>> data[data['Error'].isnull()]
+
+    """
+
+    if not isinstance(cryptos, (list, tuple)) or len(cryptos) == 0:
+        raise ValueError(
+            "ERR#0151: cryptos argument can just be a non empty list of crypto"
+            " currency names."
         )
 
-    root_ = fromstring(req.text)
+    if not isinstance(as_json, bool):
+        raise ValueError(
+            "ERR#0002: as_json argument can just be True or False, bool type."
+        )
+
+    check_workers(max_workers, processes)
+
+    if not isinstance(numeric, bool):
+        raise ValueError(
+            "ERR#0153: numeric argument can just be True or False, bool type."
+        )
+
+    result = retrieve_information(
+        INFORMATION["crypto"],
+        cryptos,
+        _parse_crypto_information,
+        max_workers=max_workers,
+        processes=processes,
+        numeric=numeric,
+    )
+
+    if as_json is True:
+        return json.loads(result.to_json(orient="records"))
+    elif as_json is False:
+        return result
+
+
+def _parse_crypto_information(html, name, currency):
+    """
+    This function parses the information page of a crypto currency retrieved from Investing.com, so that it can be
+    used by both `get_crypto_information` and `get_cryptos_information`.
+
+    Args:
+        html (:obj:`str`): content of the information page of the crypto currency.
+        name (:obj:`str`): name of the crypto currency, as shown in the resulting information.
+        currency (:obj:`str`): currency in which the crypto currency is traded.
+
+    Returns:
+        :obj:`pandas.DataFrame` - crypto_information: information of the crypto currency, as a single row.
+
+    Raises:
+        RuntimeError: raised if scraping process failed while running.
+
+    """
+
+    root_ = fromstring(html)
     path_ = root_.xpath("//div[@class='cryptoGlobalData']/div")
 
     result = pd.DataFrame(
@@ -827,11 +774,7 @@ def get_crypto_information(crypto, as_json=False):
 
         result.replace({"N/A": None}, inplace=True)
 
-        if as_json is True:
-            json_ = result.iloc[0].to_dict()
-            return json_
-        elif as_json is False:
-            return result
+        return result
     else:
         raise RuntimeError("ERR#0004: data retrieval error while scraping.")
 
@@ -919,34 +862,30 @@ def get_cryptos_overview(as_json=False, n_results=100):
         flag = True
 
     for row in table:
-        name = (
-            row.xpath(".//td[contains(@class, 'cryptoName')]")[0].text_content().strip()
-        )
-        symbol = row.xpath(".//td[contains(@class, 'symb')]")[0].get("title").strip()
+        cells = overview_cells(row)
+
+        name = cells["cryptoName"].text_content().strip()
+        symbol = cells["symb"].get("title").strip()
 
         # Due to Investing.com parsing error
         if symbol in ["GRV", "GLYPH"]:
             continue
 
-        tag = row.xpath(".//td[contains(@class, 'cryptoName')]/a")
+        tag = cells["cryptoName"].find("a")
 
-        if len(tag) > 0:
+        if tag is not None:
             status = "available"
         else:
             status = "unavailable"
 
-        price = row.xpath(".//td[contains(@class, 'price')]")[0].text_content()
+        price = cells["price"].text_content()
 
-        market_cap = row.xpath(".//td[@class='js-market-cap']")[0].get("data-value")
-        volume24h = row.xpath(".//td[@class='js-24h-volume']")[0].get("data-value")
-        total_volume = row.xpath(".//td[@class='js-total-vol']")[0].text_content()
+        market_cap = cells["js-market-cap"].get("data-value")
+        volume24h = cells["js-24h-volume"].get("data-value")
+        total_volume = cells["js-total-vol"].text_content()
 
-        change24h = row.xpath(".//td[contains(@class, 'js-currency-change-24h')]")[
-            0
-        ].text_content()
-        change7d = row.xpath(".//td[contains(@class, 'js-currency-change-7d')]")[
-            0
-        ].text_content()
+        change24h = cells["js-currency-change-24h"].text_content()
+        change7d = cells["js-currency-change-7d"].text_content()
 
         data = {
             "name": name,
@@ -999,38 +938,30 @@ def get_cryptos_overview(as_json=False, n_results=100):
             )
 
         for row in table:
-            name = (
-                row.xpath(".//td[contains(@class, 'cryptoName')]")[0]
-                .text_content()
-                .strip()
-            )
-            symbol = (
-                row.xpath(".//td[contains(@class, 'symb')]")[0].get("title").strip()
-            )
+            cells = overview_cells(row)
+
+            name = cells["cryptoName"].text_content().strip()
+            symbol = cells["symb"].get("title").strip()
 
             # Due to Investing.com parsing error
             if symbol in ["GRV", "GLYPH"]:
                 continue
 
-            tag = row.xpath(".//td[contains(@class, 'cryptoName')]/a")
+            tag = cells["cryptoName"].find("a")
 
-            if len(tag) > 0:
+            if tag is not None:
                 status = "available"
             else:
                 status = "unavailable"
 
-            price = row.xpath(".//td[contains(@class, 'price')]")[0].text_content()
+            price = cells["price"].text_content()
 
-            market_cap = row.xpath(".//td[@class='js-market-cap']")[0].get("data-value")
-            volume24h = row.xpath(".//td[@class='js-24h-volume']")[0].get("data-value")
-            total_volume = row.xpath(".//td[@class='js-total-vol']")[0].text_content()
+            market_cap = cells["js-market-cap"].get("data-value")
+            volume24h = cells["js-24h-volume"].get("data-value")
+            total_volume = cells["js-total-vol"].text_content()
 
-            change24h = row.xpath(".//td[contains(@class, 'js-currency-change-24h')]")[
-                0
-            ].text_content()
-            change7d = row.xpath(".//td[contains(@class, 'js-currency-change-7d')]")[
-                0
-            ].text_content()
+            change24h = cells["js-currency-change-24h"].text_content()
+            change7d = cells["js-currency-change-7d"].text_content()
 
             data = {
                 "name": name,
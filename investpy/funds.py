@@ -2,12 +2,10 @@
 # See LICENSE for details.
 
 import json
-from datetime import date, datetime, timedelta
-from random import randint
+from datetime import date, datetime
 
 import pandas as pd
 import pkg_resources
-import pytz
 import requests
 from lxml.html import fromstring
 from unidecode import unidecode
@@ -18,8 +16,15 @@ from .data.funds_data import (
     funds_as_dict,
     funds_as_list,
 )
-from .utils.data import Data
 from .utils.extra import random_user_agent
+from .utils.historical import SCHEMAS, retrieve_historical_data, retrieve_recent_data
+from .utils.information import (
+    INFORMATION,
+    check_workers,
+    fetch_page,
+    retrieve_information,
+)
+from .utils.parsers import overview_cells
 
 
 def get_funds(country=None):
@@ -147,7 +152,14 @@ def get_fund_countries():
 
 
 def get_fund_recent_data(
-    fund, country, as_json=False, order="ascending", interval="Daily"
+    fund,
+    country,
+    as_json=False,
+    order="ascending",
+    interval="Daily",
+    dtypes=None,
+    fp=None,
+    compact=False,
 ):
     """
     This function retrieves recent historical data from the introduced `fund` from Investing
@@ -163,6 +175,17 @@ def get_fund_recent_data(
             optional argument to define the order of the retrieved data (`ascending`, `asc` or `descending`, `desc`).
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are returned as `float32`, the volume as `int32` (if it fits, `int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, which at least halves the memory usage;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None moves the
+            column to `df.attrs`. Ignored if `as_json` is True, see `investpy.utils.historical.format_data`.
+        fp (:obj:`file`, optional):
+            text file-like object to write the :obj:`json` to instead of returning it, in which case None is returned.
+            Just if `as_json` is True, see `investpy.utils.historical.write_json`.
+        compact (:obj:`bool`, optional):
+            whether to serialize the :obj:`json` with no whitespace (using orjson if installed) or not, which keeps
+            the same values and keys. Just if `as_json` is True, see `investpy.utils.historical.write_json`.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -232,6 +255,23 @@ def get_fund_recent_data(
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
+    if dtypes is not None and dtypes != "compact" and not isinstance(dtypes, dict):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes."
+        )
+
+    if not isinstance(compact, bool):
+        raise ValueError(
+            "ERR#0160: compact argument can just be True or False, bool type."
+        )
+
+    if fp is not None and (as_json is False or not hasattr(fp, "write")):
+        raise ValueError(
+            "ERR#0161: fp argument can just be None or a file-like object, and just"
+            " if as_json is True."
+        )
+
     if order not in ["ascending", "asc", "descending", "desc"]:
         raise ValueError(
             "ERR#0003: order argument can just be ascending (asc) or descending (desc),"
@@ -298,91 +338,19 @@ def get_fund_recent_data(
         (funds["name"].apply(unidecode).str.lower() == fund).idxmax(), "currency"
     ]
 
-    header = symbol + " Historical Data"
-
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval.capitalize(),
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data",
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
-        )
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == "No results found":
-                raise IndexError("ERR#0008: fund information unavailable or not found.")
-
-            info = []
-
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get("data-real-value"))
-
-            fund_date = datetime.strptime(
-                str(
-                    datetime.fromtimestamp(int(info[0]), tz=pytz.timezone("GMT")).date()
-                ),
-                "%Y-%m-%d",
-            )
-
-            fund_close = float(info[1].replace(",", ""))
-            fund_open = float(info[2].replace(",", ""))
-            fund_high = float(info[3].replace(",", ""))
-            fund_low = float(info[4].replace(",", ""))
-
-            result.insert(
-                len(result),
-                Data(
-                    fund_date,
-                    fund_open,
-                    fund_high,
-                    fund_low,
-                    fund_close,
-                    None,
-                    fund_currency,
-                    None,
-                ),
-            )
-
-        if order in ["ascending", "asc"]:
-            result = result[::-1]
-        elif order in ["descending", "desc"]:
-            result = result
-
-        if as_json is True:
-            json_ = {"name": name, "recent": [value.fund_as_json() for value in result]}
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.fund_to_dict() for value in result])
-            df.set_index("Date", inplace=True)
-
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(
+        SCHEMAS["fund"],
+        id_=id_,
+        name=name,
+        header=symbol,
+        currency=fund_currency,
+        as_json=as_json,
+        order=order,
+        dtypes=dtypes,
+        fp=fp,
+        compact=compact,
+        interval=interval,
+    )
 
 
 def get_fund_historical_data(
@@ -393,6 +361,10 @@ def get_fund_historical_data(
     as_json=False,
     order="ascending",
     interval="Daily",
+    resample=False,
+    dtypes=None,
+    fp=None,
+    compact=False,
 ):
     """
     This function retrieves historical data from the introduced `fund` from Investing
@@ -410,6 +382,21 @@ def get_fund_historical_data(
             optional argument to define the order of the retrieved data (`ascending`, `asc` or `descending`, `desc`).
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        resample (:obj:`bool`, optional):
+            if True and `interval` is either `Weekly` or `Monthly`, the data is resampled locally from the daily data
+            of the same date range if it was already retrieved during the current process, instead of retrieving it
+            again from Investing.com, see `investpy.utils.historical.resample_columns`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are returned as `float32`, the volume as `int32` (if it fits, `int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, which at least halves the memory usage;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None moves the
+            column to `df.attrs`. Ignored if `as_json` is True, see `investpy.utils.historical.format_data`.
+        fp (:obj:`file`, optional):
+            text file-like object to write the :obj:`json` to instead of returning it, in which case None is returned.
+            Just if `as_json` is True, see `investpy.utils.historical.write_json`.
+        compact (:obj:`bool`, optional):
+            whether to serialize the :obj:`json` with no whitespace (using orjson if installed) or not, which keeps
+            the same values and keys. Just if `as_json` is True, see `investpy.utils.historical.write_json`.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -479,6 +466,28 @@ def get_fund_historical_data(
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
+    if dtypes is not None and dtypes != "compact" and not isinstance(dtypes, dict):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes."
+        )
+
+    if not isinstance(compact, bool):
+        raise ValueError(
+            "ERR#0160: compact argument can just be True or False, bool type."
+        )
+
+    if fp is not None and (as_json is False or not hasattr(fp, "write")):
+        raise ValueError(
+            "ERR#0161: fp argument can just be None or a file-like object, and just"
+            " if as_json is True."
+        )
+
+    if not isinstance(resample, bool):
+        raise ValueError(
+            "ERR#0141: resample argument can just be True or False, bool type."
+        )
+
     if order not in ["ascending", "asc", "descending", "desc"]:
         raise ValueError(
             "ERR#0003: order argument can just be ascending (asc) or descending (desc),"
@@ -528,43 +537,6 @@ def get_fund_historical_data(
             " 'dd/mm/yyyy'."
         )
 
-    date_interval = {
-        "intervals": [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                "start": start_date.strftime("%m/%d/%Y"),
-                "end": start_date.replace(year=start_date.year + 19).strftime(
-                    "%m/%d/%Y"
-                ),
-            }
-
-            date_interval["intervals"].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19) + timedelta(
-                days=1
-            )
-        else:
-            obj = {
-                "start": start_date.strftime("%m/%d/%Y"),
-                "end": end_date.strftime("%m/%d/%Y"),
-            }
-
-            date_interval["intervals"].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval["intervals"])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = "investpy"
     resource_path = "/".join(("resources", "funds.csv"))
     if pkg_resources.resource_exists(resource_package, resource_path):
@@ -605,126 +577,22 @@ def get_fund_historical_data(
         (funds["name"].apply(unidecode).str.lower() == fund).idxmax(), "currency"
     ]
 
-    final = list()
-
-    header = symbol + " Historical Data"
-
-    for index in range(len(date_interval["intervals"])):
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval["intervals"][index]["start"],
-            "end_date": date_interval["intervals"][index]["end"],
-            "interval_sec": interval.capitalize(),
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data",
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError(
-                "ERR#0015: error " + str(req.status_code) + ", try again later."
-            )
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == "No results found":
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError(
-                            "ERR#0008: fund information unavailable or not found."
-                        )
-                else:
-                    data_flag = True
-
-                info = []
-
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get("data-real-value"))
-
-                if data_flag is True:
-                    fund_date = datetime.strptime(
-                        str(
-                            datetime.fromtimestamp(
-                                int(info[0]), tz=pytz.timezone("GMT")
-                            ).date()
-                        ),
-                        "%Y-%m-%d",
-                    )
-
-                    fund_close = float(info[1].replace(",", ""))
-                    fund_open = float(info[2].replace(",", ""))
-                    fund_high = float(info[3].replace(",", ""))
-                    fund_low = float(info[4].replace(",", ""))
-
-                    result.insert(
-                        len(result),
-                        Data(
-                            fund_date,
-                            fund_open,
-                            fund_high,
-                            fund_low,
-                            fund_close,
-                            None,
-                            fund_currency,
-                            None,
-                        ),
-                    )
-
-            if data_flag is True:
-                if order in ["ascending", "asc"]:
-                    result = result[::-1]
-                elif order in ["descending", "desc"]:
-                    result = result
-
-                if as_json is True:
-                    json_list = [value.fund_as_json() for value in result]
-
-                    final.append(json_list)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records(
-                        [value.fund_to_dict() for value in result]
-                    )
-                    df.set_index("Date", inplace=True)
-
-                    final.append(df)
-
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if order in ["descending", "desc"]:
-        final.reverse()
-
-    if as_json is True:
-        json_ = {
-            "name": name,
-            "historical": [value for json_list in final for value in json_list],
-        }
-        return json.dumps(json_, sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return retrieve_historical_data(
+        SCHEMAS["fund"],
+        id_=id_,
+        name=name,
+        header=symbol,
+        from_date=start_date,
+        to_date=end_date,
+        currency=fund_currency,
+        as_json=as_json,
+        order=order,
+        dtypes=dtypes,
+        fp=fp,
+        compact=compact,
+        interval=interval,
+        resample=resample,
+    )
 
 
 def get_fund_information(fund, country, as_json=False):
@@ -820,24 +688,111 @@ def get_fund_information(fund, country, as_json=False):
         (funds["name"].apply(unidecode).str.lower() == fund).idxmax(), "tag"
     ]
 
-    url = "https://www.investing.com/funds/" + tag
+    result = _parse_fund_information(fetch_page(tag, "funds"), fund)
 
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    if as_json is True:
+        json_ = result.iloc[0].to_dict()
+        return json_
+    elif as_json is False:
+        return result
 
-    req = requests.get(url, headers=head)
 
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
+def get_funds_information(
+    funds, country=None, as_json=False, max_workers=8, processes=None, numeric=True
+):
+    """
+    This function retrieves the information of several funds at once, as retrieved by `get_fund_information` for
+    every fund, so that the funds are resolved against the static data file just once, their information pages are
+    requested concurrently through the session shared by every request sent to Investing.com and then parsed,
+    optionally in a pool of processes. Note that the funds that could not be found, retrieved or parsed do not
+    raise any error, but their error message is reported in the `Error` column instead.
+
+    Args:
+        funds (:obj:`list`):
+            names of the funds to retrieve the information from, or tuples of name and
+            country, so that funds from different countries can be introduced together.
+        country (:obj:`str`, optional): name of the country of the funds introduced with no country.
+        as_json (:obj:`bool`, optional):
+            optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        max_workers (:obj:`int`, optional): maximum number of information pages requested concurrently.
+        processes (:obj:`int`, optional):
+            number of processes used to parse the information pages, which is CPU bound, if None they are
+            parsed in the current process.
+        numeric (:obj:`bool`, optional):
+            whether to convert the information fields into numeric columns or not, so that the suffixes (`K`, `M`,
+            `B`, `T`) and the percentages are applied and the ranges are split into their low and high values, see
+            `investpy.utils.information.normalize_information`; if False, the fields are kept as retrieved.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`list` - funds_information:
+            The resulting :obj:`pandas.DataFrame` contains a row per introduced fund, in the same order,
+            with the information fields of `get_fund_information` plus the `Error` column, which is null for
+            the funds whose information was successfully retrieved; it can also be returned as a
+            :obj:`list` of :obj:`dict`, if argument `as_json=True`.
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or errored.
+
+    Examples:
+        >>> data = investpy.get_funds_information(funds=['bbva plan multiactivo moderado pp', 'bbva plan multiactivo conservador pp'], country='spain')
+        >>> data[data['Error'].isnull()]
+
+    """
+
+    if not isinstance(funds, (list, tuple)) or len(funds) == 0:
+        raise ValueError(
+            "ERR#0151: funds argument can just be a non empty list of fund names."
         )
 
-    root_ = fromstring(req.text)
+    if country is not None and not isinstance(country, str):
+        raise ValueError("ERR#0025: specified country value not valid.")
+
+    if not isinstance(as_json, bool):
+        raise ValueError(
+            "ERR#0002: as_json argument can just be True or False, bool type."
+        )
+
+    check_workers(max_workers, processes)
+
+    if not isinstance(numeric, bool):
+        raise ValueError(
+            "ERR#0153: numeric argument can just be True or False, bool type."
+        )
+
+    result = retrieve_information(
+        INFORMATION["fund"],
+        funds,
+        _parse_fund_information,
+        country=country,
+        max_workers=max_workers,
+        processes=processes,
+        numeric=numeric,
+    )
+
+    if as_json is True:
+        return json.loads(result.to_json(orient="records"))
+    elif as_json is False:
+        return result
+
+
+def _parse_fund_information(html, fund):
+    """
+    This function parses the information page of a fund retrieved from Investing.com, so that it can be
+    used by both `get_fund_information` and `get_funds_information`.
+
+    Args:
+        html (:obj:`str`): content of the information page of the fund.
+        fund (:obj:`str`): name of the fund, as shown in the resulting information.
+
+    Returns:
+        :obj:`pandas.DataFrame` - fund_information: information of the fund, as a single row.
+
+    Raises:
+        RuntimeError: raised if scraping process failed while running.
+
+    """
+
+    root_ = fromstring(html)
     path_ = root_.xpath("//div[contains(@class, 'overviewDataTable')]/div")
 
     result = pd.DataFrame(
@@ -902,11 +857,7 @@ def get_fund_information(fund, country, as_json=False):
 
         result.replace({"N/A": None}, inplace=True)
 
-        if as_json is True:
-            json_ = result.iloc[0].to_dict()
-            return json_
-        elif as_json is False:
-            return result
+        return result
     else:
         raise RuntimeError("ERR#0004: data retrieval error while scraping.")
 
@@ -1020,30 +971,31 @@ def get_funds_overview(country, as_json=False, n_results=100):
     results = list()
 
     if len(table) > 0:
+        # Currency of the first fund of every name, instead of looking it up per row
+        currencies = dict(zip(funds["name"][::-1], funds["currency"][::-1]))
+        # Names not found get the first fund, as `idxmax` did when nothing matched
+        missing = funds["currency"].iloc[0]
+
         for row in table[:n_results]:
-            id_ = row.get("id").replace("pair_", "")
-            symbol = row.xpath(".//td[contains(@class, 'symbol')]")[0].get("title")
+            cells = overview_cells(row)
+
+            symbol = cells["symbol"].get("title")
 
-            nested = row.xpath(".//a")[0]
+            nested = row.find(".//a")
             name = nested.get("title").rstrip()
             full_name = nested.text.strip()
 
-            country_flag = row.xpath(".//td[@class='flag']/span")[0].get("title")
+            country_flag = cells["flag"].find("span").get("title")
             country_flag = unidecode(country_flag.lower())
 
-            last_path = ".//td[@class='" + "pid-" + str(id_) + "-last" + "']"
-            last = row.xpath(last_path)[0].text_content()
+            last = cells["last"].text_content()
 
             if last == "":
                 continue
 
-            change_path = (
-                ".//td[contains(@class, '" + "pid-" + str(id_) + "-pcp" + "')]"
-            )
-            change = row.xpath(change_path)[0].text_content()
+            change = cells["pcp"].text_content()
 
-            total_assets_path = change_path
-            total_assets = row.xpath(total_assets_path)[0].getnext().text_content()
+            total_assets = cells["pcp"].getnext().text_content()
 
             if total_assets == "":
                 total_assets = 0
@@ -1071,7 +1023,7 @@ def get_funds_overview(country, as_json=False, n_results=100):
                 "last": float(last.replace(",", "")),
                 "change": change,
                 "total_assets": int(total_assets),
-                "currency": funds.loc[(funds["name"] == name).idxmax(), "currency"],
+                "currency": currencies.get(name, missing),
             }
 
             results.append(data)
@@ -0,0 +1,233 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+CALENDARS = ["union", "intersection", "business", "daily"]
+FILL_POLICIES = ["ffill"]
+DTYPES = ["float64", "float32"]
+
+
+def build_panel(
+    frames,
+    fields=("Close",),
+    calendar="union",
+    fill=None,
+    fill_limit=None,
+    dtype="float64",
+    as_array=False,
+):
+    """
+    This function aligns the historical data of several financial products, as retrieved with any of the historical
+    data functions (e.g. `investpy.get_stock_historical_data`), on a common date index, so that financial products
+    from different stock exchanges (with different holidays) or crypto currencies (traded every day of the week) can
+    be compared. Every value of every financial product is placed on the common date index in a single vectorized
+    pass over the values of all of them, instead of joining the :obj:`pandas.DataFrame` one by one.
+
+    Args:
+        frames (:obj:`dict` or :obj:`list`):
+            historical data of every financial product as :obj:`pandas.DataFrame` indexed by date, where the keys of
+            the :obj:`dict` are used as names of the financial products, or their position if it is a :obj:`list`.
+        fields (:obj:`tuple` or :obj:`str`, optional): numeric columns of the historical data to include in the panel.
+        calendar (:obj:`str` or :obj:`list`, optional):
+            dates of the panel, which can either be `union` (every date with data of any financial product),
+            `intersection` (just the dates with data of every financial product), `business` (every day from Monday
+            to Friday between the first and the last date), `daily` (every day between the first and the last date),
+            the name of one of the financial products to use its dates, or a :obj:`list` of dates.
+        fill (:obj:`str`, optional):
+            if `ffill`, the missing values of every financial product are filled with its last available value, so
+            that no future value is ever used to fill a date; by default missing values are left as NaN.
+        fill_limit (:obj:`int`, optional): maximum number of consecutive missing values to fill.
+        dtype (:obj:`str`, optional): type of the values of the panel, either `float64` or `float32` to halve its memory.
+        as_array (:obj:`bool`, optional): whether to return the values as :obj:`numpy.ndarray` or as :obj:`pandas.DataFrame`.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`tuple` - panel:
+            The resulting :obj:`pandas.DataFrame` is indexed by the dates of the calendar and contains a column per
+            financial product if just one field was introduced, or a column per field and financial product (as a
+            :obj:`pandas.MultiIndex`) otherwise, so it will look like::
+
+                Date || BBVA | SAN  | BTC
+                -----||------|------|-----
+                xxxx || xxxx | xxxx | xxx
+
+            If `as_array` is True, a :obj:`tuple` containing the values as a :obj:`numpy.ndarray` of shape (dates,
+            financial products) or (dates, fields, financial products), the dates of the calendar as a
+            :obj:`pandas.DatetimeIndex` and the names of the financial products is returned instead.
+
+    Raises:
+        ValueError: raised whenever any of the introduced arguments is not valid.
+
+    Examples:
+        >>> frames = {
+        ...     'BBVA': investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2019', to_date='01/02/2019'),
+        ...     'BTC': investpy.get_crypto_historical_data(crypto='bitcoin', from_date='01/01/2019', to_date='01/02/2019'),
+        ... }
+        >>> data = investpy.build_panel(frames, calendar='daily', fill='ffill')
+        >>> data.head()
+                     BBVA     BTC
+        Date
+        2019-01-01    NaN  3809.4
+        2019-01-02  4.799  3873.8
+        2019-01-03  4.759  3780.1
+        2019-01-04  4.967  3802.7
+        2019-01-05  4.967  3785.4
+
+    """
+
+    if isinstance(frames, dict):
+        names, frames = list(frames.keys()), list(frames.values())
+    elif isinstance(frames, (list, tuple)):
+        names, frames = list(range(len(frames))), list(frames)
+    else:
+        raise ValueError(
+            "ERR#0144: frames argument can just be a dict or a list of"
+            " pandas.DataFrame."
+        )
+
+    if not frames or not all(isinstance(frame, pd.DataFrame) for frame in frames):
+        raise ValueError(
+            "ERR#0144: frames argument can just be a dict or a list of"
+            " pandas.DataFrame."
+        )
+
+    if isinstance(fields, str):
+        fields = (fields,)
+
+    fields = list(fields)
+
+    for frame in frames:
+        if not fields or not all(
+            field in frame.columns and pd.api.types.is_numeric_dtype(frame[field])
+            for field in fields
+        ):
+            raise ValueError(
+                "ERR#0145: fields argument can just contain numeric columns of every"
+                " pandas.DataFrame."
+            )
+
+    if fill is not None and fill not in FILL_POLICIES:
+        raise ValueError(
+            "ERR#0146: fill argument can just be None or one of: "
+            + ", ".join(FILL_POLICIES)
+        )
+
+    if fill_limit is not None and (not isinstance(fill_limit, int) or fill_limit < 1):
+        raise ValueError(
+            "ERR#0162: fill_limit argument can just be None or an int > 0."
+        )
+
+    if dtype not in DTYPES:
+        raise ValueError(
+            "ERR#0147: dtype argument can just be one of: " + ", ".join(DTYPES)
+        )
+
+    dates = [frame.index.values.astype("datetime64[D]") for frame in frames]
+
+    calendar = _build_calendar(calendar, dates, names)
+
+    # Values of every financial product, concatenated so that they are placed at once
+    product = np.repeat(np.arange(len(frames)), [len(values) for values in dates])
+    days = np.concatenate(dates).astype("int64")
+
+    panel = np.full((len(calendar), len(fields), len(frames)), np.nan, dtype=dtype)
+
+    if len(days) > 0 and len(calendar) > 0:
+        # Position of every day in the calendar, -1 if the day is not part of it
+        first = min(days.min(), calendar[0].astype("int64"))
+        last = max(days.max(), calendar[-1].astype("int64"))
+
+        lookup = np.full(last - first + 1, -1, dtype="int64")
+        lookup[calendar.astype("int64") - first] = np.arange(len(calendar))
+
+        positions = lookup[days - first]
+        found = positions >= 0
+
+        positions, product = positions[found], product[found]
+
+        for index, field in enumerate(fields):
+            values = np.concatenate(
+                [frame[field].to_numpy(dtype=dtype) for frame in frames]
+            )
+            panel[:, index, :][positions, product] = values[found]
+
+    if fill == "ffill":
+        panel = _forward_fill(panel, limit=fill_limit)
+
+    index = pd.DatetimeIndex(calendar, name="Date")
+
+    if as_array is True:
+        return panel[:, 0, :] if len(fields) == 1 else panel, index, names
+
+    if len(fields) == 1:
+        return pd.DataFrame(panel[:, 0, :], index=index, columns=names, copy=False)
+
+    columns = pd.MultiIndex.from_product([fields, names])
+
+    return pd.DataFrame(
+        panel.reshape(len(calendar), -1), index=index, columns=columns, copy=False
+    )
+
+
+def _build_calendar(calendar, dates, names):
+    values = np.concatenate(dates)
+
+    if isinstance(calendar, str) and calendar in CALENDARS:
+        if calendar == "union":
+            if len(values) == 0:
+                return values
+            # Days with data, computed in a single pass since they are integers
+            days = values.astype("int64")
+            present = np.zeros(days.max() - days.min() + 1, dtype="bool")
+            present[days - days.min()] = True
+            return (np.flatnonzero(present) + days.min()).astype("datetime64[D]")
+
+        if calendar == "intersection":
+            return reduce(np.intersect1d, dates)
+
+        if len(values) == 0:
+            return values
+
+        days = np.arange(values.min(), values.max() + 1, dtype="datetime64[D]")
+
+        if calendar == "business":
+            return days[np.is_busday(days)]
+
+        return days
+
+    if isinstance(calendar, (str, int)):
+        if calendar not in names:
+            raise ValueError(
+                "ERR#0148: calendar argument can just be one of: "
+                + ", ".join(CALENDARS)
+                + ", the name of a financial product or a list of dates."
+            )
+
+        return np.unique(dates[names.index(calendar)])
+
+    try:
+        return np.unique(pd.to_datetime(list(calendar)).values.astype("datetime64[D]"))
+    except (TypeError, ValueError):
+        raise ValueError(
+            "ERR#0148: calendar argument can just be one of: "
+            + ", ".join(CALENDARS)
+            + ", the name of a financial product or a list of dates."
+        )
+
+
+def _forward_fill(panel, limit=None):
+    rows = np.arange(panel.shape[0]).reshape(-1, 1, 1)
+
+    # Index of the last row with a value, for every row, field and financial product
+    last = np.where(np.isnan(panel), 0, rows)
+    np.maximum.accumulate(last, axis=0, out=last)
+
+    filled = np.take_along_axis(panel, last, axis=0)
+
+    if limit is not None:
+        filled[rows - last > limit] = np.nan
+
+    return filled
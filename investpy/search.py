@@ -1,15 +1,41 @@
 # Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
 # See LICENSE for details.
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from threading import Lock
+
 import requests
 from unidecode import unidecode
 
-from .utils.constant import COUNTRY_FILTERS, FLAG_FILTERS, PAIR_FILTERS, PRODUCT_FILTERS
-from .utils.extra import random_user_agent
+from .utils import constant as cst
+from .utils.cache import Cache
+from .utils.catalog import search_catalog
+from .utils.constant import (
+    COUNTRY_FILTERS,
+    FLAG_FILTERS,
+    INTERVAL_FILTERS,
+    PAIR_FILTERS,
+    PRODUCT_FILTERS,
+)
+from .utils.extra import (
+    RateLimitedSession,
+    RateLimiter,
+    pooled_session,
+    random_user_agent,
+)
+from .utils.information import check_workers
 from .utils.search_obj import SearchObj
 
+# Responses of the search engine of Investing.com, per (text, offset) pair
+SEARCH_RESULTS = Cache(ttl=cst.SEARCH_TTL, maxsize=cst.SEARCH_MAXSIZE)
+
 
-def search_quotes(text, products=None, countries=None, n_results=None):
+def search_quotes(
+    text, products=None, countries=None, n_results=None, max_workers=8, exact=False
+):
     """
     This function will use the Investing.com search engine so to retrieve the search results of the
     introduced text. This function will create a :obj:`list` of :obj:`investpy.utils.search_obj.SearchObj`
@@ -37,6 +63,12 @@ def search_quotes(text, products=None, countries=None, n_results=None):
             the filters. Possible countries can be found in the docs, by default this paremeter is set to
             `None` which means that no filter will be applied, and quotes from every country will be retrieved.
         n_results (:obj:`int`, optional): number of search results to retrieve and return.
+        max_workers (:obj:`int`, optional):
+            maximum number of search result pages requested concurrently once the first page reports how many
+            search results there are, which are merged in the same order as Investing.com sorts them.
+        exact (:obj:`bool`, optional):
+            whether to look up the financial products whose symbol or name is exactly the introduced text in the
+            static data files of investpy first, so that Investing.com is just searched if none of them matches.
 
     Returns:
         :obj:`list` of :obj:`investpy.utils.search_obj.SearchObj` or :obj:`investpy.utils.search_obj.SearchObj`:
@@ -52,6 +84,75 @@ def search_quotes(text, products=None, countries=None, n_results=None):
 
     """
 
+    products, countries = _check_search(
+        text, products, countries, n_results, max_workers, exact
+    )
+
+    search_results = list(
+        _search_quotes(text, products, countries, n_results, max_workers, exact)
+    )
+
+    if len(search_results) < 1:
+        raise RuntimeError(
+            "ERR#0093: no results found on Investing.com for the introduced query."
+        )
+
+    if n_results == 1:
+        return search_results[0]
+
+    return search_results
+
+
+def iter_search_quotes(
+    text, products=None, countries=None, n_results=None, max_workers=8, exact=False
+):
+    """
+    This function will use the Investing.com search engine so to retrieve the search results of the
+    introduced text, just like `investpy.search_quotes`, but yielding every :obj:`investpy.utils.search_obj.SearchObj`
+    as soon as the page containing it arrives, instead of returning them once every page has been retrieved, so
+    that the search results can be processed meanwhile the rest of pages are being retrieved, and so that no more
+    pages are requested once the search results are no longer iterated.
+
+    Args:
+        text (:obj:`str`): text to search in Investing.com among all its indexed data.
+        products (:obj:`list` of :obj:`str`, optional):
+            list with the product type filter/s to be applied to search result quotes, see `investpy.search_quotes`.
+        countries (:obj:`list` of :obj:`str`, optional):
+            list with the country name filter/s to be applied to search result quotes, see `investpy.search_quotes`.
+        n_results (:obj:`int`, optional): maximum number of search results to yield.
+        max_workers (:obj:`int`, optional): maximum number of search result pages requested concurrently.
+        exact (:obj:`bool`, optional):
+            whether to look up the financial products whose symbol or name is exactly the introduced text in the
+            static data files of investpy first, so that Investing.com is just searched if none of them matches.
+
+    Returns:
+        :obj:`generator` of :obj:`investpy.utils.search_obj.SearchObj`:
+            The resulting generator yields the retrieved financial products matching the introduced text, in the
+            same order as `investpy.search_quotes` returns them and with no duplicates. Note that no error is raised
+            if no financial product matches the introduced filters, but the generator just yields nothing.
+
+    Raises:
+        ValueError: raised whenever any of the introduced parameter is not valid or errored.
+        ConnectionError: raised whenever the connection to Investing.com failed.
+        RuntimeError: raised if no results were found on Investing.com for the introduced text.
+
+    Examples:
+        >>> for result in investpy.iter_search_quotes(text='apple', products=['stocks']):
+        ...     print(result)
+
+    """
+
+    products, countries = _check_search(
+        text, products, countries, n_results, max_workers, exact
+    )
+
+    # The arguments are checked when called, while the search results are retrieved when iterated
+    return _search_quotes(text, products, countries, n_results, max_workers, exact)
+
+
+def _check_search(text, products, countries, n_results, max_workers, exact):
+    # Checks the arguments of `search_quotes`, returning the products and countries
+    # filters as Investing.com names them
     if not text:
         raise ValueError(
             "ERR#0074: text parameter is mandatory and it should be a valid str."
@@ -129,6 +230,17 @@ def search_quotes(text, products=None, countries=None, n_results=None):
 
         countries = [COUNTRY_FILTERS[country] for country in countries]
 
+    check_workers(max_workers, None)
+
+    if not isinstance(exact, bool):
+        raise ValueError(
+            "ERR#0156: exact argument can just be True or False, bool type."
+        )
+
+    return products, countries
+
+
+def _search_quotes(text, products, countries, n_results, max_workers, exact):
     params = {
         "search_text": text,
         "tab": "quotes",
@@ -147,55 +259,121 @@ def search_quotes(text, products=None, countries=None, n_results=None):
 
     url = "https://www.investing.com/search/service/SearchInnerPage"
 
-    search_results = list()
-
-    total_results = None
+    if exact is True:
+        search_results = search_catalog(
+            text,
+            pair_types=(
+                None
+                if products is None
+                else [PAIR_FILTERS[product] for product in products]
+            ),
+            countries=(
+                None
+                if countries is None
+                else [FLAG_FILTERS.get(country, country) for country in countries]
+            ),
+        )
 
-    user_limit = True if n_results is not None else False
+        # Investing.com is just searched if no financial product matches locally
+        if search_results:
+            yield from search_results[:n_results]
+            return
 
-    while True:
-        req = requests.post(url, headers=headers, data=params)
+    def fetch(offset):
+        data = SEARCH_RESULTS.get((text, offset))
 
-        if req.status_code != 200:
-            raise ConnectionError(
-                f"ERR#0015: error {req.status_code}, try again later."
+        if data is None:
+            req = pooled_session().post(
+                url, headers=headers, data=dict(params, offset=offset)
             )
 
-        data = req.json()
+            if req.status_code != 200:
+                raise ConnectionError(
+                    f"ERR#0015: error {req.status_code}, try again later."
+                )
 
-        if data["total"]["quotes"] == 0:
-            raise RuntimeError(
-                "ERR#0093: no results found on Investing.com for the introduced text."
-            )
+            data = req.json()
 
-        if total_results is None:
-            total_results = data["total"]["quotes"]
+            if data["total"]["quotes"] == 0:
+                raise RuntimeError(
+                    "ERR#0093: no results found on Investing.com for the introduced"
+                    " text."
+                )
 
-        if n_results is None:
-            n_results = data["total"]["quotes"]
+            SEARCH_RESULTS.set((text, offset), data)
 
-        for quote in data["quotes"]:
-            country, pair_type = quote["flag"], quote["pair_type"]
+        return data["total"]["quotes"], _search_page(data, products, countries)
 
-            if countries is not None:
-                if quote["flag"] not in countries:
-                    continue
+    # Ids of the yielded search results, since the same quote may be in more than one page
+    yielded = set()
 
-            if products is not None:
-                if quote["pair_type"] not in products:
-                    continue
+    total_results, page = fetch(0)
 
-            pair_type = PAIR_FILTERS[quote["pair_type"]]
+    if n_results is None:
+        n_results = total_results
 
-            country = None
-            if pair_type not in ["cryptos", "commodities"]:
-                country = (
-                    FLAG_FILTERS[quote["flag"]]
-                    if quote["flag"] in FLAG_FILTERS
-                    else quote["flag"]
-                )
+    pages = iter([(total_results, page)])
+    offsets = iter(range(270, total_results, 270))
+    n_pages = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            # The pages are merged in offset order as soon as every one of them arrives
+            for _, page in pages:
+                n_pages += 1
+
+                for search_obj in page:
+                    if search_obj.id_ in yielded:
+                        continue
+
+                    yielded.add(search_obj.id_)
+
+                    yield search_obj
+
+                    if len(yielded) >= n_results or len(yielded) >= total_results:
+                        return
 
-            search_obj = SearchObj(
+            # Once the total is known, the remaining pages are requested concurrently, but just as
+            # many as expected to be needed to reach `n_results`, based on the results per page so far
+            if yielded:
+                expected = len(yielded) / n_pages
+                window = math.ceil((n_results - len(yielded)) / expected)
+            else:
+                window = max_workers
+
+            window = list(islice(offsets, min(window, max_workers)))
+
+            if not window:
+                return
+
+            pages = executor.map(fetch, window)
+
+
+def _search_page(data, products, countries):
+    # Search results of a page matching the products and countries filters, in the same order
+    search_results = list()
+
+    for quote in data["quotes"]:
+        if countries is not None:
+            if quote["flag"] not in countries:
+                continue
+
+        if products is not None:
+            if quote["pair_type"] not in products:
+                continue
+
+        pair_type = PAIR_FILTERS[quote["pair_type"]]
+
+        country = None
+        if pair_type not in ["cryptos", "commodities"]:
+            country = (
+                FLAG_FILTERS[quote["flag"]]
+                if quote["flag"] in FLAG_FILTERS
+                else quote["flag"]
+            )
+
+        search_results.append(
+            SearchObj(
                 id_=quote["pairId"],
                 name=quote["name"],
                 symbol=quote["symbol"],
@@ -204,28 +382,198 @@ def search_quotes(text, products=None, countries=None, n_results=None):
                 pair_type=pair_type,
                 exchange=quote["exchange"],
             )
+        )
 
-            if n_results == 1 and user_limit:
-                return search_obj
+    return search_results
 
-            if search_obj not in search_results:
-                search_results.append(search_obj)
 
-        params["offset"] += 270
+def retrieve_all(
+    search_objs,
+    what=("historical",),
+    from_date=None,
+    to_date=None,
+    interval="Daily",
+    technical_interval="daily",
+    max_workers=8,
+    rate_limit=None,
+):
+    """
+    This function retrieves the data of several :obj:`investpy.utils.search_obj.SearchObj` at once, e.g. the ones
+    returned by `investpy.search_quotes`, calling the introduced `retrieve_*` methods of every one of them
+    concurrently, with up to `max_workers` retrievals running at the same time through the session shared by
+    every request sent to Investing.com, see `investpy.utils.extra.pooled_session`, and with no more than
+    `rate_limit` requests sent per second overall, if specified. Note that the rate limit applies to every
+    request and not just to every retrieval, since a single retrieval may send several requests, e.g. the
+    historical data of long date ranges is requested in several windows concurrently. The retrieved data is also kept in the attributes
+    of every :obj:`investpy.utils.search_obj.SearchObj`, just like when calling its methods, so that the
+    retrievals of the same :obj:`investpy.utils.search_obj.SearchObj` run one after another (e.g. `recent` and
+    `historical` both fill its `data`, which keeps the last one retrieved), while the ones of different
+    :obj:`investpy.utils.search_obj.SearchObj` run concurrently; and the ones with the same id are just retrieved
+    once.
 
-        if (
-            len(search_results) >= n_results
-            or len(search_results) >= total_results
-            or params["offset"] >= total_results
-        ):
-            break
+    Args:
+        search_objs (:obj:`list` of :obj:`investpy.utils.search_obj.SearchObj`): financial products to retrieve.
+        what (:obj:`str` or :obj:`tuple` of :obj:`str`, optional):
+            data to retrieve from every financial product, which can be any of `recent`, `historical`,
+            `information`, `technical_indicators` and `currency`, as retrieved by the `retrieve_*` methods.
+        from_date (:obj:`str`, optional):
+            date from which the historical data will be retrieved, specified in dd/mm/yyyy format.
+        to_date (:obj:`str`, optional):
+            date until the historical data will be retrieved, specified in dd/mm/yyyy format.
+        interval (:obj:`str`, optional):
+            time interval of the historical data, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        technical_interval (:obj:`str`, optional):
+            time interval of the technical indicators, by default `daily`, but it can also be any of `1min`,
+            `5mins`, `15mins`, `30mins`, `1hour`, `5hours`, `weekly` and `monthly`, while the funds just provide
+            `daily`, `weekly` and `monthly`, see `retrieve_technical_indicators`.
+        max_workers (:obj:`int`, optional): maximum number of retrievals running concurrently.
+        rate_limit (:obj:`float`, optional):
+            maximum number of requests sent per second overall, if None, unlimited.
 
-    if len(search_results) < 1:
-        raise RuntimeError(
-            "ERR#0093: no results found on Investing.com for the introduced query."
+    Returns:
+        :obj:`dict` - results:
+            The resulting :obj:`dict` contains a :obj:`dict` per id of the introduced financial products, with the
+            retrieved data per introduced `what`, which is None if it could not be retrieved, and the `errors`
+            :obj:`dict`, with the error message per `what` that could not be retrieved, so that the retrievals
+            that errored do not raise, but are reported instead.
+
+    Raises:
+        ValueError: raised whenever any of the introduced arguments is not valid or errored.
+
+    Examples:
+        >>> results = investpy.search_quotes(text='bbva', products=['stocks'], n_results=10)
+        >>> data = investpy.retrieve_all(results, what=('historical', 'information'), from_date='01/01/2019', to_date='01/01/2020')
+
+    """
+
+    if (
+        not isinstance(search_objs, (list, tuple))
+        or len(search_objs) == 0
+        or not all(isinstance(search_obj, SearchObj) for search_obj in search_objs)
+    ):
+        raise ValueError(
+            "ERR#0157: search_objs argument can just be a non empty list of SearchObj."
         )
 
-    return search_results[:n_results]
+    if isinstance(what, str):
+        what = (what,)
+
+    if (
+        not isinstance(what, (list, tuple))
+        or len(what) == 0
+        or not set(what).issubset(RETRIEVALS.keys())
+    ):
+        raise ValueError(
+            "ERR#0158: what argument can just be any of "
+            + ", ".join(RETRIEVALS.keys())
+            + "."
+        )
+
+    if "historical" in what:
+        try:
+            datetime.strptime(from_date, "%d/%m/%Y")
+        except (TypeError, ValueError):
+            raise ValueError(
+                "ERR#0011: incorrect from_date date format, it should be 'dd/mm/yyyy'."
+            )
+
+        try:
+            datetime.strptime(to_date, "%d/%m/%Y")
+        except (TypeError, ValueError):
+            raise ValueError(
+                "ERR#0012: incorrect to_date format, it should be 'dd/mm/yyyy'."
+            )
+
+        if not isinstance(interval, str) or interval.lower() not in [
+            "daily",
+            "weekly",
+            "monthly",
+        ]:
+            raise ValueError(
+                "ERR#0073: interval value should be a str type and it can just be"
+                " either 'Daily', 'Weekly' or 'Monthly'."
+            )
+
+    if "technical_indicators" in what and technical_interval not in INTERVAL_FILTERS:
+        raise ValueError(
+            "ERR#0164: technical_interval value should be a str type and it can just be"
+            " any of " + ", ".join(INTERVAL_FILTERS.keys()) + "."
+        )
+
+    check_workers(max_workers, None)
+
+    if rate_limit is not None and (
+        not isinstance(rate_limit, (int, float))
+        or isinstance(rate_limit, bool)
+        or rate_limit <= 0
+    ):
+        raise ValueError(
+            "ERR#0159: rate_limit argument can just be None or a number > 0."
+        )
+
+    # Every request of every retrieval acquires the same limiter, so that the rate limit is global
+    session = (
+        RateLimitedSession(pooled_session(), RateLimiter(rate_limit))
+        if rate_limit is not None
+        else None
+    )
+
+    # Every financial product is just retrieved once, even if introduced more than once
+    unique = dict()
+    for search_obj in search_objs:
+        unique.setdefault(search_obj.id_, search_obj)
+
+    results = {id_: dict({key: None for key in what}, errors=dict()) for id_ in unique}
+
+    # The retrievals of the same financial product fill its attributes, so they are not run concurrently
+    locks = {id_: Lock() for id_ in unique}
+
+    def retrieve(job):
+        key, id_ = job
+
+        with locks[id_]:
+            try:
+                results[id_][key] = RETRIEVALS[key](
+                    unique[id_],
+                    from_date=from_date,
+                    to_date=to_date,
+                    interval=interval,
+                    technical_interval=technical_interval,
+                    session=session,
+                )
+            except Exception as e:
+                results[id_]["errors"][key] = str(e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Every kind of data is retrieved for every financial product before the next kind, so that the
+        # concurrent retrievals are of different financial products, which do not wait for each other
+        list(executor.map(retrieve, [(key, id_) for key in what for id_ in unique]))
+
+    return results
+
+
+# Methods of `SearchObj` called by `retrieve_all` per retrieved data
+RETRIEVALS = {
+    "recent": lambda search_obj, session, **kwargs: (
+        search_obj.retrieve_recent_data(session=session)
+    ),
+    "historical": lambda search_obj, from_date, to_date, interval, session, **kwargs: (
+        search_obj.retrieve_historical_data(
+            from_date, to_date, interval=interval, session=session
+        )
+    ),
+    "information": lambda search_obj, session, **kwargs: (
+        search_obj.retrieve_information(session=session)
+    ),
+    "technical_indicators": lambda search_obj, technical_interval, session, **kwargs: (
+        search_obj.retrieve_technical_indicators(
+            interval=technical_interval, session=session
+        )
+    ),
+    "currency": lambda search_obj, session, **kwargs: (
+        search_obj.retrieve_currency(session=session)
+    ),
+}
 
 
 def search_events(text, importances=None, countries=None, n_results=None):
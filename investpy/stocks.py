@@ -2,12 +2,10 @@
 # See LICENSE for details.
 
 import json
-from datetime import date, datetime, timedelta
-from random import randint
+from datetime import date, datetime
 
 import pandas as pd
 import pkg_resources
-import pytz
 import requests
 from lxml.html import fromstring
 from unidecode import unidecode
@@ -19,8 +17,47 @@ from .data.stocks_data import (
     stocks_as_list,
 )
 from .utils import constant as cst
-from .utils.data import Data
+from .utils.cache import Cache
+from .utils.dividends import DIVIDENDS_SCHEMA, retrieve_dividends, sync_dividends
 from .utils.extra import random_user_agent
+from .utils.financials import (
+    FINANCIALS_SCHEMA,
+    fetch_financial_summary,
+    parse_financial_summary,
+    retrieve_financial_summaries,
+    summary_tables,
+)
+from .utils.historical import SCHEMAS, retrieve_historical_data, retrieve_recent_data
+from .utils.information import (
+    INFORMATION,
+    check_workers,
+    fetch_page,
+    resolve_instruments,
+    retrieve_information,
+)
+from .utils.parsers import overview_cells
+from .utils.profiles import (
+    PROFILE_SOURCES,
+    PROFILES_SCHEMA,
+    fetch_company_profile,
+    retrieve_company_profiles,
+)
+from .utils.store import Store
+
+# Responses with every financial summary table, per (id, period) pair
+FINANCIAL_SUMMARIES = Cache(
+    ttl=cst.FINANCIAL_SUMMARY_TTL, maxsize=cst.FINANCIAL_SUMMARY_MAXSIZE
+)
+
+# Company profiles per (tag or ISIN, source) pair, which barely change
+COMPANY_PROFILES = Cache(
+    ttl=cst.COMPANY_PROFILES_TTL, maxsize=cst.COMPANY_PROFILES_MAXSIZE
+)
+
+# Dividends retrieved per (country, stock) pair, updated incrementally once not fresh
+DIVIDENDS = Store(
+    ttl=cst.DIVIDENDS_TTL, maxsize=cst.DIVIDENDS_MAXSIZE, path=cst.DIVIDENDS_PATH
+)
 
 
 def get_stocks(country=None):
@@ -145,7 +182,14 @@ def get_stock_countries():
 
 
 def get_stock_recent_data(
-    stock, country, as_json=False, order="ascending", interval="Daily"
+    stock,
+    country,
+    as_json=False,
+    order="ascending",
+    interval="Daily",
+    dtypes=None,
+    fp=None,
+    compact=False,
 ):
     """
     This function retrieves recent historical data from the introduced stock from Investing.com. So on, the recent data
@@ -163,6 +207,17 @@ def get_stock_recent_data(
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are returned as `float32`, the volume as `int32` (if it fits, `int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, which at least halves the memory usage;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None moves the
+            column to `df.attrs`. Ignored if `as_json` is True, see `investpy.utils.historical.format_data`.
+        fp (:obj:`file`, optional):
+            text file-like object to write the :obj:`json` to instead of returning it, in which case None is returned.
+            Just if `as_json` is True, see `investpy.utils.historical.write_json`.
+        compact (:obj:`bool`, optional):
+            whether to serialize the :obj:`json` with no whitespace (using orjson if installed) or not, which keeps
+            the same values and keys. Just if `as_json` is True, see `investpy.utils.historical.write_json`.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -234,6 +289,23 @@ def get_stock_recent_data(
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
+    if dtypes is not None and dtypes != "compact" and not isinstance(dtypes, dict):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes."
+        )
+
+    if not isinstance(compact, bool):
+        raise ValueError(
+            "ERR#0160: compact argument can just be True or False, bool type."
+        )
+
+    if fp is not None and (as_json is False or not hasattr(fp, "write")):
+        raise ValueError(
+            "ERR#0161: fp argument can just be None or a file-like object, and just"
+            " if as_json is True."
+        )
+
     if order not in ["ascending", "asc", "descending", "desc"]:
         raise ValueError(
             "ERR#0003: order argument can just be ascending (asc) or descending (desc),"
@@ -305,99 +377,19 @@ def get_stock_recent_data(
         (stocks["symbol"].apply(unidecode).str.lower() == stock).idxmax(), "currency"
     ]
 
-    header = symbol + " Historical Data"
-
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval.capitalize(),
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data",
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
-        )
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == "No results found":
-                raise IndexError(
-                    "ERR#0007: stock information unavailable or not found."
-                )
-
-            info = []
-
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get("data-real-value"))
-
-            stock_date = datetime.strptime(
-                str(
-                    datetime.fromtimestamp(int(info[0]), tz=pytz.timezone("GMT")).date()
-                ),
-                "%Y-%m-%d",
-            )
-
-            stock_close = float(info[1].replace(",", ""))
-            stock_open = float(info[2].replace(",", ""))
-            stock_high = float(info[3].replace(",", ""))
-            stock_low = float(info[4].replace(",", ""))
-
-            stock_volume = int(info[5])
-
-            result.insert(
-                len(result),
-                Data(
-                    stock_date,
-                    stock_open,
-                    stock_high,
-                    stock_low,
-                    stock_close,
-                    stock_volume,
-                    stock_currency,
-                    None,
-                ),
-            )
-
-        if order in ["ascending", "asc"]:
-            result = result[::-1]
-        elif order in ["descending", "desc"]:
-            result = result
-
-        if as_json is True:
-            json_ = {
-                "name": name,
-                "recent": [value.stock_as_json() for value in result],
-            }
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.stock_to_dict() for value in result])
-            df.set_index("Date", inplace=True)
-
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(
+        SCHEMAS["stock"],
+        id_=id_,
+        name=name,
+        header=symbol,
+        currency=stock_currency,
+        as_json=as_json,
+        order=order,
+        dtypes=dtypes,
+        fp=fp,
+        compact=compact,
+        interval=interval,
+    )
 
 
 def get_stock_historical_data(
@@ -408,6 +400,12 @@ def get_stock_historical_data(
     as_json=False,
     order="ascending",
     interval="Daily",
+    resample=False,
+    adjusted=False,
+    total_return=False,
+    dtypes=None,
+    fp=None,
+    compact=False,
 ):
     """
     This function retrieves historical data from the introduced stock from Investing.com. So on, the historical data
@@ -427,6 +425,27 @@ def get_stock_historical_data(
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        resample (:obj:`bool`, optional):
+            if True and `interval` is either `Weekly` or `Monthly`, the data is resampled locally from the daily data
+            of the same date range if it was already retrieved during the current process, instead of retrieving it
+            again from Investing.com, see `investpy.utils.historical.resample_columns`.
+        adjusted (:obj:`bool`, optional):
+            if True, the `Adj Close` column is added, containing the close values adjusted by the dividends paid
+            afterwards, which are retrieved from Investing.com unless already retrieved during the current process.
+        total_return (:obj:`bool`, optional):
+            if True, the `Total Return` column is added, containing the value of holding the stock since `from_date`
+            reinvesting every dividend, starting at the first close value, see `investpy.utils.adjustment`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are returned as `float32`, the volume as `int32` (if it fits, `int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, which at least halves the memory usage;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None moves the
+            column to `df.attrs`. Ignored if `as_json` is True, see `investpy.utils.historical.format_data`.
+        fp (:obj:`file`, optional):
+            text file-like object to write the :obj:`json` to instead of returning it, in which case None is returned.
+            Just if `as_json` is True, see `investpy.utils.historical.write_json`.
+        compact (:obj:`bool`, optional):
+            whether to serialize the :obj:`json` with no whitespace (using orjson if installed) or not, which keeps
+            the same values and keys. Just if `as_json` is True, see `investpy.utils.historical.write_json`.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -498,6 +517,38 @@ def get_stock_historical_data(
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
+    if dtypes is not None and dtypes != "compact" and not isinstance(dtypes, dict):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes."
+        )
+
+    if not isinstance(compact, bool):
+        raise ValueError(
+            "ERR#0160: compact argument can just be True or False, bool type."
+        )
+
+    if fp is not None and (as_json is False or not hasattr(fp, "write")):
+        raise ValueError(
+            "ERR#0161: fp argument can just be None or a file-like object, and just"
+            " if as_json is True."
+        )
+
+    if not isinstance(resample, bool):
+        raise ValueError(
+            "ERR#0141: resample argument can just be True or False, bool type."
+        )
+
+    if not isinstance(adjusted, bool):
+        raise ValueError(
+            "ERR#0142: adjusted argument can just be True or False, bool type."
+        )
+
+    if not isinstance(total_return, bool):
+        raise ValueError(
+            "ERR#0143: total_return argument can just be True or False, bool type."
+        )
+
     if order not in ["ascending", "asc", "descending", "desc"]:
         raise ValueError(
             "ERR#0003: order argument can just be ascending (asc) or descending (desc),"
@@ -547,43 +598,6 @@ def get_stock_historical_data(
             " 'dd/mm/yyyy'."
         )
 
-    date_interval = {
-        "intervals": [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                "start": start_date.strftime("%m/%d/%Y"),
-                "end": start_date.replace(year=start_date.year + 19).strftime(
-                    "%m/%d/%Y"
-                ),
-            }
-
-            date_interval["intervals"].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19) + timedelta(
-                days=1
-            )
-        else:
-            obj = {
-                "start": start_date.strftime("%m/%d/%Y"),
-                "end": end_date.strftime("%m/%d/%Y"),
-            }
-
-            date_interval["intervals"].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval["intervals"])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = "investpy"
     resource_path = "/".join((("resources", "stocks.csv")))
     if pkg_resources.resource_exists(resource_package, resource_path):
@@ -629,130 +643,43 @@ def get_stock_historical_data(
         (stocks["symbol"].apply(unidecode).str.lower() == stock).idxmax(), "currency"
     ]
 
-    final = list()
-
-    header = symbol + " Historical Data"
-
-    for index in range(len(date_interval["intervals"])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval["intervals"][index]["start"],
-            "end_date": date_interval["intervals"][index]["end"],
-            "interval_sec": interval.capitalize(),
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data",
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
+    schema = SCHEMAS["stock"]
+    dividends = None
 
-        req = requests.post(url, headers=head, data=params)
+    if adjusted is True or total_return is True:
+        schema = schema.replace(adjusted=adjusted, total_return=total_return)
 
-        if req.status_code != 200:
-            raise ConnectionError(
-                "ERR#0015: error " + str(req.status_code) + ", try again later."
+        try:
+            dividends = get_stock_dividends(
+                stock=stock, country=country, incremental=True
             )
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == "No results found":
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError(
-                            "ERR#0007: stock information unavailable or not found."
-                        )
-                else:
-                    data_flag = True
-
-                info = []
-
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get("data-real-value"))
-
-                if data_flag is True:
-                    stock_date = datetime.strptime(
-                        str(
-                            datetime.fromtimestamp(
-                                int(info[0]), tz=pytz.timezone("GMT")
-                            ).date()
-                        ),
-                        "%Y-%m-%d",
-                    )
-
-                    stock_close = float(info[1].replace(",", ""))
-                    stock_open = float(info[2].replace(",", ""))
-                    stock_high = float(info[3].replace(",", ""))
-                    stock_low = float(info[4].replace(",", ""))
-
-                    stock_volume = int(info[5])
-
-                    result.insert(
-                        len(result),
-                        Data(
-                            stock_date,
-                            stock_open,
-                            stock_high,
-                            stock_low,
-                            stock_close,
-                            stock_volume,
-                            stock_currency,
-                            None,
-                        ),
-                    )
-
-            if data_flag is True:
-                if order in ["ascending", "asc"]:
-                    result = result[::-1]
-                elif order in ["descending", "desc"]:
-                    result = result
-
-                if as_json is True:
-                    json_list = [value.stock_as_json() for value in result]
-
-                    final.append(json_list)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records(
-                        [value.stock_to_dict() for value in result]
-                    )
-                    df.set_index("Date", inplace=True)
-
-                    final.append(df)
-
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if order in ["descending", "desc"]:
-        final.reverse()
-
-    if as_json is True:
-        json_ = {
-            "name": name,
-            "historical": [value for json_list in final for value in json_list],
-        }
-        return json.dumps(json_, sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+        except RuntimeError as e:
+            # Just if the stock has no dividends, otherwise the adjustment would be wrong
+            if not str(e).startswith("ERR#0061"):
+                raise
+
+            dividends = pd.DataFrame(columns=["Date", "Dividend"])
+
+            if not DIVIDENDS.fresh((country, stock)):
+                DIVIDENDS.set((country, stock), dividends)
+
+    return retrieve_historical_data(
+        schema,
+        id_=id_,
+        name=name,
+        header=symbol,
+        from_date=start_date,
+        to_date=end_date,
+        currency=stock_currency,
+        as_json=as_json,
+        order=order,
+        dtypes=dtypes,
+        fp=fp,
+        compact=compact,
+        interval=interval,
+        resample=resample,
+        dividends=dividends,
+    )
 
 
 def get_stock_company_profile(stock, country="spain", language="english"):
@@ -765,6 +692,8 @@ def get_stock_company_profile(stock, country="spain", language="english"):
     resulting object will be the same. Note that this functionalliy as described in the docs is just supported
     for spanish stocks currently, so on, if any other stock from any other country is introduced as parameter,
     the function will raise an exception.
+    Since company profiles barely change, the retrieved ones are kept in memory for a week (see
+    `investpy.utils.constant.COMPANY_PROFILES_TTL`), so that they are not retrieved again meanwhile.
 
     Note:
         Currently just the spanish company profile can be retrieved from spanish stocks, so if you try to
@@ -806,13 +735,6 @@ def get_stock_company_profile(stock, country="spain", language="english"):
 
     """
 
-    available_sources = {
-        "english": "Investing",
-        "en": "Investing",
-        "spanish": "Bolsa de Madrid",
-        "es": "Bolsa de Madrid",
-    }
-
     if not stock:
         raise ValueError(
             "ERR#0013: stock parameter is mandatory and must be a valid stock symbol."
@@ -829,7 +751,7 @@ def get_stock_company_profile(stock, country="spain", language="english"):
 
     language = unidecode(language.strip().lower())
 
-    if language not in available_sources.keys():
+    if language not in PROFILE_SOURCES.keys():
         raise ValueError(
             "ERR#0014: the specified language is not valid, it can just be either"
             " spanish (es) or english (en)."
@@ -848,7 +770,7 @@ def get_stock_company_profile(stock, country="spain", language="english"):
             " spanish stocks."
         )
 
-    selected_source = available_sources[language]
+    selected_source = PROFILE_SOURCES[language]
 
     resource_package = "investpy"
     resource_path = "/".join((("resources", "stocks.csv")))
@@ -872,94 +794,115 @@ def get_stock_company_profile(stock, country="spain", language="english"):
             "ERR#0018: stock " + stock + " not found, check if it is correct."
         )
 
-    company_profile = {"url": None, "desc": None}
-
-    if selected_source == "Bolsa de Madrid":
-        isin = stocks.loc[
-            (stocks["symbol"].apply(unidecode).str.lower() == stock).idxmax(), "isin"
-        ]
-
-        url = "http://www.bolsamadrid.es/esp/aspx/Empresas/FichaValor.aspx?ISIN=" + isin
-
-        company_profile["url"] = url
+    position = (stocks["symbol"].apply(unidecode).str.lower() == stock).idxmax()
 
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
-
-        req = requests.get(url, headers=head)
-
-        if req.status_code != 200:
-            raise ConnectionError(
-                "ERR#0015: error " + str(req.status_code) + ", try again later."
-            )
-
-        root_ = fromstring(req.text)
+    return fetch_company_profile(
+        selected_source,
+        stocks.loc[position, "tag"],
+        stocks.loc[position, "isin"],
+        COMPANY_PROFILES,
+    )
 
-        path_ = root_.xpath(".//td[contains(@class, 'Perfil')]/p")
 
-        if path_:
-            text = list()
-            for element_ in path_:
-                if not element_.xpath(".//a"):
-                    text.append(element_.text_content())
+def get_stocks_company_profile(
+    stocks, country=None, language="english", as_json=False, max_workers=8
+):
+    """
+    This function retrieves the company profiles of several stocks at once, as retrieved by
+    `get_stock_company_profile` for every stock, so that the stocks are resolved against the static data file
+    just once and their company profiles are retrieved concurrently through the session shared by every request
+    sent to Investing.com (or Bolsa de Madrid). Since company profiles barely change, every retrieved company
+    profile is kept in memory (see `investpy.utils.constant.COMPANY_PROFILES_TTL`) and shared with
+    `get_stock_company_profile`, so that the profiles already retrieved are not retrieved again. Note that the
+    stocks that could not be found or retrieved do not raise any error, but their error message is reported in
+    the `Error` column instead.
 
-            text = "".join(text)
+    Args:
+        stocks (:obj:`list`):
+            symbols of the stocks to retrieve the company profiles from, or tuples of symbol and
+            country, so that stocks from different countries can be introduced together.
+        country (:obj:`str`, optional): name of the country of the stocks introduced with no country.
+        language (:obj:`str`, optional):
+            language in which the company profiles are going to be retrieved, can either be english or spanish,
+            which is just available for spanish stocks.
+        as_json (:obj:`bool`, optional):
+            optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        max_workers (:obj:`int`, optional): maximum number of company profiles retrieved concurrently.
 
-            company_profile["desc"] = " ".join(
-                text.replace("\n", " ").replace("\xa0", " ").split()
-            )
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`list` - stocks_company_profile:
+            The resulting :obj:`pandas.DataFrame` contains a row per introduced stock, in the same order, with
+            the `Stock Symbol` and `Country` columns followed by the `url` and `desc` of its company profile, as
+            returned by `get_stock_company_profile`, and the `Error` column, which is null for the stocks whose
+            company profile was retrieved; it can also be returned as a :obj:`list` of :obj:`dict`, if argument
+            `as_json=True`.
 
-        return company_profile
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or errored.
 
-    elif selected_source == "Investing":
-        tag = stocks.loc[
-            (stocks["symbol"].apply(unidecode).str.lower() == stock).idxmax(), "tag"
-        ]
+    Examples:
+        >>> stocks = investpy.get_stocks_list(country='spain')
+        >>> data = investpy.get_stocks_company_profile(stocks=stocks, country='spain', language='spanish')
 
-        url = "https://www.investing.com/equities/" + tag + "-company-profile"
+    """
 
-        company_profile["url"] = url
+    if not isinstance(stocks, (list, tuple)) or len(stocks) == 0:
+        raise ValueError(
+            "ERR#0151: stocks argument can just be a non empty list of stock symbols."
+        )
 
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
+    if country is not None and not isinstance(country, str):
+        raise ValueError("ERR#0025: specified country value not valid.")
 
-        req = requests.get(url, headers=head)
+    if (
+        not isinstance(language, str)
+        or unidecode(language.strip().lower()) not in PROFILE_SOURCES.keys()
+    ):
+        raise ValueError(
+            "ERR#0014: the specified language is not valid, it can just be either"
+            " spanish (es) or english (en)."
+        )
 
-        if req.status_code != 200:
-            raise ConnectionError(
-                "ERR#0015: error " + str(req.status_code) + ", try again later."
-            )
+    if not isinstance(as_json, bool):
+        raise ValueError(
+            "ERR#0002: as_json argument can just be True or False, bool type."
+        )
 
-        root_ = fromstring(req.text)
+    check_workers(max_workers, None)
 
-        path_ = root_.xpath('.//*[@id="profile-fullStory-showhide"]')
+    resolved = resolve_instruments(PROFILES_SCHEMA, stocks, country=country)
 
-        if path_:
-            company_profile["desc"] = str(path_[0].text_content())
+    result = retrieve_company_profiles(
+        resolved,
+        PROFILE_SOURCES[unidecode(language.strip().lower())],
+        COMPANY_PROFILES,
+        max_workers=max_workers,
+    )
 
-        return company_profile
+    if as_json is True:
+        return json.loads(result.to_json(orient="records"))
+    elif as_json is False:
+        return result
 
 
-def get_stock_dividends(stock, country):
+def get_stock_dividends(stock, country, incremental=False):
     """
     This function retrieves the stock dividends from the introduced stocks, which are token rewards paid to
     the shareholders for their investment in a company's stock/equity. Dividends data include date of the
     dividend, dividend value, type, payment date and yield. This information is really useful when it comes
     to creating portfolios.
 
+    The retrieved dividends are stored per stock (see `investpy.stocks.DIVIDENDS`, which can also be pickled into a
+    directory by setting its `path`), so that if `incremental` is True, the stored dividends are returned as is while
+    they are fresh, and then just updated with the newer ones, as the older dividends are retrieved page by page
+    (from the newest to the oldest) until reaching the newest stored dividend, instead of retrieving every page.
+
     Args:
         stock (:obj:`str`): symbol of the stock to retrieve its dividends from.
         country (:obj:`country`): name of the country from where the stock is from.
+        incremental (:obj:`bool`, optional):
+            whether to return the stored dividends of the stock while they are fresh and to just retrieve the
+            dividends newer than the stored ones otherwise, or to retrieve every dividend of the stock (default).
 
     Returns:
         :obj:`pandas.DataFrame` - stock_dividends:
@@ -991,6 +934,11 @@ def get_stock_dividends(stock, country):
     if country is not None and not isinstance(country, str):
         raise ValueError("ERR#0025: specified country value not valid.")
 
+    if not isinstance(incremental, bool):
+        raise ValueError(
+            "ERR#0154: incremental argument can just be True or False, bool type."
+        )
+
     resource_package = "investpy"
     resource_path = "/".join((("resources", "stocks.csv")))
     if pkg_resources.resource_exists(resource_package, resource_path):
@@ -1026,183 +974,100 @@ def get_stock_dividends(stock, country):
         (stocks["symbol"].apply(unidecode).str.lower() == stock).idxmax(), "tag"
     ]
 
-    headers = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    return sync_dividends(tag_, (country, stock), DIVIDENDS, incremental=incremental)
 
-    url = "https://www.investing.com/equities/" + str(tag_) + "-dividends"
 
-    req = requests.get(url=url, headers=headers)
+def get_stocks_dividends(
+    stocks, country=None, as_json=False, max_workers=8, incremental=False, numeric=True
+):
+    """
+    This function retrieves the dividends of several stocks at once, as retrieved by `get_stock_dividends` for
+    every stock, so that the stocks are resolved against the static data file just once and their dividends are
+    retrieved concurrently through the session shared by every request sent to Investing.com, while the pages of
+    the dividends of every stock are still retrieved one after another. Note that the stocks that could not be
+    found or that have no dividends do not raise any error, but their error message is reported in the `Error`
+    column instead.
 
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
-        )
+    Args:
+        stocks (:obj:`list`):
+            symbols of the stocks to retrieve the dividends from, or tuples of symbol and
+            country, so that stocks from different countries can be introduced together.
+        country (:obj:`str`, optional): name of the country of the stocks introduced with no country.
+        as_json (:obj:`bool`, optional):
+            optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        max_workers (:obj:`int`, optional): maximum number of stocks whose dividends are retrieved concurrently.
+        incremental (:obj:`bool`, optional):
+            whether to return the stored dividends of every stock while they are fresh and to just retrieve the
+            dividends newer than the stored ones otherwise, or to retrieve every dividend (default), see
+            `get_stock_dividends`.
+        numeric (:obj:`bool`, optional):
+            whether to convert the yields into numeric values, so that `5.67%` is 5.67, which is done at once for
+            every dividend of every stock; if False, the yields are kept as retrieved.
 
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[contains(@id, 'dividendsHistoryData')]")
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`list` - stocks_dividends:
+            The resulting :obj:`pandas.DataFrame` contains a row per dividend of every introduced stock, in the
+            same order, with the columns of `get_stock_dividends` preceded by the `Stock Symbol` and `Country`
+            columns and followed by the `Error` column, which is null for the stocks whose dividends were
+            retrieved, while the rest of stocks have a single row with null dividend columns; it can also be
+            returned as a :obj:`list` of :obj:`dict`, if argument `as_json=True`.
 
-    if path_:
-        more_results_id = path_[0].get("id").replace("dividendsHistoryData", "")
+            So on, the resulting :obj:`pandas.DataFrame` will look like::
 
-        path_ = root_.xpath(
-            ".//table[@id='dividendsHistoryData" + str(more_results_id) + "']/tbody/tr"
-        )
+                  Stock Symbol Country       Date  Dividend  ... Payment Date  Yield Error
+                0         BBVA   spain 2019-10-11    0.2600  ...   2019-10-15   5.67  None
+                1         BBVA   spain 2019-04-08    0.2600  ...   2019-04-10   5.53  None
+                2          SAN   spain 2019-10-30    0.1000  ...   2019-11-01   2.71  None
 
-        objs = list()
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or errored.
 
-        type_values = {
-            "1": "monthly",
-            "2": "quarterly",
-            "3": "semi_annual",
-            "4": "annual",
-            "5": "trailing_twelve_months",
-        }
+    Examples:
+        >>> data = investpy.get_stocks_dividends(stocks=['BBVA', ('AAPL', 'united states')], country='spain')
+        >>> data.groupby('Stock Symbol')['Dividend'].sum()
 
-        if path_:
-            last_timestamp = path_[-1].get("event_timestamp")
-
-            for elements_ in path_:
-                dividend_date = (
-                    dividend_value
-                ) = dividend_type = dividend_payment_date = dividend_yield = None
-                for element_ in elements_.xpath(".//td"):
-                    if element_.get("class"):
-                        if element_.get("class").__contains__("first"):
-                            dividend_date = datetime.strptime(
-                                str(
-                                    datetime.fromtimestamp(
-                                        int(element_.get("data-value"))
-                                    ).date()
-                                ),
-                                "%Y-%m-%d",
-                            )
-                            dividend_value = float(
-                                element_.getnext().text_content().replace(",", "")
-                            )
-                        if element_.get("data-value") in type_values.keys():
-                            dividend_type = type_values[element_.get("data-value")]
-                            try:
-                                value = int(element_.getnext().get("data-value"))
-                                dividend_payment_date = datetime.strptime(
-                                    str(datetime.fromtimestamp(value).date()),
-                                    "%Y-%m-%d",
-                                )
-                            except:
-                                dividend_payment_date = None
-                            next_element_ = element_.getnext()
-                            dividend_yield = next_element_.getnext().text_content()
-
-                obj = {
-                    "Date": dividend_date,
-                    "Dividend": dividend_value,
-                    "Type": dividend_type,
-                    "Payment Date": dividend_payment_date,
-                    "Yield": dividend_yield,
-                }
+    """
 
-                objs.append(obj)
+    if not isinstance(stocks, (list, tuple)) or len(stocks) == 0:
+        raise ValueError(
+            "ERR#0151: stocks argument can just be a non empty list of stock symbols."
+        )
 
-            flag = True
+    if country is not None and not isinstance(country, str):
+        raise ValueError("ERR#0025: specified country value not valid.")
 
-            while flag is True:
-                headers = {
-                    "User-Agent": random_user_agent(),
-                    "X-Requested-With": "XMLHttpRequest",
-                    "Accept": "text/html",
-                    "Accept-Encoding": "gzip, deflate",
-                    "Connection": "keep-alive",
-                }
+    if not isinstance(as_json, bool):
+        raise ValueError(
+            "ERR#0002: as_json argument can just be True or False, bool type."
+        )
 
-                params = {
-                    "pairID": int(more_results_id),
-                    "last_timestamp": int(last_timestamp),
-                }
+    check_workers(max_workers, None)
 
-                url = "https://www.investing.com/equities/MoreDividendsHistory"
-
-                req = requests.post(url=url, headers=headers, params=params)
-
-                if req.status_code != 200:
-                    raise ConnectionError(
-                        "ERR#0015: error " + str(req.status_code) + ", try again later."
-                    )
-
-                res = req.json()
-
-                if res["hasMoreHistory"] is False:
-                    flag = False
-
-                if res["hasMoreHistory"] is None or not res["historyRows"]:
-                    break
-
-                root_ = fromstring(res["historyRows"])
-                path_ = root_.xpath(".//tr")
-
-                if path_:
-                    last_timestamp = path_[-1].get("event_timestamp")
-
-                    for elements_ in path_:
-                        dividend_date = (
-                            dividend_value
-                        ) = (
-                            dividend_type
-                        ) = dividend_payment_date = dividend_yield = None
-                        for element_ in elements_.xpath(".//td"):
-                            if element_.get("class"):
-                                if element_.get("class").__contains__("first"):
-                                    dividend_date = datetime.strptime(
-                                        str(
-                                            datetime.fromtimestamp(
-                                                int(element_.get("data-value"))
-                                            ).date()
-                                        ),
-                                        "%Y-%m-%d",
-                                    )
-                                    dividend_value = float(
-                                        element_.getnext()
-                                        .text_content()
-                                        .replace(",", "")
-                                    )
-                                if element_.get("data-value") in type_values.keys():
-                                    dividend_type = type_values[
-                                        element_.get("data-value")
-                                    ]
-                                    try:
-                                        value = int(
-                                            element_.getnext().get("data-value")
-                                        )
-                                        dividend_payment_date = datetime.strptime(
-                                            str(datetime.fromtimestamp(value).date()),
-                                            "%Y-%m-%d",
-                                        )
-                                    except:
-                                        dividend_payment_date = None
-                                    next_element_ = element_.getnext()
-                                    dividend_yield = (
-                                        next_element_.getnext().text_content()
-                                    )
-                        obj = {
-                            "Date": dividend_date,
-                            "Dividend": dividend_value,
-                            "Type": dividend_type,
-                            "Payment Date": dividend_payment_date,
-                            "Yield": dividend_yield,
-                        }
-
-                        objs.append(obj)
-
-        df = pd.DataFrame(objs)
-        return df
-    else:
-        raise RuntimeError(
-            "ERR#0061: introduced stock has no dividend's data to display."
+    if not isinstance(incremental, bool):
+        raise ValueError(
+            "ERR#0154: incremental argument can just be True or False, bool type."
+        )
+
+    if not isinstance(numeric, bool):
+        raise ValueError(
+            "ERR#0153: numeric argument can just be True or False, bool type."
         )
 
+    resolved = resolve_instruments(DIVIDENDS_SCHEMA, stocks, country=country)
+
+    result = retrieve_dividends(
+        resolved,
+        DIVIDENDS,
+        incremental=incremental,
+        max_workers=max_workers,
+        numeric=numeric,
+    )
+
+    if as_json is True:
+        return json.loads(result.to_json(orient="records", date_format="iso"))
+    elif as_json is False:
+        return result
+
 
 def get_stock_information(stock, country, as_json=False):
     """
@@ -1310,24 +1175,111 @@ def get_stock_information(stock, country, as_json=False):
         "symbol",
     ]
 
-    url = f"https://www.investing.com/equities/{tag}"
+    result = _parse_stock_information(fetch_page(tag, "equities"), stock)
 
-    headers = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    if as_json is True:
+        json_ = result.iloc[0].to_dict()
+        return json_
+    elif as_json is False:
+        return result
 
-    req = requests.get(url, headers=headers)
 
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
+def get_stocks_information(
+    stocks, country=None, as_json=False, max_workers=8, processes=None, numeric=True
+):
+    """
+    This function retrieves the information of several stocks at once, as retrieved by `get_stock_information` for
+    every stock, so that the stocks are resolved against the static data file just once, their information pages
+    are requested concurrently through the session shared by every request sent to Investing.com and then parsed,
+    optionally in a pool of processes. Note that the stocks that could not be found, retrieved or parsed do not
+    raise any error, but their error message is reported in the `Error` column instead.
+
+    Args:
+        stocks (:obj:`list`):
+            symbols of the stocks to retrieve the information from, or tuples of symbol and
+            country, so that stocks from different countries can be introduced together.
+        country (:obj:`str`, optional): name of the country of the stocks introduced with no country.
+        as_json (:obj:`bool`, optional):
+            optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        max_workers (:obj:`int`, optional): maximum number of information pages requested concurrently.
+        processes (:obj:`int`, optional):
+            number of processes used to parse the information pages, which is CPU bound, if None they are
+            parsed in the current process.
+        numeric (:obj:`bool`, optional):
+            whether to convert the information fields into numeric columns or not, so that the suffixes (`K`, `M`,
+            `B`, `T`) and the percentages are applied and the ranges are split into their low and high values, see
+            `investpy.utils.information.normalize_information`; if False, the fields are kept as retrieved.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`list` - stocks_information:
+            The resulting :obj:`pandas.DataFrame` contains a row per introduced stock, in the same order,
+            with the information fields of `get_stock_information` plus the `Error` column, which is null for
+            the stocks whose information was successfully retrieved; it can also be returned as a
+            :obj:`list` of :obj:`dict`, if argument `as_json=True`.
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or errored.
+
+    Examples:
+        >>> data = investpy.get_stocks_information(stocks=['BBVA', 'SAN'], country='spain')
+        >>> data[data['Error'].isnull()]
+
+    """
+
+    if not isinstance(stocks, (list, tuple)) or len(stocks) == 0:
+        raise ValueError(
+            "ERR#0151: stocks argument can just be a non empty list of stock symbols."
         )
 
-    root_ = fromstring(req.text)
+    if country is not None and not isinstance(country, str):
+        raise ValueError("ERR#0025: specified country value not valid.")
+
+    if not isinstance(as_json, bool):
+        raise ValueError(
+            "ERR#0002: as_json argument can just be True or False, bool type."
+        )
+
+    check_workers(max_workers, processes)
+
+    if not isinstance(numeric, bool):
+        raise ValueError(
+            "ERR#0153: numeric argument can just be True or False, bool type."
+        )
+
+    result = retrieve_information(
+        INFORMATION["stock"],
+        stocks,
+        _parse_stock_information,
+        country=country,
+        max_workers=max_workers,
+        processes=processes,
+        numeric=numeric,
+    )
+
+    if as_json is True:
+        return json.loads(result.to_json(orient="records"))
+    elif as_json is False:
+        return result
+
+
+def _parse_stock_information(html, stock):
+    """
+    This function parses the information page of a stock retrieved from Investing.com, so that it can be
+    used by both `get_stock_information` and `get_stocks_information`.
+
+    Args:
+        html (:obj:`str`): content of the information page of the stock.
+        stock (:obj:`str`): symbol of the stock, as shown in the resulting information.
+
+    Returns:
+        :obj:`pandas.DataFrame` - stock_information: information of the stock, as a single row.
+
+    Raises:
+        RuntimeError: raised if scraping process failed while running.
+
+    """
+
+    root_ = fromstring(html)
     path_ = root_.xpath("//dl[contains(@class, 'grid')]/div")
 
     result = pd.DataFrame(
@@ -1387,11 +1339,7 @@ def get_stock_information(stock, country, as_json=False):
 
     result.replace({"N/A": None}, inplace=True)
 
-    if as_json is True:
-        json_ = result.iloc[0].to_dict()
-        return json_
-    elif as_json is False:
-        return result
+    return result
 
 
 def get_stocks_overview(country, as_json=False, n_results=100):
@@ -1502,11 +1450,18 @@ def get_stocks_overview(country, as_json=False, n_results=100):
     results = list()
 
     if len(table) > 0:
+        # Symbol and currency of the first stock of every name, instead of looking
+        # them up per row
+        details = (
+            stocks.drop_duplicates(subset="name").set_index("name").to_dict("index")
+        )
+        # Names not found get the first stock, as `idxmax` did when nothing matched
+        missing = stocks.iloc[0].to_dict()
+
         for row in table[:n_results]:
-            id_ = row.get("id").replace("pair_", "")
-            country_check = (
-                row.xpath(".//td[@class='flag']/span")[0].get("title").lower()
-            )
+            cells = overview_cells(row)
+
+            country_check = cells["flag"].find("span").get("title").lower()
 
             if country_check == "bosnia-herzegovina":
                 country_check = "bosnia"
@@ -1517,26 +1472,16 @@ def get_stocks_overview(country, as_json=False, n_results=100):
             elif country_check == "cote d'ivoire":
                 country_check = "ivory coast"
 
-            name = (
-                row.xpath(".//td[contains(@class, 'elp')]/a")[0].text_content().strip()
-            )
-
-            pid = "pid-" + id_
+            name = cells["elp"].find("a").text_content().strip()
 
-            last = row.xpath(".//td[@class='" + pid + "-last']")[0].text_content()
-            high = row.xpath(".//td[@class='" + pid + "-high']")[0].text_content()
-            low = row.xpath(".//td[@class='" + pid + "-low']")[0].text_content()
+            last = cells["last"].text_content()
+            high = cells["high"].text_content()
+            low = cells["low"].text_content()
 
-            pc = row.xpath(".//td[contains(@class, '" + pid + "-pc')]")[
-                0
-            ].text_content()
-            pcp = row.xpath(".//td[contains(@class, '" + pid + "-pcp')]")[
-                0
-            ].text_content()
+            pc = cells["pc"].text_content()
+            pcp = cells["pcp"].text_content()
 
-            turnover = row.xpath(".//td[contains(@class, '" + pid + "-turnover')]")[
-                0
-            ].text_content()
+            turnover = cells["turnover"].text_content()
 
             if turnover.__contains__("K"):
                 turnover = float(turnover.replace("K", "").replace(",", "")) * 1e3
@@ -1545,17 +1490,19 @@ def get_stocks_overview(country, as_json=False, n_results=100):
             elif turnover.__contains__("B"):
                 turnover = float(turnover.replace("B", "").replace(",", "")) * 1e9
 
+            stock = details.get(name, missing)
+
             data = {
                 "country": country_check,
                 "name": name,
-                "symbol": stocks.loc[(stocks["name"] == name).idxmax(), "symbol"],
+                "symbol": stock["symbol"],
                 "last": float(last.replace(",", "")),
                 "high": float(high.replace(",", "")),
                 "low": float(low.replace(",", "")),
                 "change": pc,
                 "change_percentage": pcp,
                 "turnover": int(turnover),
-                "currency": stocks.loc[(stocks["name"] == name).idxmax(), "currency"],
+                "currency": stock["currency"],
             }
 
             results.append(data)
@@ -1586,13 +1533,14 @@ def get_stock_financial_summary(
         country (:obj:`str`): name of the country from where the introduced stock symbol is.
         summary_type (:obj:`str`, optional):
             type of the financial summary table to retrieve, default value is `income_statement`, but all the
-            available types are: `income_statement`, `cash_flow_statement` and `balance_sheet`.
+            available types are: `income_statement`, `cash_flow_statement` and `balance_sheet`; or `all` to
+            retrieve every financial summary table at once, since all of them are sent in the same response.
         period (:obj:`str`, optional):
             period range of the financial summary table to rertieve, detault value is `annual`, but all the
             available periods are: `annual` and `quarterly`.
 
     Returns:
-        :obj:`pandas.DataFrame` - financial_summary:
+        :obj:`pandas.DataFrame` or :obj:`dict` - financial_summary:
             The resulting :obj:`pandas.DataFrame` contains the table of the requested financial summary from the
             introduced stock, so the fields/column names may vary, since it depends on the summary_type introduced.
             So on, the returned table will have the following format/structure::
@@ -1601,6 +1549,12 @@ def get_stock_financial_summary(
                 -----||---------|---------|-----|---------
                 xxxx || xxxxxxx | xxxxxxx | xxx | xxxxxxx
 
+            If `summary_type='all'`, a :obj:`dict` containing the :obj:`pandas.DataFrame` of every financial
+            summary type is returned instead, whose keys are the financial summary types. Note that the response
+            sent by Investing.com is kept in memory per stock and period, see
+            `investpy.utils.constant.FINANCIAL_SUMMARY_TTL`, so that retrieving another financial summary type
+            of the same stock and period does not send any other request.
+
     Raises:
         ValueError: raised if any of the introduced parameters is not valid or errored.
         FileNotFoundError: raised if the stocks.csv file was not found.
@@ -1618,6 +1572,9 @@ def get_stock_financial_summary(
         2017-09-30         229234         88186             61344       48351
         2016-09-24         215639         84263             60024       45687
 
+        >>> summaries = investpy.get_stock_financial_summary(stock='AAPL', country='United States', summary_type='all')
+        >>> summaries['balance_sheet'].head()
+
     """
 
     if not stock:
@@ -1642,10 +1599,10 @@ def get_stock_financial_summary(
 
     summary_type = unidecode(summary_type.strip().lower())
 
-    if summary_type not in cst.FINANCIAL_SUMMARY_TYPES.keys():
+    if summary_type not in cst.FINANCIAL_SUMMARY_TYPES.keys() and summary_type != "all":
         raise ValueError(
             "ERR#0134: introduced summary_type is not valid, since available values"
-            " are: " + ", ".join(cst.FINANCIAL_SUMMARY_TYPES.keys())
+            " are: " + ", ".join(list(cst.FINANCIAL_SUMMARY_TYPES.keys()) + ["all"])
         )
 
     if period is None:
@@ -1697,60 +1654,114 @@ def get_stock_financial_summary(
         (stocks["symbol"].apply(unidecode).str.lower() == stock).idxmax(), "id"
     ]
 
-    headers = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    # Every financial summary type is sent in the same response, kept for the rest
+    html = fetch_financial_summary(id_, period, FINANCIAL_SUMMARIES)
 
-    params = {
-        "action": "change_report_type",
-        "pid": id_,
-        "financial_id": id_,
-        "ratios_id": id_,
-        "period_type": cst.FINANCIAL_SUMMARY_PERIODS[period],
-    }
+    tables = summary_tables(html)
 
-    url = "https://www.investing.com/instruments/Financials/changesummaryreporttypeajax"
+    if summary_type == "all":
+        return {
+            type_: parse_financial_summary(tables[index])
+            for type_, index in cst.FINANCIAL_SUMMARY_TYPES.items()
+        }
 
-    req = requests.get(url, params=params, headers=headers)
+    return parse_financial_summary(tables[cst.FINANCIAL_SUMMARY_TYPES[summary_type]])
 
-    if req.status_code != 200:
-        raise ConnectionError(
-            "ERR#0015: error " + str(req.status_code) + ", try again later."
+
+def get_stocks_financial_summary(
+    stocks, country=None, periods=("annual", "quarterly"), max_workers=8, resume=None
+):
+    """
+    This function retrieves every financial summary table (income statement, balance sheet and cash flow
+    statement) of several stocks and periods at once, as retrieved by `get_stock_financial_summary`, so that the
+    stocks are resolved against the static data file just once, a single request is sent per stock and period
+    (since every financial summary table is sent in the same response), with up to `max_workers` requests sent
+    concurrently, and every table is assembled into a single :obj:`pandas.DataFrame` in long format. Additionally,
+    if `resume` is the path of a directory, the financial summaries of every stock and period are stored in that
+    directory as soon as they are retrieved, so that if the job is interrupted, calling this function again with
+    the same `resume` directory just retrieves the ones that were not retrieved yet. Note that the stocks that
+    could not be found or retrieved do not raise any error, but their error message is reported in the `Error`
+    column instead.
+
+    Args:
+        stocks (:obj:`list`):
+            symbols of the stocks to retrieve the financial summaries from, or tuples of symbol and
+            country, so that stocks from different countries can be introduced together.
+        country (:obj:`str`, optional): name of the country of the stocks introduced with no country.
+        periods (:obj:`list` or :obj:`str`, optional):
+            periods of the financial summaries to retrieve, by default both `annual` and `quarterly`.
+        max_workers (:obj:`int`, optional): maximum number of requests sent concurrently.
+        resume (:obj:`str`, optional):
+            directory where the financial summaries of every stock and period are stored as soon as they are
+            retrieved, so that they are not retrieved again, if None, they are not stored.
+
+    Returns:
+        :obj:`pandas.DataFrame` - stocks_financial_summary:
+            The resulting :obj:`pandas.DataFrame` contains a row per statement, field and date of every
+            introduced stock and period, in the same order, whose values are `float64`, plus the `Error`
+            column, which is null for the stocks and periods whose financial summaries were retrieved, while
+            the rest of them have a single row with null statement columns.
+
+            So on, the resulting :obj:`pandas.DataFrame` will look like::
+
+                  Stock Symbol        Country  Period         Statement          Field       Date     Value Error
+                0         AAPL  united states  annual  income_statement  Total Revenue 2019-09-28  260174.0  None
+                1         AAPL  united states  annual  income_statement  Total Revenue 2018-09-29  265595.0  None
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or errored.
+
+    Examples:
+        >>> data = investpy.get_stocks_financial_summary(stocks=['AAPL', 'MSFT'], country='united states', resume='fundamentals')
+        >>> data.pivot_table(index=['Stock Symbol', 'Date'], columns='Field', values='Value')
+
+    """
+
+    if not isinstance(stocks, (list, tuple)) or len(stocks) == 0:
+        raise ValueError(
+            "ERR#0151: stocks argument can just be a non empty list of stock symbols."
         )
 
-    root = fromstring(req.text)
-    tables = root.xpath(
-        ".//div[@class='companySummaryIncomeStatement']        /table[contains(@class,"
-        " 'companyFinancialSummaryTbl')]"
-    )
+    if country is not None and not isinstance(country, str):
+        raise ValueError("ERR#0025: specified country value not valid.")
 
-    data = {"Date": list()}
+    if isinstance(periods, str):
+        periods = [periods]
+
+    if (
+        not isinstance(periods, (list, tuple))
+        or len(periods) == 0
+        or not all(
+            isinstance(period, str)
+            and unidecode(period.strip().lower()) in cst.FINANCIAL_SUMMARY_PERIODS
+            for period in periods
+        )
+    ):
+        raise ValueError(
+            "ERR#0137: introduced period is not valid, since available values are: "
+            + ", ".join(cst.FINANCIAL_SUMMARY_PERIODS.keys())
+        )
 
-    table = tables[cst.FINANCIAL_SUMMARY_TYPES[summary_type]]
+    periods = list(
+        dict.fromkeys(unidecode(period.strip().lower()) for period in periods)
+    )
 
-    for element in table.xpath(".//thead")[0].xpath(".//th"):
-        if element.get("class") is None:
-            data["Date"].append(
-                datetime.strptime(element.text_content().strip(), "%b %d, %Y")
-            )
+    check_workers(max_workers, None)
 
-    for element in table.xpath(".//tbody")[0].xpath(".//tr"):
-        curr_row = None
-        for row in element.xpath(".//td"):
-            if row.get("class") is not None:
-                curr_row = row.text_content().strip()
-                data[curr_row] = list()
-                continue
-            data[curr_row].append(float(row.text_content().strip()))
+    if resume is not None and not isinstance(resume, str):
+        raise ValueError(
+            "ERR#0155: resume argument can just be None or the path of a directory."
+        )
 
-    dataset = pd.DataFrame(data)
-    dataset.set_index("Date", inplace=True)
+    resolved = resolve_instruments(FINANCIALS_SCHEMA, stocks, country=country)
 
-    return dataset
+    return retrieve_financial_summaries(
+        resolved,
+        periods,
+        FINANCIAL_SUMMARIES,
+        store=None if resume is None else Store(path=resume),
+        max_workers=max_workers,
+    )
 
 
 def search_stocks(by, value):
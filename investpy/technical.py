@@ -9,6 +9,7 @@ from unidecode import unidecode
 
 from .utils import constant as cst
 from .utils.extra import random_user_agent, resource_to_data
+from .utils.parsers import technical_rows
 
 
 def technical_indicators(name, country, product_type, interval="daily"):
@@ -172,25 +173,14 @@ def technical_indicators(name, country, product_type, interval="daily"):
             "ERR#0015: error " + str(req.status_code) + ", try again later."
         )
 
-    root = fromstring(req.text)
-    table = root.xpath(".//table[contains(@class, 'technicalIndicatorsTbl')]/tbody/tr")
-
-    tech_indicators = list()
-
-    for row in table:
-        for value in row.xpath("td"):
-            if value.get("class").__contains__("symbol"):
-                tech_ind = value.text_content().strip()
-                tech_val = float(value.getnext().text_content().strip())
-                tech_sig = value.getnext().getnext().text_content().strip().lower()
-
-                tech_indicators.append(
-                    {
-                        "technical_indicator": tech_ind,
-                        "value": tech_val,
-                        "signal": tech_sig.replace(" ", "_"),
-                    }
-                )
+    tech_indicators = [
+        {
+            "technical_indicator": tech_ind,
+            "value": float(tech_val),
+            "signal": tech_sig.lower().replace(" ", "_"),
+        }
+        for tech_ind, tech_val, tech_sig in technical_rows(req.text)
+    ]
 
     return pd.DataFrame(tech_indicators)
 
@@ -0,0 +1,179 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import numpy as np
+import pandas as pd
+
+
+def align_dividends(dates, dividends):
+    """
+    This function aligns the dividends of a financial product to its price dates, so that every dividend is
+    assigned to the first price date on or after its ex-dividend date, which is the first date on which the
+    price no longer includes the dividend. The dividends before the first or after the last price date are
+    discarded, and the dividends assigned to the same price date are added up.
+
+    Args:
+        dates (:obj:`numpy.ndarray`): price dates as `datetime64[D]` values, sorted ascending.
+        dividends (:obj:`pandas.DataFrame`):
+            dividends as returned by `investpy.get_stock_dividends`, so containing at least the `Date` and
+            `Dividend` columns, or None if the financial product has no dividends.
+
+    Returns:
+        :obj:`numpy.ndarray` - values:
+            The resulting :obj:`numpy.ndarray` contains the dividend amount of every price date, which is 0
+            for the dates with no dividends.
+
+    """
+
+    values = np.zeros(len(dates), dtype="float64")
+
+    if dividends is None or len(dividends) == 0 or len(dates) == 0:
+        return values
+
+    dividends = dividends.dropna(subset=["Date", "Dividend"])
+
+    div_dates = dividends["Date"].to_numpy().astype("datetime64[D]")
+    amounts = dividends["Dividend"].to_numpy(dtype="float64")
+
+    index = np.searchsorted(dates, div_dates, side="left")
+    mask = (div_dates > dates[0]) & (index < len(dates))
+
+    np.add.at(values, index[mask], amounts[mask])
+
+    return values
+
+
+def adjustment_factors(close, dividends):
+    """
+    This function computes the dividend adjustment factors of a price series, or of every column of a panel
+    of price series, using vectorized cumulative products. Every dividend paid on a date `t` defines a factor
+    `1 - dividend / close[t - 1]`, and the adjustment factor of every date is the product of the factors of all
+    the dividends paid after it, so that the adjusted close is `close * factor`.
+
+    Args:
+        close (:obj:`numpy.ndarray`): close values, sorted ascending, either of shape (n,) or (n, k).
+        dividends (:obj:`numpy.ndarray`): dividend amounts aligned to the close values, with the same shape.
+
+    Returns:
+        :obj:`numpy.ndarray` - factors: adjustment factors, with the same shape as the introduced close values.
+
+    """
+
+    previous = np.empty_like(close, dtype="float64")
+    previous[0] = np.nan
+    previous[1:] = close[:-1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factors = np.where(dividends > 0, 1 - dividends / previous, 1.0)
+
+    factors[~np.isfinite(factors)] = 1.0
+
+    # Product of the factors of the dividends paid strictly after every date
+    cumulative = np.cumprod(factors[::-1], axis=0)[::-1]
+
+    result = np.ones_like(cumulative)
+    result[:-1] = cumulative[1:]
+
+    return result
+
+
+def total_return_index(close, dividends):
+    """
+    This function computes the total return index of a price series, or of every column of a panel of price
+    series, which is the value of holding the financial product since the first date reinvesting every
+    dividend on the date it is paid, so `index[t] = index[t - 1] * (close[t] + dividend[t]) / close[t - 1]`,
+    starting at the first close value.
+
+    Args:
+        close (:obj:`numpy.ndarray`): close values, sorted ascending, either of shape (n,) or (n, k).
+        dividends (:obj:`numpy.ndarray`): dividend amounts aligned to the close values, with the same shape.
+
+    Returns:
+        :obj:`numpy.ndarray` - index: total return index, with the same shape as the introduced close values.
+
+    """
+
+    returns = np.ones_like(close, dtype="float64")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns[1:] = (close[1:] + dividends[1:]) / close[:-1]
+
+    returns[~np.isfinite(returns)] = 1.0
+
+    return close[0] * np.cumprod(returns, axis=0)
+
+
+def adjust_columns(columns, dividends, adjusted=False, total_return=False):
+    """
+    This function adds the `Adj Close` and/or the `Total Return` columns to the parsed columns of historical
+    data of a financial product, computed from its dividends, see `adjustment_factors` and `total_return_index`.
+
+    Args:
+        columns (:obj:`dict`): parsed columns of historical data, sorted descending (newest first).
+        dividends (:obj:`pandas.DataFrame`): dividends as returned by `investpy.get_stock_dividends` or None.
+        adjusted (:obj:`bool`, optional): whether to add the dividend-adjusted close values or not.
+        total_return (:obj:`bool`, optional): whether to add the total return index or not.
+
+    Returns:
+        :obj:`dict` - columns: the introduced columns plus the requested ones, sorted descending (newest first).
+
+    """
+
+    dates = columns["Date"][::-1]
+    close = columns["Close"][::-1]
+
+    values = align_dividends(dates, dividends)
+
+    columns = dict(columns)
+
+    if adjusted is True:
+        columns["Adj Close"] = (close * adjustment_factors(close, values))[::-1]
+
+    if total_return is True:
+        columns["Total Return"] = total_return_index(close, values)[::-1]
+
+    return columns
+
+
+def adjust_panel(close, dividends, total_return=False):
+    """
+    This function adjusts a panel of close values of several financial products at once, where every column
+    contains the close values of a financial product, so that the dividend-adjusted close values (or the total
+    return index) of all of them are computed with a single vectorized operation. The missing values of every
+    column are kept as missing, but they do not break the cumulative products of the rest of the column.
+
+    Args:
+        close (:obj:`pandas.DataFrame`): close values indexed by date, with a column per financial product.
+        dividends (:obj:`dict`):
+            dividends of every financial product, as returned by `investpy.get_stock_dividends`, where the keys
+            are the column names of the introduced close values; columns with no dividends can be left out.
+        total_return (:obj:`bool`, optional):
+            if True, the total return index is returned instead of the dividend-adjusted close values.
+
+    Returns:
+        :obj:`pandas.DataFrame` - panel:
+            The resulting :obj:`pandas.DataFrame` contains the dividend-adjusted close values or the total return
+            index of every financial product, with the same index and columns as the introduced close values.
+
+    """
+
+    close = close.sort_index()
+
+    dates = close.index.values.astype("datetime64[D]")
+    missing = close.isna().to_numpy()
+
+    # Missing values are filled so that they do not break the cumulative products
+    values = close.ffill().bfill().to_numpy(dtype="float64")
+
+    amounts = np.zeros(values.shape, dtype="float64")
+    for index, column in enumerate(close.columns):
+        amounts[:, index] = align_dividends(dates, dividends.get(column))
+
+    if total_return is True:
+        result = total_return_index(values, amounts)
+    else:
+        result = values * adjustment_factors(values, amounts)
+
+    result[missing] = np.nan
+
+    return pd.DataFrame(result, index=close.index, columns=close.columns)
@@ -0,0 +1,71 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+
+class Cache(object):
+    """In-memory cache of the data retrieved from Investing.com during the current process.
+
+    This class is a thread-safe mapping whose entries expire after `ttl` seconds and where the least
+    recently used entry is evicted when it contains more than `maxsize` entries, so that it can be
+    shared by any function retrieving data from Investing.com without growing indefinitely.
+
+    Args:
+        ttl (:obj:`int`, optional): seconds after which an entry expires, if None, entries never expire.
+        maxsize (:obj:`int`, optional): maximum number of entries, if None, the cache size is unbounded.
+
+    """
+
+    def __init__(self, ttl=None, maxsize=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return default
+
+            expires, value = entry
+
+            if expires is not None and expires < time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        return self.get(key, default=self) is not self
+
+    def __len__(self):
+        return len(self._entries)
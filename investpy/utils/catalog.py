@@ -0,0 +1,167 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+from collections import Counter
+from threading import Lock
+
+from unidecode import unidecode
+
+from .constant import ETF_COUNTRIES
+from .extra import resource_to_data
+from .search_obj import SearchObj
+
+# Static data files indexed per product type, as named by `investpy.search_quotes`, along
+# with the path of their urls in Investing.com, which is followed by the tag
+CATALOGS = {
+    "stocks": ("stocks.csv", "equities"),
+    "etfs": ("etfs.csv", "etfs"),
+    "indices": ("indices.csv", "indices"),
+    "bonds": ("bonds.csv", "rates-bonds"),
+    "commodities": ("commodities.csv", "commodities"),
+    "certificates": ("certificates.csv", "certificates"),
+    "cryptos": ("cryptos.csv", "crypto"),
+    "currencies": ("currency_crosses.csv", "currencies"),
+}
+
+# Columns of the static data files used to build every `investpy.utils.search_obj.SearchObj`
+CATALOG_COLUMNS = ["id", "name", "symbol", "country", "tag", "stock_exchange", "isin"]
+
+# Country code per country, used to tell the home listings (whose ISIN was issued in the country where
+# they are listed) from the rest of listings of the same financial product, see `catalog_index`
+COUNTRY_CODES = {value["country"]: value["code"] for value in ETF_COUNTRIES}
+
+_index = None
+_index_lock = Lock()
+
+
+def catalog_index():
+    """
+    This function indexes the financial products of every static data file of investpy by their lower case
+    symbol and name, so that the financial products matching a text can be looked up locally instead of
+    searching them in Investing.com. Since the static data files do not change, they are just read and indexed
+    once per process, the first time this function is called.
+
+    Note that the currency crosses have no symbol in their static data file, so their name is used instead
+    (e.g. `EUR/USD`), as in the search results of Investing.com; while the exchange is just known for the
+    financial products whose static data file contains it (e.g. ETFs), so it is None for the rest (e.g. stocks).
+
+    Returns:
+        :obj:`dict` - index:
+            The resulting :obj:`dict` contains the :obj:`list` of matching financial products per lower case
+            symbol and name, ranked close to how Investing.com does, i.e. the home listings first and, among
+            them, the ones whose ISIN is listed in more countries (e.g. BBVA in Spain before its ADR in the
+            United States and both before BBVA in Mexico), and the rest in the order of the static data files,
+            as tuples of their country in the static data file and the arguments of their
+            :obj:`investpy.utils.search_obj.SearchObj`.
+
+    """
+
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = dict()
+
+                for pair_type, (resource, path) in CATALOGS.items():
+                    data = resource_to_data(path_to_data=resource)
+
+                    data = data[(data["id"].astype(str) != "") & (data["tag"] != "")]
+
+                    columns = {
+                        column: (
+                            data[column].tolist()
+                            if column in data.columns
+                            else [None] * len(data)
+                        )
+                        for column in CATALOG_COLUMNS
+                    }
+
+                    # The symbols and names are normalized at once per static data file
+                    keys = {
+                        column: [
+                            unidecode(value).strip().lower() if value else None
+                            for value in columns[column]
+                        ]
+                        for column in ["symbol", "name"]
+                    }
+
+                    listings = Counter(isin for isin in columns["isin"] if isin)
+
+                    for row in zip(*columns.values(), keys["symbol"], keys["name"]):
+                        id_, name, symbol, country, tag, exchange, isin, *names = row
+
+                        product = {
+                            "id_": int(id_),
+                            "name": name,
+                            "symbol": (
+                                name if pair_type == "currencies" else symbol or None
+                            ),
+                            "country": (
+                                None
+                                if pair_type in ["cryptos", "commodities"]
+                                else country or None
+                            ),
+                            "tag": "/" + path + "/" + tag,
+                            "pair_type": pair_type,
+                            "exchange": exchange or None,
+                        }
+
+                        code = COUNTRY_CODES.get(country)
+                        home = bool(isin) and isin[:2].lower() == code
+                        rank = (not home, -listings[isin] if home else 0)
+
+                        for key in set(names):
+                            if key:
+                                index.setdefault(key, list()).append(
+                                    (rank, country or None, product)
+                                )
+
+                # The sort is stable, so the listings keep the order of the static data files otherwise
+                _index = {
+                    key: [
+                        (country, product)
+                        for _, country, product in sorted(
+                            products, key=lambda value: value[0]
+                        )
+                    ]
+                    for key, products in index.items()
+                }
+
+    return _index
+
+
+def search_catalog(text, pair_types=None, countries=None):
+    """
+    This function looks up the financial products whose symbol or name is exactly the introduced text (no
+    matter the case or the accents) in the static data files of investpy, see `catalog_index`, so that they
+    are found with no request to Investing.com.
+
+    Args:
+        text (:obj:`str`): symbol or name of the financial products to look up.
+        pair_types (:obj:`list` of :obj:`str`, optional): product types to look up, e.g. `stocks`, if None, every one.
+        countries (:obj:`list` of :obj:`str`, optional): lower case countries to look up, if None, every one.
+
+    Returns:
+        :obj:`list` of :obj:`investpy.utils.search_obj.SearchObj` - search_results:
+            financial products matching the introduced text, with the home listings first and the rest in the
+            order of the static data files, with no duplicated ids.
+
+    """
+
+    search_results = dict()
+
+    products = catalog_index().get(unidecode(text.strip().lower()), list())
+
+    for country, product in products:
+        if pair_types is not None and product["pair_type"] not in pair_types:
+            continue
+
+        if countries is not None and country not in countries:
+            continue
+
+        if product["id_"] not in search_results:
+            # A new instance every time, since its data is filled by its own methods
+            search_results[product["id_"]] = SearchObj(**product)
+
+    return list(search_results.values())
@@ -482,6 +482,51 @@ INTERVAL_FILTERS = {
 # https://www.investing.com/funds/vanguard-500-index-admiral-technical
 FUNDS_INTERVAL_FILTERS = {"daily": 60 * 60 * 24, "weekly": "week", "monthly": "month"}
 
+# Default table extraction engine per endpoint, see `investpy.utils.parsers`
+PARSER_ENGINES = {"historical": "target", "technical": "target"}
+
+# Investing.com caps the rows of every historical data response, which is the reason why the daily
+# data was requested in windows of 19 years (19 years * ~261 trading days ~= 5000 rows); so on, the
+# window size of every interval is derived from its expected rows per year, see `plan_windows`
+HISTORICAL_ROWS_LIMIT = 5000
+HISTORICAL_ROWS_PER_YEAR = {"Daily": 261, "Weekly": 53, "Monthly": 12}
+
+# Maximum number of windows of the same historical data requested concurrently
+HISTORICAL_WORKERS = 4
+
+# Daily data kept in memory so that weekly/monthly data can be resampled locally, see `resample_columns`
+DAILY_DATA_TTL = 60 * 60
+DAILY_DATA_MAXSIZE = 64
+
+# Recent data kept in memory per product and interval, which is returned as is while it is fresh
+# (RECENT_DATA_FRESHNESS seconds), and then just refreshed with the bars newer than the last one kept
+RECENT_DATA_TTL = 60 * 60 * 24
+RECENT_DATA_FRESHNESS = 60
+RECENT_DATA_MAXSIZE = 1024
+
+# Stock dividends stored to compute adjusted closes and total return indices, which are returned as is while
+# they are fresh (DIVIDENDS_TTL seconds) and then just updated with the newer ones; if DIVIDENDS_PATH is set,
+# they are also pickled into that directory so that they are kept across processes
+DIVIDENDS_TTL = 60 * 60 * 12
+DIVIDENDS_MAXSIZE = 256
+DIVIDENDS_PATH = None
+
+# Responses of the financial summaries kept in memory per stock and period, since every financial summary
+# type is sent in the same response, see `get_stock_financial_summary`
+FINANCIAL_SUMMARY_TTL = 60 * 60 * 12
+FINANCIAL_SUMMARY_MAXSIZE = 128
+
+# Company profiles kept in memory per stock and language, which barely change, so they are kept for a week
+COMPANY_PROFILES_TTL = 60 * 60 * 24 * 7
+COMPANY_PROFILES_MAXSIZE = 4096
+
+# Responses of the search engine kept in memory per text and page, which just change when new products are listed
+SEARCH_TTL = 60 * 60
+SEARCH_MAXSIZE = 256
+
+# Maximum number of connections kept alive per host by the session shared by every request
+POOL_MAXSIZE = 32
+
 USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; U; Intel Mac OS X 10.5; en-US; rv:1.9.1b3) Gecko/20090305"
     " Firefox/3.1b3 GTB5",
@@ -0,0 +1,327 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import requests
+from lxml.html import fromstring
+from unidecode import unidecode
+
+from .extra import pooled_session, random_user_agent
+from .information import InformationSchema
+
+DIVIDENDS_URL = "https://www.investing.com/equities/"
+
+DIVIDEND_TYPES = {
+    "1": "monthly",
+    "2": "quarterly",
+    "3": "semi_annual",
+    "4": "annual",
+    "5": "trailing_twelve_months",
+}
+
+DIVIDEND_COLUMNS = ["Date", "Dividend", "Type", "Payment Date", "Yield"]
+
+# Stocks resolved as `get_stock_dividends` does, keeping their country
+DIVIDENDS_SCHEMA = InformationSchema(
+    "stock", "stocks.csv", "symbol", "equities", "Stock Symbol", True, args=["country"]
+)
+
+
+def sync_dividends(tag, key, store, incremental=False, session=None):
+    """
+    This function retrieves the dividends of a stock from Investing.com, so that the dividends page of the
+    stock is retrieved first and then the older dividends are retrieved page by page, from the newest to the
+    oldest, until there are no more dividends or, if `incremental` is True, until reaching the newest dividend
+    stored for the stock, so that just the dividends newer than the stored ones are retrieved. The resulting
+    dividends are stored for the stock, and if `incremental` is True, the stored ones are returned as is while
+    they are fresh, see :obj:`investpy.utils.store.Store`.
+
+    Args:
+        tag (:obj:`str`): tag used by Investing.com to identify the stock in its urls.
+        key (:obj:`tuple`): key of the dividends of the stock in the store, i.e. its country and symbol.
+        store (:obj:`investpy.utils.store.Store`): store of the dividends retrieved per stock.
+        incremental (:obj:`bool`, optional): whether to update the stored dividends or to retrieve every dividend.
+        session (:obj:`requests.Session`, optional): session used to send the requests, if None, `requests` is used.
+
+    Returns:
+        :obj:`pandas.DataFrame` - dividends: dividends of the stock, from the newest to the oldest.
+
+    Raises:
+        ConnectionError: raised if the connection to Investing.com errored (did not return HTTP 200).
+        RuntimeError: raised if the stock has no dividends.
+
+    """
+
+    session = requests if session is None else session
+
+    stored = store.get(key) if incremental is True else None
+
+    if stored is not None and store.fresh(key):
+        if stored.empty:
+            raise RuntimeError(
+                "ERR#0061: introduced stock has no dividend's data to display."
+            )
+
+        return stored.copy()
+
+    # Newest stored dividend, at which the older dividends stop being retrieved
+    newest = None if stored is None or stored.empty else stored["Date"].max()
+
+    headers = {
+        "User-Agent": random_user_agent(),
+        "X-Requested-With": "XMLHttpRequest",
+        "Accept": "text/html",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    req = session.get(url=DIVIDENDS_URL + str(tag) + "-dividends", headers=headers)
+
+    if req.status_code != 200:
+        raise ConnectionError(
+            "ERR#0015: error " + str(req.status_code) + ", try again later."
+        )
+
+    root_ = fromstring(req.text)
+    path_ = root_.xpath(".//table[contains(@id, 'dividendsHistoryData')]")
+
+    if not path_:
+        raise RuntimeError(
+            "ERR#0061: introduced stock has no dividend's data to display."
+        )
+
+    more_results_id = path_[0].get("id").replace("dividendsHistoryData", "")
+
+    path_ = root_.xpath(
+        ".//table[@id='dividendsHistoryData" + str(more_results_id) + "']/tbody/tr"
+    )
+
+    pages = list()
+
+    if path_:
+        last_timestamp = path_[-1].get("event_timestamp")
+
+        pages.append(parse_dividends(path_))
+
+        flag = not _reached(pages[-1], newest)
+
+        while flag is True:
+            headers = {
+                "User-Agent": random_user_agent(),
+                "X-Requested-With": "XMLHttpRequest",
+                "Accept": "text/html",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+
+            params = {
+                "pairID": int(more_results_id),
+                "last_timestamp": int(last_timestamp),
+            }
+
+            req = session.post(
+                url=DIVIDENDS_URL + "MoreDividendsHistory",
+                headers=headers,
+                params=params,
+            )
+
+            if req.status_code != 200:
+                raise ConnectionError(
+                    "ERR#0015: error " + str(req.status_code) + ", try again later."
+                )
+
+            res = req.json()
+
+            if res["hasMoreHistory"] is False:
+                flag = False
+
+            if res["hasMoreHistory"] is None or not res["historyRows"]:
+                break
+
+            path_ = fromstring(res["historyRows"]).xpath(".//tr")
+
+            if path_:
+                last_timestamp = path_[-1].get("event_timestamp")
+
+                pages.append(parse_dividends(path_))
+
+                if _reached(pages[-1], newest):
+                    flag = False
+
+    df = pd.concat(pages, ignore_index=True) if pages else pd.DataFrame()
+
+    if newest is not None:
+        # The retrieved dividends replace the stored ones since they may have been
+        # updated, but the stored ones on the oldest retrieved date are also kept in
+        # case a page boundary split the dividends of that date
+        oldest = newest if df.empty else df["Date"].min()
+        older = stored[stored["Date"] <= oldest]
+
+        df = older if df.empty else pd.concat([df, older])
+        df = df.drop_duplicates(subset=["Date", "Dividend", "Type"])
+        df = df.reset_index(drop=True)
+
+    store.set(key, df.copy())
+
+    return df
+
+
+def parse_dividends(rows):
+    """
+    This function parses the rows of the dividends table of a stock, as retrieved from Investing.com, so that
+    the raw values of every row are collected first and then converted at once, using vectorized operations
+    over every column instead of converting the dates and the values of every dividend one by one. Note that
+    the dates are sent as timestamps, which are converted into dates in local time.
+
+    Args:
+        rows (:obj:`list`): rows (`tr`) of the dividends table, as :obj:`lxml.html.HtmlElement`.
+
+    Returns:
+        :obj:`pandas.DataFrame` - dividends:
+            The resulting :obj:`pandas.DataFrame` contains a row per dividend, with the `Date`, `Dividend`, `Type`,
+            `Payment Date` and `Yield` columns, where the yield is kept as shown in Investing.com, e.g. `5.67%`.
+
+    """
+
+    values = list()
+
+    for row in rows:
+        date_ = value = type_ = payment = yield_ = None
+
+        for cell in row.iter("td"):
+            if not cell.get("class"):
+                continue
+
+            if "first" in cell.get("class"):
+                date_ = cell.get("data-value")
+                value = cell.getnext().text_content()
+
+            if cell.get("data-value") in DIVIDEND_TYPES:
+                type_ = cell.get("data-value")
+                payment = cell.getnext().get("data-value")
+                yield_ = cell.getnext().getnext().text_content()
+
+        values.append((date_, value, type_, payment, yield_))
+
+    data = pd.DataFrame(values, columns=DIVIDEND_COLUMNS)
+
+    data["Date"] = _to_dates(data["Date"])
+    data["Dividend"] = pd.to_numeric(
+        data["Dividend"].str.replace(",", "", regex=False)
+    ).astype("float64")
+    data["Type"] = data["Type"].map(DIVIDEND_TYPES)
+    data["Payment Date"] = _to_dates(data["Payment Date"])
+
+    return data
+
+
+def retrieve_dividends(
+    resolved, store, incremental=False, max_workers=8, numeric=False
+):
+    """
+    This function retrieves the dividends of several stocks from Investing.com, so that the dividends of up to
+    `max_workers` stocks are retrieved concurrently using the pooled session of
+    `investpy.utils.extra.pooled_session`, while the pages of the dividends of every stock are still retrieved
+    one after another, since every page goes on from the last dividend of the previous one, see `sync_dividends`.
+    The stocks whose dividends could not be retrieved are not raised, but reported in the `Error` column.
+
+    Args:
+        resolved (:obj:`list`):
+            stocks as resolved by `investpy.utils.information.resolve_instruments` with `DIVIDENDS_SCHEMA`, so
+            that their dividends are stored by their country and lower case symbol, as `get_stock_dividends` does.
+        store (:obj:`investpy.utils.store.Store`): store of the dividends retrieved per stock.
+        incremental (:obj:`bool`, optional): whether to update the stored dividends or to retrieve every dividend.
+        max_workers (:obj:`int`, optional): maximum number of stocks whose dividends are retrieved concurrently.
+        numeric (:obj:`bool`, optional): whether to convert the yields into numbers, e.g. `5.67%` into 5.67, or not.
+
+    Returns:
+        :obj:`pandas.DataFrame` - dividends:
+            The resulting :obj:`pandas.DataFrame` contains a row per dividend of every introduced stock, in the
+            same order, with the `Stock Symbol` and `Country` columns followed by the dividend columns and the
+            `Error` column, which is null for the stocks whose dividends were retrieved, while the stocks whose
+            dividends could not be retrieved have a single row with null dividend columns.
+
+    """
+
+    results = [None] * len(resolved)
+
+    def fetch(position):
+        name, tag, args, error = resolved[position]
+
+        if error is None:
+            try:
+                results[position] = sync_dividends(
+                    tag,
+                    (args[0], unidecode(name.strip().lower())),
+                    store,
+                    incremental=incremental,
+                    session=pooled_session(),
+                )
+                return
+            except Exception as e:
+                error = str(e)
+
+        results[position] = error
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fetch, range(len(resolved))))
+
+    frames = list()
+
+    for (name, _, args, _), result in zip(resolved, results):
+        if isinstance(result, pd.DataFrame):
+            frame = result.reindex(columns=DIVIDEND_COLUMNS)
+            frame["Error"] = None
+        else:
+            frame = pd.DataFrame(
+                {"Error": [result]}, columns=DIVIDEND_COLUMNS + ["Error"]
+            )
+
+        frame.insert(0, "Stock Symbol", name)
+        frame.insert(1, "Country", None if args is None else args[0])
+
+        frames.append(frame)
+
+    data = pd.concat(frames, ignore_index=True)
+
+    data["Date"] = pd.to_datetime(data["Date"])
+    data["Payment Date"] = pd.to_datetime(data["Payment Date"])
+    data["Dividend"] = data["Dividend"].astype("float64")
+
+    if numeric is True:
+        # Yields are below 1000%, so commas are decimal separators, e.g. `5,67%`
+        yields = data["Yield"].astype("string").str.strip().str.rstrip("%")
+        yields = yields.str.replace(",", ".", regex=False)
+        data["Yield"] = pd.to_numeric(yields, errors="coerce").astype("float64")
+
+    return data
+
+
+def _to_dates(timestamps):
+    # Local dates of the timestamps, as done by `datetime.fromtimestamp(...).date()`, where
+    # the UTC offset is looked up just once per distinct timestamp
+    seconds = pd.to_numeric(timestamps, errors="coerce").to_numpy(dtype="float64")
+    present = ~np.isnan(seconds)
+
+    distinct, positions = np.unique(
+        seconds[present].astype("int64"), return_inverse=True
+    )
+    offsets = np.array(
+        [time.localtime(value).tm_gmtoff for value in distinct], dtype="int64"
+    )
+
+    days = (distinct + offsets) // 86400
+
+    seconds[present] = days[positions.reshape(-1)] * 86400
+
+    # In microseconds, so that the dates have the same unit as the ones built from `datetime`
+    return pd.Series(pd.to_datetime(seconds * 1e6, unit="us"), index=timestamps.index)
+
+
+def _reached(data, newest):
+    # Whether any of the retrieved dividends is not newer than the newest stored one
+    return newest is not None and bool((data["Date"] <= newest).any())
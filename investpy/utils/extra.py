@@ -2,12 +2,19 @@
 # See LICENSE for details.
 
 import random
+import time
+from threading import Lock
 
 import pandas as pd
 import pkg_resources
+import requests
+from requests.adapters import HTTPAdapter
 
 from . import constant as cst
 
+_session = None
+_session_lock = Lock()
+
 
 def resource_to_data(path_to_data):
     """
@@ -61,3 +68,86 @@ def random_user_agent():
     """
 
     return random.choice(cst.USER_AGENTS)
+
+
+def pooled_session():
+    """
+    This function returns the :obj:`requests.Session` shared by the requests sent to Investing.com, which
+    keeps up to `investpy.utils.constant.POOL_MAXSIZE` connections alive per host, so that consecutive or
+    concurrent requests reuse the already established connections instead of opening a new one every time.
+    Note that the User-Agent is still specified on the headers of every request.
+
+    Returns:
+        :obj:`requests.Session` - session: session shared by every request sent to Investing.com.
+
+    """
+
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=cst.POOL_MAXSIZE, pool_maxsize=cst.POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+
+    return _session
+
+
+class RateLimiter(object):
+    """Thread-safe limiter of the rate at which several threads start their work, e.g. requests.
+
+    Every call to `acquire` reserves the next free slot, spaced `1 / rate` seconds from the previous one, and
+    sleeps until it is reached, so that no matter how many threads share the same limiter, no more than `rate`
+    calls to `acquire` return per second overall, in the same order as the slots were reserved. Note that it
+    limits whatever follows every call, so if that sends several requests, more requests are sent per second.
+
+    Args:
+        rate (:obj:`float`): maximum number of calls to `acquire` returning per second.
+
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+
+        self._next = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(self._next, now) + 1.0 / self.rate
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimitedSession(object):
+    """Session which acquires a :obj:`RateLimiter` before sending every request.
+
+    Every `get` and `post` first calls `acquire` on the introduced limiter and then sends the request through
+    the introduced session, so that no matter how many threads share it (e.g. the ones requesting the windows
+    of the historical data of several financial products), no more than `rate` requests are sent per second.
+
+    Args:
+        session (:obj:`requests.Session`): session used to send the requests.
+        limiter (:obj:`investpy.utils.extra.RateLimiter`): limiter acquired before sending every request.
+
+    """
+
+    def __init__(self, session, limiter):
+        self.session = session
+        self.limiter = limiter
+
+    def get(self, *args, **kwargs):
+        self.limiter.acquire()
+        return self.session.get(*args, **kwargs)
+
+    def post(self, *args, **kwargs):
+        self.limiter.acquire()
+        return self.session.post(*args, **kwargs)
@@ -0,0 +1,301 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+import requests
+from lxml.html import fromstring
+from unidecode import unidecode
+
+from .constant import FINANCIAL_SUMMARY_PERIODS, FINANCIAL_SUMMARY_TYPES
+from .extra import pooled_session, random_user_agent
+from .information import InformationSchema
+
+FINANCIAL_SUMMARY_URL = (
+    "https://www.investing.com/instruments/Financials/changesummaryreporttypeajax"
+)
+
+# Stocks resolved as `get_stock_financial_summary` does, keeping their country and id
+FINANCIALS_SCHEMA = InformationSchema(
+    "stock",
+    "stocks.csv",
+    "symbol",
+    "equities",
+    "Stock Symbol",
+    True,
+    args=["country", "id"],
+)
+
+FINANCIALS_COLUMNS = [
+    "Stock Symbol",
+    "Country",
+    "Period",
+    "Statement",
+    "Field",
+    "Date",
+    "Value",
+]
+
+
+def fetch_financial_summary(id_, period, cache, session=None):
+    """
+    This function retrieves the response containing every financial summary table of a stock from Investing.com,
+    which is kept in the introduced cache per stock and period, since the same response contains the income
+    statement, the balance sheet and the cash flow statement, so that it is just requested once for all of them.
+
+    Args:
+        id_ (:obj:`int`): id used by Investing.com to identify the stock.
+        period (:obj:`str`): period of the financial summaries, either `annual` or `quarterly`.
+        cache (:obj:`investpy.utils.cache.Cache`): cache of the responses per (id, period) pair.
+        session (:obj:`requests.Session`, optional): session used to send the request, if None, `requests` is used.
+
+    Returns:
+        :obj:`str` - html: response containing every financial summary table of the stock.
+
+    Raises:
+        ConnectionError: raised if the connection to Investing.com errored (did not return HTTP 200).
+        RuntimeError: raised if the response contains no financial summary table, which is not kept.
+
+    """
+
+    html = cache.get((id_, period))
+
+    if html is not None:
+        return html
+
+    session = requests if session is None else session
+
+    headers = {
+        "User-Agent": random_user_agent(),
+        "X-Requested-With": "XMLHttpRequest",
+        "Accept": "text/html",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    params = {
+        "action": "change_report_type",
+        "pid": id_,
+        "financial_id": id_,
+        "ratios_id": id_,
+        "period_type": FINANCIAL_SUMMARY_PERIODS[period],
+    }
+
+    req = session.get(FINANCIAL_SUMMARY_URL, params=params, headers=headers)
+
+    if req.status_code != 200:
+        raise ConnectionError(
+            "ERR#0015: error " + str(req.status_code) + ", try again later."
+        )
+
+    # Responses with no tables (e.g. block pages) are not kept, so that they are requested again
+    if not summary_tables(req.text):
+        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+
+    cache.set((id_, period), req.text)
+
+    return req.text
+
+
+def summary_tables(html):
+    """Returns the financial summary tables of the response, in the order of `FINANCIAL_SUMMARY_TYPES`."""
+    return fromstring(html).xpath(
+        ".//div[@class='companySummaryIncomeStatement']        /table[contains(@class,"
+        " 'companyFinancialSummaryTbl')]"
+    )
+
+
+def parse_financial_summary(table):
+    """
+    This function parses a financial summary table into a :obj:`pandas.DataFrame` indexed by date, with a column
+    per field of the table, as returned by `investpy.get_stock_financial_summary`.
+
+    Args:
+        table (:obj:`lxml.html.HtmlElement`): financial summary table, see `summary_tables`.
+
+    Returns:
+        :obj:`pandas.DataFrame` - financial_summary: fields of the financial summary table, a row per date.
+
+    """
+
+    data = {"Date": list()}
+
+    for element in table.xpath(".//thead")[0].xpath(".//th"):
+        if element.get("class") is None:
+            data["Date"].append(
+                datetime.strptime(element.text_content().strip(), "%b %d, %Y")
+            )
+
+    for element in table.xpath(".//tbody")[0].xpath(".//tr"):
+        curr_row = None
+        for row in element.xpath(".//td"):
+            if row.get("class") is not None:
+                curr_row = row.text_content().strip()
+                data[curr_row] = list()
+                continue
+            data[curr_row].append(float(row.text_content().strip()))
+
+    dataset = pd.DataFrame(data)
+    dataset.set_index("Date", inplace=True)
+
+    return dataset
+
+
+def melt_financial_summaries(html):
+    """
+    This function parses every financial summary table of a response into a single :obj:`pandas.DataFrame` in
+    long format, i.e. a row per statement, field and date, so that the financial summaries of several stocks
+    and periods can be concatenated no matter which fields every stock reports. The raw values are collected
+    first and then converted at once, so that the missing values (e.g. `-`) are NaN instead of raising.
+
+    Args:
+        html (:obj:`str`): response containing every financial summary table, see `fetch_financial_summary`.
+
+    Returns:
+        :obj:`pandas.DataFrame` - financial_summaries:
+            The resulting :obj:`pandas.DataFrame` contains the `Statement` (the financial summary type), `Field`,
+            `Date` and `Value` columns, where `Value` is a `float64` column.
+
+    Raises:
+        RuntimeError: raised if the response contains no financial summary table.
+
+    """
+
+    tables = summary_tables(html)
+
+    if not tables:
+        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+
+    statements, fields, dates, values = list(), list(), list(), list()
+
+    for statement, index in FINANCIAL_SUMMARY_TYPES.items():
+        if index >= len(tables):
+            continue
+
+        table = tables[index]
+
+        header = [
+            element.text_content().strip()
+            for element in table.xpath(".//thead")[0].xpath(".//th")
+            if element.get("class") is None
+        ]
+
+        for element in table.xpath(".//tbody")[0].xpath(".//tr"):
+            field = None
+            position = 0
+            for cell in element.xpath(".//td"):
+                if cell.get("class") is not None:
+                    field, position = cell.text_content().strip(), 0
+                    continue
+                if position < len(header):
+                    statements.append(statement)
+                    fields.append(field)
+                    dates.append(header[position])
+                    values.append(cell.text_content().strip())
+                position += 1
+
+    data = pd.DataFrame(
+        {"Statement": statements, "Field": fields, "Date": dates, "Value": values}
+    )
+
+    data["Date"] = pd.to_datetime(data["Date"], format="%b %d, %Y", errors="coerce")
+    data["Value"] = pd.to_numeric(
+        data["Value"].str.replace(",", "", regex=False), errors="coerce"
+    ).astype("float64")
+
+    return data
+
+
+def retrieve_financial_summaries(resolved, periods, cache, store=None, max_workers=8):
+    """
+    This function retrieves every financial summary table of several stocks and periods from Investing.com, so
+    that a request is sent per (stock, period) pair, with up to `max_workers` requests sent concurrently using the
+    pooled session of `investpy.utils.extra.pooled_session`, and every table of every response is parsed into a
+    single :obj:`pandas.DataFrame` in long format. If a store is introduced, the financial summaries of every
+    (stock, period) pair are stored as soon as they are retrieved, and the ones already stored are not requested
+    again, so that a job that was interrupted can be restarted and resumed where it stopped. The pairs that could
+    not be retrieved are not raised, but reported in the `Error` column.
+
+    Args:
+        resolved (:obj:`list`):
+            stocks as resolved by `investpy.utils.information.resolve_instruments` with `FINANCIALS_SCHEMA`.
+        periods (:obj:`list`): periods of the financial summaries, `annual` and/or `quarterly`.
+        cache (:obj:`investpy.utils.cache.Cache`): cache of the responses per (id, period) pair.
+        store (:obj:`investpy.utils.store.Store`, optional): store of the financial summaries per (stock, period).
+        max_workers (:obj:`int`, optional): maximum number of requests sent concurrently.
+
+    Returns:
+        :obj:`pandas.DataFrame` - financial_summaries:
+            The resulting :obj:`pandas.DataFrame` contains a row per statement, field and date of every introduced
+            stock and period, in the same order, with the `Stock Symbol`, `Country`, `Period`, `Statement`, `Field`,
+            `Date` and `Value` columns plus the `Error` column, which is null for the pairs whose financial summaries
+            were retrieved, while the rest of pairs have a single row with null statement columns.
+
+    """
+
+    pairs = [
+        (position, period) for position in range(len(resolved)) for period in periods
+    ]
+
+    results = dict()
+
+    def fetch(pair):
+        position, period = pair
+        name, tag, args, error = resolved[position]
+
+        if error is not None:
+            results[pair] = error
+            return
+
+        key = (args[0], unidecode(name.strip().lower()), period)
+
+        if store is not None and key in store:
+            results[pair] = store.get(key)
+            return
+
+        try:
+            html = fetch_financial_summary(
+                args[1], period, cache, session=pooled_session()
+            )
+            data = melt_financial_summaries(html)
+        except Exception as e:
+            results[pair] = str(e)
+            return
+
+        # Just the retrieved financial summaries are stored, so that the rest are retried when resumed
+        if store is not None and not data.empty:
+            store.set(key, data)
+
+        results[pair] = data
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fetch, pairs))
+
+    frames = list()
+
+    for position, period in pairs:
+        name, _, args, _ = resolved[position]
+        result = results[(position, period)]
+
+        if isinstance(result, pd.DataFrame):
+            frame = result.copy()
+            frame["Error"] = None
+        else:
+            frame = pd.DataFrame(
+                {"Error": [result]}, columns=FINANCIALS_COLUMNS[3:] + ["Error"]
+            )
+
+        frame.insert(0, "Stock Symbol", name)
+        frame.insert(1, "Country", None if args is None else args[0])
+        frame.insert(2, "Period", period)
+
+        frames.append(frame)
+
+    data = pd.concat(frames, ignore_index=True)
+
+    data["Date"] = pd.to_datetime(data["Date"])
+    data["Value"] = data["Value"].astype("float64")
+
+    return data
@@ -0,0 +1,1028 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from random import randint
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from . import constant as cst
+from .adjustment import adjust_columns
+from .cache import Cache
+from .extra import pooled_session, random_user_agent
+from .parsers import historical_rows
+
+HISTORICAL_DATA_URL = "https://www.investing.com/instruments/HistoricalDataAjax"
+
+# Daily data retrieved during the current process, as (from_date, to_date, columns) per product
+DAILY_DATA = Cache(ttl=cst.DAILY_DATA_TTL, maxsize=cst.DAILY_DATA_MAXSIZE)
+
+# Recent data retrieved during the current process, as (retrieved_at, columns) per product and interval
+RECENT_DATA = Cache(ttl=cst.RECENT_DATA_TTL, maxsize=cst.RECENT_DATA_MAXSIZE)
+
+
+class HistoricalSchema(object):
+    """Class which describes the historical data of a financial product type.
+
+    Every financial product type is retrieved from the same Investing.com endpoint, and the only
+    differences between them are the header sent on the request, the columns that the product
+    type contains and the error message raised when no data was found. So on, this class
+    contains that description, which is what `retrieve_recent_data` and `retrieve_historical_data`
+    use to retrieve, parse and format the historical data of any financial product.
+
+    Attributes:
+        product (:obj:`str`): name of the financial product type.
+        header (:obj:`str`): format of the header sent to Investing.com, where `{}` is replaced by the product name.
+        error (:obj:`str`): message of the :obj:`IndexError` raised if no data was found.
+        volume (:obj:`bool`): whether the financial product type has volume values or not.
+        currency (:obj:`bool`): whether the currency is included in the output data or not.
+        exchange (:obj:`bool`): whether the stock exchange is included in the output data or not.
+        change_pct (:obj:`bool`): whether the change percentage is included in the output data or not.
+        adjusted (:obj:`bool`): whether the dividend-adjusted close is included in the output data or not.
+        total_return (:obj:`bool`): whether the total return index is included in the output data or not.
+        currency_key (:obj:`str`): key used for the currency when the output data is a :obj:`json`.
+
+    """
+
+    def __init__(
+        self,
+        product,
+        header,
+        error,
+        volume=False,
+        currency=False,
+        exchange=False,
+        change_pct=False,
+        adjusted=False,
+        total_return=False,
+        currency_key="currency",
+    ):
+        self.product = product
+        self.header = header
+        self.error = error
+        self.volume = volume
+        self.currency = currency
+        self.exchange = exchange
+        self.change_pct = change_pct
+        self.adjusted = adjusted
+        self.total_return = total_return
+        self.currency_key = currency_key
+
+    @property
+    def columns(self):
+        columns = ["Open", "High", "Low", "Close"]
+        if self.adjusted:
+            columns.append("Adj Close")
+        if self.total_return:
+            columns.append("Total Return")
+        if self.volume:
+            columns.append("Volume")
+        if self.change_pct:
+            columns.append("Change Pct")
+        if self.currency:
+            columns.append("Currency")
+        if self.exchange:
+            columns.append("Exchange")
+        return columns
+
+    def replace(self, **changes):
+        """Returns a copy of the current schema with the introduced attributes replaced."""
+        attributes = dict(vars(self))
+        attributes.update(changes)
+        return HistoricalSchema(**attributes)
+
+
+SCHEMAS = {
+    "stock": HistoricalSchema(
+        product="stock",
+        header="{} Historical Data",
+        error="ERR#0007: stock information unavailable or not found.",
+        volume=True,
+        currency=True,
+    ),
+    "fund": HistoricalSchema(
+        product="fund",
+        header="{} Historical Data",
+        error="ERR#0008: fund information unavailable or not found.",
+        currency=True,
+    ),
+    "etf": HistoricalSchema(
+        product="etf",
+        header="{} Historical Data",
+        error="ERR#0010: etf information unavailable or not found.",
+        volume=True,
+        currency=True,
+        exchange=True,
+    ),
+    "index": HistoricalSchema(
+        product="index",
+        header="{} Historical Data",
+        error="ERR#0046: index information unavailable or not found.",
+        volume=True,
+        currency=True,
+    ),
+    "currency_cross": HistoricalSchema(
+        product="currency_cross",
+        header="{} Historical Data",
+        error="ERR#0055: currency_cross information unavailable or not found.",
+        currency=True,
+        currency_key="Currency",
+    ),
+    "bond": HistoricalSchema(
+        product="bond",
+        header="{} Bond Yield Historical Data",
+        error="ERR#0069: bond information unavailable or not found.",
+    ),
+    "commodity": HistoricalSchema(
+        product="commodity",
+        header="{} Historical Data",
+        error="ERR#0080: commodity information unavailable or not found.",
+        volume=True,
+        currency=True,
+    ),
+    "crypto": HistoricalSchema(
+        product="crypto",
+        header="{} Historical Data",
+        error="ERR#0087: crypto information unavailable or not found.",
+        volume=True,
+        currency=True,
+    ),
+    "certificate": HistoricalSchema(
+        product="certificate",
+        header="{} Historical Data",
+        error="ERR#0102: certificate information unavailable or not found.",
+    ),
+}
+
+
+def plan_windows(from_date, to_date, interval="Daily"):
+    """
+    This function splits the introduced date range into the windows to request to Investing.com, since
+    the historical data endpoint just returns up to `HISTORICAL_ROWS_LIMIT` rows per request. The size of
+    every window is the number of years whose rows fit in a single response for the introduced interval,
+    which means 19 years of daily data, 94 years of weekly data and 416 years of monthly data.
+
+    Args:
+        from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+        to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+        interval (:obj:`str`, optional): interval of the data, either `Daily`, `Weekly` or `Monthly`.
+
+    Returns:
+        :obj:`list` - windows:
+            The resulting :obj:`list` contains a :obj:`tuple` with the start and end dates of every window
+            formatted as `mm/dd/yyyy`, which is the format expected by Investing.com, sorted ascending.
+
+    """
+
+    years = (
+        cst.HISTORICAL_ROWS_LIMIT // cst.HISTORICAL_ROWS_PER_YEAR[interval.capitalize()]
+    )
+
+    windows = list()
+
+    while to_date.year - from_date.year > years:
+        window_end = from_date.replace(year=from_date.year + years)
+        windows.append(
+            (from_date.strftime("%m/%d/%Y"), window_end.strftime("%m/%d/%Y"))
+        )
+        from_date = window_end + timedelta(days=1)
+
+    windows.append((from_date.strftime("%m/%d/%Y"), to_date.strftime("%m/%d/%Y")))
+
+    return windows
+
+
+def fetch_rows(id_, header, interval, window=None, session=None):
+    """
+    This function sends a request to the historical data endpoint of Investing.com and extracts the
+    rows of the historical data table from the response using `investpy.utils.parsers.historical_rows`.
+
+    Args:
+        id_ (:obj:`int`): ID value used by Investing.com to identify the financial product.
+        header (:obj:`str`): header of the historical data table, as expected by Investing.com.
+        interval (:obj:`str`): interval of the historical data, either `Daily`, `Weekly` or `Monthly`.
+        window (:obj:`tuple`, optional):
+            start and end dates formatted as `mm/dd/yyyy`, if None, the recent data is retrieved.
+        session (:obj:`requests.Session`, optional):
+            session used to send the request, if None, `investpy.utils.extra.pooled_session`.
+
+    Returns:
+        :obj:`list` - rows:
+            The resulting :obj:`list` contains the rows as returned by `investpy.utils.parsers.historical_rows`,
+            so it will be empty if no results were found and None if the table was not found.
+
+    Raises:
+        ConnectionError: raised if connection to Investing.com could not be established.
+
+    """
+
+    params = {
+        "curr_id": id_,
+        "smlID": str(randint(1000000, 99999999)),
+        "header": header,
+        "interval_sec": interval.capitalize(),
+        "sort_col": "date",
+        "sort_ord": "DESC",
+        "action": "historical_data",
+    }
+
+    if window is not None:
+        params["st_date"], params["end_date"] = window
+
+    head = {
+        "User-Agent": random_user_agent(),
+        "X-Requested-With": "XMLHttpRequest",
+        "Accept": "text/html",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    session = pooled_session() if session is None else session
+
+    req = session.post(HISTORICAL_DATA_URL, headers=head, data=params)
+
+    if req.status_code != 200:
+        raise ConnectionError(
+            "ERR#0015: error " + str(req.status_code) + ", try again later."
+        )
+
+    if not req.text:
+        return list()
+
+    return historical_rows(req.text, text_fallback=True)
+
+
+def parse_rows(schema, rows):
+    """
+    This function converts the rows extracted from Investing.com into columns, so that every column
+    is parsed at once instead of parsing every value of every row one by one.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): description of the financial product type.
+        rows (:obj:`list`): rows as returned by `investpy.utils.parsers.historical_rows`, newest first.
+
+    Returns:
+        :obj:`dict` - columns:
+            The resulting :obj:`dict` contains the `Date` column as a :obj:`numpy.ndarray` of `datetime64[D]`
+            values and the rest of the value columns (Open, High, Low, Close and Volume and/or Change Pct if
+            available) as :obj:`numpy.ndarray`, all of them in the same order as the introduced rows.
+
+    """
+
+    cells = list(zip(*rows))
+
+    def to_float(values):
+        return np.array([value.replace(",", "") for value in values], dtype="float64")
+
+    columns = {
+        "Date": (np.array(cells[0], dtype="int64") // 86400).astype("datetime64[D]"),
+        "Open": to_float(cells[2]),
+        "High": to_float(cells[3]),
+        "Low": to_float(cells[4]),
+        "Close": to_float(cells[1]),
+    }
+
+    position = 5
+
+    if schema.volume:
+        columns["Volume"] = np.array(
+            [int(value or 0) for value in cells[position]], dtype="int64"
+        )
+        position += 1
+
+    if schema.change_pct:
+        columns["Change Pct"] = to_float(
+            [value.replace("%", "") for value in cells[position]]
+        )
+
+    return columns
+
+
+def _retrieve_columns(schema, id_, header, interval, windows=None, session=None):
+    header = schema.header.format(header)
+
+    if windows is None:
+        rows = fetch_rows(id_, header, interval, session=session)
+
+        if rows is None:
+            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+
+        if not rows:
+            raise IndexError(schema.error)
+
+        return parse_rows(schema, rows)
+
+    # The windows are requested concurrently, but checked and merged in ascending order, so that the
+    # errors are raised as if they were requested one after another
+    def fetch(window):
+        try:
+            return (
+                fetch_rows(id_, header, interval, window=window, session=session),
+                None,
+            )
+        except Exception as e:
+            return None, e
+
+    if len(windows) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(windows), cst.HISTORICAL_WORKERS)
+        ) as executor:
+            responses = list(executor.map(fetch, windows))
+    else:
+        responses = [fetch(windows[0])]
+
+    collected = list()
+
+    for rows, error in responses:
+        if error is not None:
+            raise error
+
+        if rows is None:
+            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+
+        # Windows with no data (e.g. before the listing or on a non-trading stretch) are skipped
+        if not rows:
+            continue
+
+        collected.append(parse_rows(schema, rows))
+
+    if not collected:
+        raise IndexError(schema.error)
+
+    # Windows are requested in ascending order, but the rows of each one come newest first
+    collected.reverse()
+
+    return {
+        key: np.concatenate([columns[key] for columns in collected])
+        for key in collected[0]
+    }
+
+
+def _encode_column(values):
+    if isinstance(values, str) or values is None:
+        return json.dumps(values)
+
+    if values.dtype.kind == "f" and not np.isfinite(values).all():
+        return [json.dumps(value) for value in values.tolist()]
+
+    return list(map(repr, values.tolist()))
+
+
+def _refresh_recent_columns(schema, id_, header, interval, columns, session=None):
+    # Just the bars since the last one kept are requested, since that one may have changed
+    window = (
+        columns["Date"][0].item().strftime("%m/%d/%Y"),
+        (date.today() + timedelta(days=1)).strftime("%m/%d/%Y"),
+    )
+
+    rows = fetch_rows(
+        id_, schema.header.format(header), interval, window=window, session=session
+    )
+
+    if rows is None:
+        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+
+    if not rows:
+        return columns
+
+    newer = parse_rows(schema, rows)
+    older = columns["Date"] < newer["Date"][-1]
+
+    # The oldest bars are dropped so that the recent data keeps spanning the same number of bars
+    size = len(columns["Date"])
+
+    return {
+        column: np.concatenate([newer[column], columns[column][older]])[:size]
+        for column in columns
+    }
+
+
+def _recent_columns(schema, id_, header, interval, session=None):
+    key = (schema.product, id_, header, interval.capitalize())
+
+    entry = RECENT_DATA.get(key)
+    now = time.monotonic()
+
+    if entry is None:
+        columns = _retrieve_columns(schema, id_, header, interval, session=session)
+    else:
+        retrieved, columns = entry
+
+        if now - retrieved < cst.RECENT_DATA_FRESHNESS:
+            return columns
+
+        columns = _refresh_recent_columns(
+            schema, id_, header, interval, columns, session=session
+        )
+
+    RECENT_DATA.set(key, (now, columns))
+
+    return columns
+
+
+def _period_starts(dates, interval):
+    if interval == "Weekly":
+        # Investing.com weeks start on Sunday, and 1970-01-01 (day 0) was a Thursday
+        days = dates.astype("int64")
+        return (days - (days + 4) % 7).astype("datetime64[D]")
+
+    return dates.astype("datetime64[M]").astype("datetime64[D]")
+
+
+def resample_columns(columns, interval):
+    """
+    This function resamples the parsed columns of daily data into weekly or monthly data, following the
+    conventions of Investing.com, where every week starts on Sunday and every month on its first day, which
+    is the date used for every resulting row. The open value is the first open of the period, the high and
+    low values are the highest and lowest values of the period, the close value is the last close of the
+    period, the volume is the sum of the volumes and the change percentage is computed from the close of
+    the previous period.
+
+    Args:
+        columns (:obj:`dict`): parsed columns of daily data, sorted descending (newest first).
+        interval (:obj:`str`): interval of the resulting data, either `Weekly` or `Monthly`.
+
+    Returns:
+        :obj:`dict` - columns:
+            The resulting :obj:`dict` contains the same columns as the introduced ones, resampled into the
+            introduced interval and sorted descending (newest first).
+
+    """
+
+    interval = interval.capitalize()
+
+    columns = {column: values[::-1] for column, values in columns.items()}
+
+    labels = _period_starts(columns["Date"], interval)
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    ends = np.r_[starts[1:], len(labels)] - 1
+
+    resampled = {
+        "Date": labels[starts],
+        "Open": columns["Open"][starts],
+        "High": np.maximum.reduceat(columns["High"], starts),
+        "Low": np.minimum.reduceat(columns["Low"], starts),
+        "Close": columns["Close"][ends],
+    }
+
+    if "Volume" in columns:
+        resampled["Volume"] = np.add.reduceat(columns["Volume"], starts)
+
+    if "Change Pct" in columns:
+        close = columns["Close"]
+        # Close value previous to the first day, implied by its change percentage
+        previous = close[0] / (1 + columns["Change Pct"][0] / 100)
+        previous = np.r_[previous, resampled["Close"][:-1]]
+        resampled["Change Pct"] = np.round((resampled["Close"] / previous - 1) * 100, 2)
+
+    return {column: values[::-1] for column, values in resampled.items()}
+
+
+def resample_data(data, interval):
+    """
+    This function resamples the daily data of a financial product into weekly or monthly data, so that
+    if the daily data was already retrieved, there is no need to retrieve the weekly or monthly data from
+    Investing.com. The introduced data should be a :obj:`pandas.DataFrame` as returned by any of the
+    historical data functions (e.g. `investpy.get_stock_historical_data`), and every row of the resulting
+    :obj:`pandas.DataFrame` is computed as described in `resample_columns`.
+
+    Args:
+        data (:obj:`pandas.DataFrame`): daily data of the financial product.
+        interval (:obj:`str`): interval of the resulting data, either `Weekly` or `Monthly`.
+
+    Returns:
+        :obj:`pandas.DataFrame` - data:
+            The resulting :obj:`pandas.DataFrame` contains the same columns as the introduced one, in the
+            same order, but with a row per week or per month.
+
+    Raises:
+        ValueError: raised if the introduced interval is not valid.
+
+    """
+
+    if not isinstance(interval, str) or interval.lower() not in ["weekly", "monthly"]:
+        raise ValueError(
+            "ERR#0073: interval value should be a str type and it can just be either"
+            " 'Weekly' or 'Monthly'."
+        )
+
+    ascending = data.index.is_monotonic_increasing
+
+    data = data.sort_index(ascending=False)
+
+    columns = {"Date": data.index.values.astype("datetime64[D]")}
+    for column in ["Open", "High", "Low", "Close", "Volume", "Change Pct"]:
+        if column in data.columns:
+            columns[column] = data[column].to_numpy()
+
+    columns = resample_columns(columns, interval)
+
+    size = len(columns["Date"])
+
+    resampled = {"Date": columns["Date"].astype("datetime64[us]").tolist()}
+    for column in data.columns:
+        if column in columns:
+            resampled[column] = columns[column].tolist()
+        else:
+            resampled[column] = [data[column].iloc[0]] * size
+
+    df = pd.DataFrame(resampled)
+    df.set_index("Date", inplace=True)
+
+    if ascending:
+        df = df.iloc[::-1]
+
+    return df
+
+
+def _cached_daily_columns(schema, id_, from_date, to_date):
+    entry = DAILY_DATA.get((schema.product, id_))
+
+    if entry is None:
+        return None
+
+    start, end, columns = entry
+
+    if start > from_date or end < to_date:
+        return None
+
+    dates = columns["Date"]
+    mask = (dates >= np.datetime64(from_date.date())) & (
+        dates <= np.datetime64(to_date.date())
+    )
+
+    if not mask.any():
+        return None
+
+    return {column: values[mask] for column, values in columns.items()}
+
+
+def write_json(
+    schema,
+    columns,
+    name,
+    key,
+    currency=None,
+    exchange=None,
+    fp=None,
+    compact=False,
+    chunk_size=1000,
+):
+    """
+    This function serializes the parsed columns of historical data as a :obj:`json`, without building an
+    intermediate :obj:`dict` per row. Every column is encoded at once and then every row is rendered from
+    a template containing the already encoded keys, so that the output is byte-identical to the one of
+    `json.dumps({"name": name, key: [{...}, ...]})`, which is the format investpy has always returned.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): description of the financial product type.
+        columns (:obj:`dict`): parsed columns, sorted in the order in which they will be written.
+        name (:obj:`str`): name of the financial product, included in the :obj:`json` output.
+        key (:obj:`str`): key of the data in the :obj:`json` output, either `recent` or `historical`.
+        currency (:obj:`str`, optional): currency in which the data is displayed.
+        exchange (:obj:`str`, optional): stock exchange that provides the data.
+        fp (:obj:`file`, optional):
+            file-like object opened in text mode, if provided the :obj:`json` is written to it in chunks of
+            `chunk_size` rows instead of returned.
+        compact (:obj:`bool`, optional):
+            if True, the :obj:`json` is serialized with no whitespace, using orjson if it is installed, so
+            it is not byte-identical to the default output anymore.
+        chunk_size (:obj:`int`, optional): number of rows written to `fp` at once.
+
+    Returns:
+        :obj:`str` - data:
+            The resulting :obj:`str` contains the :obj:`json`, or None if it was written to the introduced
+            file-like object.
+
+    """
+
+    dates = [
+        f"{date[8:10]}/{date[5:7]}/{date[:4]}"
+        for date in np.datetime_as_string(columns["Date"], unit="D")
+    ]
+
+    keys = [("date", dates)]
+    for column in schema.columns:
+        if column == "Currency":
+            keys.append((schema.currency_key, currency))
+        elif column == "Exchange":
+            keys.append(("exchange", exchange))
+        else:
+            keys.append((column.lower().replace(" ", "_"), columns[column]))
+
+    if compact is True:
+        names = list()
+        values = list()
+
+        for key_, data in keys:
+            names.append(key_)
+            if isinstance(data, np.ndarray):
+                data = data.tolist()
+            elif not isinstance(data, list):
+                data = [data] * len(dates)
+            values.append(data)
+
+        data = {"name": name, key: [dict(zip(names, row)) for row in zip(*values)]}
+
+        # orjson returns bytes, decoded so that the output is a str no matter which packages are installed
+        if orjson is not None:
+            data = orjson.dumps(data).decode("utf-8")
+        else:
+            data = json.dumps(data, separators=(",", ":"))
+
+        if fp is None:
+            return data
+
+        fp.write(data)
+        return None
+
+    template = list()
+    encoded = list()
+
+    for key_, data in keys:
+        if key_ == "date":
+            template.append(f'{json.dumps(key_)}: "%s"')
+            encoded.append(data)
+            continue
+
+        data = _encode_column(data)
+
+        if isinstance(data, str):
+            # Constant values are written into the template itself
+            template.append(f"{json.dumps(key_)}: " + data.replace("%", "%%"))
+        else:
+            template.append(f"{json.dumps(key_)}: %s")
+            encoded.append(data)
+
+    template = "{" + ", ".join(template) + "}"
+
+    head = "{" + f'"name": {json.dumps(name)}, {json.dumps(key)}: ['
+    rows = map(template.__mod__, zip(*encoded))
+
+    if fp is None:
+        return head + ", ".join(rows) + "]}"
+
+    fp.write(head)
+
+    chunk = list()
+    separator = ""
+
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            fp.write(separator + ", ".join(chunk))
+            chunk = list()
+            separator = ", "
+
+    if chunk:
+        fp.write(separator + ", ".join(chunk))
+
+    fp.write("]}")
+
+    return None
+
+
+def _typed_frame(schema, columns, currency, exchange, dtypes):
+    constants = {"Currency": currency, "Exchange": exchange}
+
+    # Just the constant columns can be moved into `attrs`, the rest of columns hold the data
+    if isinstance(dtypes, dict) and any(
+        column not in schema.columns or (dtype is None and column not in constants)
+        for column, dtype in dtypes.items()
+    ):
+        raise ValueError(
+            "ERR#0150: dtypes argument can just be None, 'compact' or a dict of column"
+            " dtypes, where just the Currency and Exchange columns can be None."
+        )
+
+    if dtypes == "compact":
+        dtypes = {"Currency": None, "Exchange": None}
+        for column in schema.columns:
+            if column == "Volume":
+                fits = len(columns["Volume"]) == 0 or (
+                    np.abs(columns["Volume"]).max() <= np.iinfo("int32").max
+                )
+                dtypes[column] = "int32" if fits else "int64"
+            elif column not in dtypes:
+                dtypes[column] = "float32"
+
+    size = len(columns["Date"])
+
+    data, attrs = dict(), dict()
+
+    for column in schema.columns:
+        dtype = dtypes.get(column, False)
+
+        if dtype is None:
+            attrs[column] = constants.get(column)
+            continue
+
+        if column in constants:
+            if dtype == "category" and constants[column] is not None:
+                # Every row shares the same category, so just a code per row is stored
+                data[column] = pd.Categorical.from_codes(
+                    np.zeros(size, dtype="int8"), categories=[constants[column]]
+                )
+                continue
+            values = pd.Series([constants[column]] * size, dtype=object)
+        else:
+            values = pd.Series(columns[column], copy=False)
+
+        if dtype is False:
+            data[column] = values.values
+            continue
+
+        try:
+            target = pd.api.types.pandas_dtype(dtype)
+        except TypeError:
+            raise ValueError(
+                "ERR#0150: dtypes argument can just be None, 'compact' or a dict of"
+                " column dtypes."
+            )
+
+        # Integer dtypes would silently wrap around the values that do not fit into them
+        target = getattr(target, "numpy_dtype", target)
+        if target.kind in "iu" and values.dtype.kind in "iuf" and size > 0:
+            limits = np.iinfo(target)
+            if values.min() < limits.min or values.max() > limits.max:
+                raise ValueError(
+                    "ERR#0150: dtypes argument can just be None, 'compact' or a dict of"
+                    f" column dtypes, and the values of {column} do not fit into"
+                    f" {dtype}."
+                )
+
+        try:
+            data[column] = values.astype(dtype).values
+        except (TypeError, ValueError):
+            raise ValueError(
+                "ERR#0150: dtypes argument can just be None, 'compact' or a dict of"
+                " column dtypes."
+            )
+
+    df = pd.DataFrame(
+        data,
+        index=pd.DatetimeIndex(columns["Date"].astype("datetime64[us]"), name="Date"),
+        columns=[column for column in schema.columns if column not in attrs],
+    )
+    df.attrs.update(attrs)
+
+    return df
+
+
+def format_data(
+    schema,
+    columns,
+    name,
+    key,
+    currency=None,
+    exchange=None,
+    as_json=False,
+    order="ascending",
+    fp=None,
+    compact=False,
+    dtypes=None,
+):
+    """
+    This function formats the parsed columns of historical data as either a :obj:`pandas.DataFrame`
+    or a :obj:`json`, containing the columns described in the schema of the financial product type.
+    By default, the :obj:`pandas.DataFrame` contains `float64` prices, `int64` volumes and the currency
+    and stock exchange repeated on every row, unless other dtypes are introduced.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): description of the financial product type.
+        columns (:obj:`dict`): parsed columns, sorted descending (newest first).
+        name (:obj:`str`): name of the financial product, included in the :obj:`json` output.
+        key (:obj:`str`): key of the data in the :obj:`json` output, either `recent` or `historical`.
+        currency (:obj:`str`, optional): currency in which the data is displayed.
+        exchange (:obj:`str`, optional): stock exchange that provides the data.
+        as_json (:obj:`bool`, optional): whether to return a :obj:`json` or a :obj:`pandas.DataFrame`.
+        order (:obj:`str`, optional): order of the data, either ascending (asc) or descending (desc).
+        fp (:obj:`file`, optional): file-like object to write the :obj:`json` to, see `write_json`.
+        compact (:obj:`bool`, optional): whether to write a compact :obj:`json` or not, see `write_json`.
+        dtypes (:obj:`str` or :obj:`dict`, optional):
+            if `compact`, the prices are `float32`, the volume is `int32` if it fits (`int64` otherwise) and
+            the currency and stock exchange are moved to `df.attrs`, since they are the same for every row;
+            a :obj:`dict` of column name to dtype (including `category`) can also be introduced, where None
+            moves the `Currency` or `Exchange` column to `df.attrs`, and the columns not included keep their
+            default dtype.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`json`: formatted historical data.
+
+    Raises:
+        ValueError: raised if any of the introduced dtypes is not valid for its column or any column is unknown.
+
+    """
+
+    if order in ["ascending", "asc"]:
+        columns = {column: values[::-1] for column, values in columns.items()}
+
+    if as_json is True:
+        return write_json(
+            schema,
+            columns,
+            name,
+            key,
+            currency=currency,
+            exchange=exchange,
+            fp=fp,
+            compact=compact,
+        )
+
+    if dtypes is not None:
+        return _typed_frame(schema, columns, currency, exchange, dtypes)
+
+    size = len(columns["Date"])
+
+    data = {"Date": columns["Date"].astype("datetime64[us]").tolist()}
+    for column in schema.columns:
+        if column == "Currency":
+            data[column] = [currency] * size
+        elif column == "Exchange":
+            data[column] = [exchange] * size
+        else:
+            data[column] = columns[column].tolist()
+
+    df = pd.DataFrame(data)
+    df.set_index("Date", inplace=True)
+
+    return df
+
+
+def retrieve_recent_data(
+    schema,
+    id_,
+    name,
+    header,
+    currency=None,
+    exchange=None,
+    as_json=False,
+    order="ascending",
+    interval="Daily",
+    fp=None,
+    compact=False,
+    dtypes=None,
+    session=None,
+):
+    """
+    This function retrieves the recent data of any financial product from Investing.com, described by
+    the introduced schema, and formats it either as a :obj:`pandas.DataFrame` or as a :obj:`json`. The
+    recent data of every financial product is kept in memory, so that it is returned as is if it was
+    retrieved less than `RECENT_DATA_FRESHNESS` seconds ago, and otherwise just the bars newer than the
+    last one kept are retrieved from Investing.com.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): description of the financial product type.
+        id_ (:obj:`int`): ID value used by Investing.com to identify the financial product.
+        name (:obj:`str`): name of the financial product, included in the :obj:`json` output.
+        header (:obj:`str`): name of the financial product as used in the header of the request.
+        currency (:obj:`str`, optional): currency in which the data is displayed.
+        exchange (:obj:`str`, optional): stock exchange that provides the data.
+        as_json (:obj:`bool`, optional): whether to return a :obj:`json` or a :obj:`pandas.DataFrame`.
+        order (:obj:`str`, optional): order of the data, either ascending (asc) or descending (desc).
+        interval (:obj:`str`, optional): interval of the data, either `Daily`, `Weekly` or `Monthly`.
+        fp (:obj:`file`, optional): file-like object to write the :obj:`json` to, see `write_json`.
+        compact (:obj:`bool`, optional): whether to write a compact :obj:`json` or not, see `write_json`.
+        dtypes (:obj:`str` or :obj:`dict`, optional): dtypes of the :obj:`pandas.DataFrame`, see `format_data`.
+        session (:obj:`requests.Session`, optional):
+            session used to send the requests, if None, `investpy.utils.extra.pooled_session`.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`json`: recent data of the financial product.
+
+    Raises:
+        ConnectionError: raised if connection to Investing.com could not be established.
+        RuntimeError: raised if the historical data table could not be found in the response.
+        IndexError: raised if the recent data was unavailable or not found in Investing.com.
+
+    """
+
+    columns = _recent_columns(schema, id_, header, interval, session=session)
+
+    return format_data(
+        schema,
+        columns,
+        name,
+        "recent",
+        currency=currency,
+        exchange=exchange,
+        as_json=as_json,
+        order=order,
+        fp=fp,
+        compact=compact,
+        dtypes=dtypes,
+    )
+
+
+def retrieve_historical_data(
+    schema,
+    id_,
+    name,
+    header,
+    from_date,
+    to_date,
+    currency=None,
+    exchange=None,
+    as_json=False,
+    order="ascending",
+    interval="Daily",
+    fp=None,
+    compact=False,
+    resample=False,
+    dividends=None,
+    dtypes=None,
+    session=None,
+):
+    """
+    This function retrieves the historical data of any financial product from Investing.com, described by
+    the introduced schema, in the introduced date range, which is split in as many windows as needed, and
+    formats it either as a :obj:`pandas.DataFrame` or as a :obj:`json`.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): description of the financial product type.
+        id_ (:obj:`int`): ID value used by Investing.com to identify the financial product.
+        name (:obj:`str`): name of the financial product, included in the :obj:`json` output.
+        header (:obj:`str`): name of the financial product as used in the header of the request.
+        from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+        to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+        currency (:obj:`str`, optional): currency in which the data is displayed.
+        exchange (:obj:`str`, optional): stock exchange that provides the data.
+        as_json (:obj:`bool`, optional): whether to return a :obj:`json` or a :obj:`pandas.DataFrame`.
+        order (:obj:`str`, optional): order of the data, either ascending (asc) or descending (desc).
+        interval (:obj:`str`, optional): interval of the data, either `Daily`, `Weekly` or `Monthly`.
+        fp (:obj:`file`, optional): file-like object to write the :obj:`json` to, see `write_json`.
+        compact (:obj:`bool`, optional): whether to write a compact :obj:`json` or not, see `write_json`.
+        resample (:obj:`bool`, optional):
+            if True and the interval is either `Weekly` or `Monthly`, the data is resampled from the daily data
+            of the financial product if it was retrieved for the whole date range during the current process,
+            see `resample_columns`, so that it is just retrieved from Investing.com if that is not the case.
+        dividends (:obj:`pandas.DataFrame`, optional):
+            dividends of the financial product as returned by `investpy.get_stock_dividends`, used to compute the
+            `Adj Close` and `Total Return` columns if the schema includes them, see `investpy.utils.adjustment`.
+        dtypes (:obj:`str` or :obj:`dict`, optional): dtypes of the :obj:`pandas.DataFrame`, see `format_data`.
+        session (:obj:`requests.Session`, optional):
+            session used to send the requests, if None, `investpy.utils.extra.pooled_session`.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`json`: historical data of the financial product.
+
+    Raises:
+        ConnectionError: raised if connection to Investing.com could not be established.
+        RuntimeError: raised if the historical data table could not be found in the response.
+        IndexError: raised if the historical data was unavailable or not found in Investing.com.
+
+    """
+
+    interval = interval.capitalize()
+
+    columns = None
+
+    if resample is True and interval != "Daily":
+        columns = _cached_daily_columns(schema, id_, from_date, to_date)
+
+        if columns is not None:
+            columns = resample_columns(columns, interval)
+
+    if columns is None:
+        windows = plan_windows(from_date, to_date, interval=interval)
+
+        columns = _retrieve_columns(
+            schema, id_, header, interval, windows=windows, session=session
+        )
+
+        if interval == "Daily":
+            entry = DAILY_DATA.get((schema.product, id_))
+
+            if entry is None or entry[0] > from_date or entry[1] < to_date:
+                DAILY_DATA.set((schema.product, id_), (from_date, to_date, columns))
+
+    if schema.adjusted or schema.total_return:
+        columns = adjust_columns(
+            columns,
+            dividends,
+            adjusted=schema.adjusted,
+            total_return=schema.total_return,
+        )
+
+    return format_data(
+        schema,
+        columns,
+        name,
+        "historical",
+        currency=currency,
+        exchange=exchange,
+        as_json=as_json,
+        order=order,
+        fp=fp,
+        compact=compact,
+        dtypes=dtypes,
+    )
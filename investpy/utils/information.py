@@ -0,0 +1,480 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+from unidecode import unidecode
+
+from .constant import OUTDATED2UPDATED
+from .extra import pooled_session, random_user_agent, resource_to_data
+
+INFORMATION_URL = "https://www.investing.com/"
+
+# Information fields normalized by `normalize_information`, both as shown in Investing.com and as updated
+INFORMATION_FIELDS = (
+    set(OUTDATED2UPDATED.keys()) | set(OUTDATED2UPDATED.values()) | {"Todays Range"}
+)
+
+NUMBER = r"([+-]?(?:\d[\d,]*)?\.?\d+)"
+MULTIPLIERS = {"": 1.0, "K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+MISSING = ["", "-", "--", "N/A", "NA"]
+
+
+class InformationSchema(object):
+    """Description of the information page of a financial product type, as shown in Investing.com.
+
+    This class contains everything needed to resolve the introduced financial products against the static
+    data files of investpy and to locate their information pages, so that the batch retrieval of the
+    information of every financial product type is handled by the same functions.
+
+    Args:
+        product (:obj:`str`): name of the financial product type, as used in the error messages.
+        resource (:obj:`str`): name of the static data file of the financial product type.
+        check (:obj:`str`): column of the static data file matched against the introduced names.
+        path (:obj:`str`): path of the information pages in Investing.com, followed by the tag.
+        name (:obj:`str`): column of the resulting information containing the name of the financial product.
+        country (:obj:`bool` or None):
+            True if the country is mandatory, False if it is optional and None if the financial product
+            type is not split by country.
+        args (:obj:`list`, optional): columns of the static data file passed to the parser after the name.
+
+    """
+
+    def __init__(self, product, resource, check, path, name, country, args=None):
+        self.product = product
+        self.resource = resource
+        self.check = check
+        self.path = path
+        self.name = name
+        self.country = country
+        self.args = list() if args is None else args
+
+
+INFORMATION = {
+    "stock": InformationSchema(
+        "stock", "stocks.csv", "symbol", "equities", "Stock Symbol", True
+    ),
+    "fund": InformationSchema("fund", "funds.csv", "name", "funds", "Fund Name", True),
+    "etf": InformationSchema("etf", "etfs.csv", "name", "etfs", "ETF Name", True),
+    "index": InformationSchema(
+        "index", "indices.csv", "name", "indices", "Index Name", True
+    ),
+    "currency_cross": InformationSchema(
+        "currency_cross",
+        "currency_crosses.csv",
+        "name",
+        "currencies",
+        "Currency Cross",
+        None,
+    ),
+    "bond": InformationSchema(
+        "bond", "bonds.csv", "name", "rates-bonds", "Bond Name", None
+    ),
+    "commodity": InformationSchema(
+        "commodity", "commodities.csv", "name", "commodities", "Commodity Name", False
+    ),
+    "crypto": InformationSchema(
+        "crypto",
+        "cryptos.csv",
+        "name",
+        "crypto",
+        "Crypto Currency",
+        None,
+        args=["currency"],
+    ),
+    "certificate": InformationSchema(
+        "certificate",
+        "certificates.csv",
+        "name",
+        "certificates",
+        "Certificate Name",
+        True,
+        args=["country"],
+    ),
+}
+
+
+def fetch_page(tag, path):
+    """
+    This function retrieves the information page of a financial product from Investing.com, using the
+    session shared by every request sent to Investing.com, see `investpy.utils.extra.pooled_session`.
+
+    Args:
+        tag (:obj:`str`): tag used by Investing.com to identify the financial product in its urls.
+        path (:obj:`str`): path of the information pages of the financial product type, e.g. `equities`.
+
+    Returns:
+        :obj:`str` - html: content of the information page of the financial product.
+
+    Raises:
+        ConnectionError: raised if the connection to Investing.com errored (did not return HTTP 200).
+
+    """
+
+    head = {
+        "User-Agent": random_user_agent(),
+        "X-Requested-With": "XMLHttpRequest",
+        "Accept": "text/html",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    req = pooled_session().get(INFORMATION_URL + path + "/" + tag, headers=head)
+
+    if req.status_code != 200:
+        raise ConnectionError(
+            "ERR#0015: error " + str(req.status_code) + ", try again later."
+        )
+
+    return req.text
+
+
+def resolve_instruments(schema, instruments, country=None):
+    """
+    This function resolves the introduced financial products against the static data file of their financial
+    product type at once, so that the file is read and normalized just once no matter how many financial
+    products are introduced, instead of once per financial product as done by the `get_*_information` functions.
+
+    Args:
+        schema (:obj:`investpy.utils.information.InformationSchema`): schema of the financial product type.
+        instruments (:obj:`list`):
+            names (or symbols, for stocks) of the financial products, or tuples of name and country, so that
+            financial products from different countries can be introduced together.
+        country (:obj:`str`, optional): country of the financial products introduced with no country.
+
+    Returns:
+        :obj:`list` - resolved:
+            The resulting :obj:`list` contains a :obj:`tuple` per introduced financial product, in the same
+            order, with its name, its tag, the arguments passed to its parser and the error message if it could
+            not be resolved, in which case the tag is None.
+
+    """
+
+    data = resource_to_data(path_to_data=schema.resource)
+
+    names = data[schema.check].apply(unidecode).str.lower().tolist()
+    countries = (
+        data["country"].str.lower().tolist()
+        if "country" in data.columns
+        else [None] * len(data)
+    )
+
+    # First row of every name and of every name and country, as the `get_*_information` functions do
+    positions = dict()
+    for position, (name, country_) in enumerate(zip(names, countries)):
+        positions.setdefault((name, None), position)
+        positions.setdefault((name, country_), position)
+
+    available = set(countries)
+
+    resolved = list()
+
+    for instrument in instruments:
+        if isinstance(instrument, (tuple, list)) and len(instrument) == 2:
+            name, country_ = instrument
+        else:
+            name, country_ = instrument, country
+
+        if not isinstance(name, str) or not name:
+            resolved.append(
+                (
+                    name,
+                    None,
+                    None,
+                    "ERR#0116: the parameter name must be specified and must be a"
+                    " string.",
+                )
+            )
+            continue
+
+        if schema.country is True and not isinstance(country_, str):
+            resolved.append(
+                (
+                    name,
+                    None,
+                    None,
+                    "ERR#0039: country can not be None, it should be a str.",
+                )
+            )
+            continue
+
+        key = unidecode(name.strip().lower())
+
+        if schema.country is not None and isinstance(country_, str):
+            country_ = unidecode(country_.strip().lower())
+
+            if country_ not in available:
+                resolved.append(
+                    (
+                        name,
+                        None,
+                        None,
+                        "ERR#0034: country "
+                        + country_
+                        + " not found, check if it is correct.",
+                    )
+                )
+                continue
+        else:
+            country_ = None
+
+        position = positions.get((key, country_))
+
+        if position is None:
+            resolved.append(
+                (
+                    name,
+                    None,
+                    None,
+                    "ERR#0122: introduced name does not exist in the introduced country (if"
+                    " required).",
+                )
+            )
+            continue
+
+        row = data.iloc[position]
+
+        if "status" in data.columns and row["status"] == "unavailable":
+            resolved.append(
+                (
+                    name,
+                    None,
+                    None,
+                    "ERR#0086: the selected " + schema.product + " is not available for"
+                    " retrieval in Investing.com.",
+                )
+            )
+            continue
+
+        resolved.append(
+            (
+                row[schema.check],
+                row["tag"],
+                [row[arg] for arg in schema.args],
+                None,
+            )
+        )
+
+    return resolved
+
+
+def retrieve_information(
+    schema,
+    instruments,
+    parser,
+    country=None,
+    max_workers=8,
+    processes=None,
+    numeric=False,
+):
+    """
+    This function retrieves the information of several financial products of the same type from Investing.com,
+    so that their information pages are requested concurrently using up to `max_workers` threads which share the
+    pooled session of `investpy.utils.extra.pooled_session`, and then parsed with the introduced parser, either
+    in the current process or in a pool of `processes` processes, since parsing the pages with lxml is CPU bound.
+    The financial products that could not be resolved, retrieved or parsed are not raised, but reported in the
+    `Error` column of the resulting :obj:`pandas.DataFrame`.
+
+    Args:
+        schema (:obj:`investpy.utils.information.InformationSchema`): schema of the financial product type.
+        instruments (:obj:`list`): financial products to retrieve, see `resolve_instruments`.
+        parser (:obj:`callable`):
+            module-level function which parses the information page of a financial product into a
+            :obj:`pandas.DataFrame` of a single row, called as `parser(html, name, *args)`.
+        country (:obj:`str`, optional): country of the financial products introduced with no country.
+        max_workers (:obj:`int`, optional): maximum number of information pages requested concurrently.
+        processes (:obj:`int`, optional): number of processes used to parse the pages, None to parse them in place.
+        numeric (:obj:`bool`, optional): whether to normalize the information fields or not, see `normalize_information`.
+
+    Returns:
+        :obj:`pandas.DataFrame` - information:
+            The resulting :obj:`pandas.DataFrame` contains a row per introduced financial product, in the same
+            order, with the columns returned by the parser plus the `Error` column, which is null for the
+            financial products whose information was successfully retrieved.
+
+    """
+
+    resolved = resolve_instruments(schema, instruments, country=country)
+
+    pending = [position for position, item in enumerate(resolved) if item[3] is None]
+
+    errors = {position: item[3] for position, item in enumerate(resolved)}
+    pages = dict()
+
+    def fetch(position):
+        try:
+            pages[position] = fetch_page(resolved[position][1], schema.path)
+        except Exception as e:
+            errors[position] = str(e)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(fetch, pending))
+
+    fetched = [position for position in pending if position in pages]
+
+    jobs = [
+        (parser, pages.pop(position), resolved[position][0], resolved[position][2])
+        for position in fetched
+    ]
+
+    if processes is not None and jobs:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_parse, jobs))
+    else:
+        results = [_parse(job) for job in jobs]
+
+    frames = dict()
+    for position, (frame, error) in zip(fetched, results):
+        if error is not None:
+            errors[position] = error
+        else:
+            frames[position] = frame
+
+    rows = list()
+    for position, item in enumerate(resolved):
+        if position in frames:
+            row = frames[position].iloc[0].to_dict()
+        else:
+            row = {schema.name: item[0]}
+        row["Error"] = errors[position]
+        rows.append(row)
+
+    columns = list()
+    for frame in frames.values():
+        columns.extend(column for column in frame.columns if column not in columns)
+
+    if schema.name not in columns:
+        columns.insert(0, schema.name)
+
+    data = pd.DataFrame(rows, columns=columns + ["Error"])
+
+    if numeric is True:
+        data = normalize_information(data)
+
+    return data
+
+
+def normalize_information(data):
+    """
+    This function converts the information fields of several financial products, as retrieved by the batch
+    `get_*_information` functions, into numeric columns at once, using vectorized string operations over every
+    column instead of parsing every value of every financial product in Python. So on, the values with the `K`,
+    `M`, `B` or `T` suffixes are multiplied accordingly, the percentages are converted into their numeric value
+    (so that `-9.45%` is -9.45), the ranges such as `4.760 - 4.842` are split into their `Low` and `High` columns
+    and the dividends with their yield such as `0.26 (5.40%)` are split into the dividend and its `Yield` column.
+    Just the fields listed in `investpy.utils.constant.OUTDATED2UPDATED` are normalized, and just if at least half
+    of the values of the column follow the same format, where the values that do not follow it are set to NaN, so
+    that dates or names are kept as they are.
+
+    Args:
+        data (:obj:`pandas.DataFrame`): information of several financial products, a row per financial product.
+
+    Returns:
+        :obj:`pandas.DataFrame` - information:
+            The resulting :obj:`pandas.DataFrame` contains the same rows and columns as the introduced one, but
+            with the numeric fields as `float64` columns, and the ranges and dividends split into two columns
+            each, placed where the original column was, e.g. `52 wk Range` is split into `52 wk Range Low` and
+            `52 wk Range High`.
+
+    """
+
+    columns = dict()
+
+    for column in data.columns:
+        values = data[column]
+
+        if column not in INFORMATION_FIELDS or pd.api.types.is_numeric_dtype(values):
+            columns[column] = values
+            continue
+
+        numbers = pd.to_numeric(values, errors="coerce")
+
+        text = values.astype(object).where(values.notna() & numbers.isna())
+        text = text.astype("string").str.strip()
+        text = text.where(~text.isin(MISSING))
+
+        present = text.notna()
+
+        if not present.any():
+            columns[column] = numbers.astype("float64")
+            continue
+
+        text = text[present]
+
+        # Every cell is converted on its own, so that the columns where at least half of the cells follow the same
+        # format are normalized, and the cells that do not follow it are set to NaN
+        majority = len(text) / 2
+
+        ranges = text.str.extract(
+            "^" + NUMBER + r"([KMBT%]?)\s+-\s+" + NUMBER + "([KMBT%]?)$"
+        )
+        if ranges[0].notna().sum() >= majority:
+            low, high = numbers.copy(), numbers.copy()
+            low[present] = _to_numbers(ranges[0], ranges[1])
+            high[present] = _to_numbers(ranges[2], ranges[3])
+            columns[_suffixed(column, "Low")] = low.astype("float64")
+            columns[_suffixed(column, "High")] = high.astype("float64")
+            continue
+
+        dividends = text.str.extract("^" + NUMBER + r"\s*\(" + NUMBER + r"%\)$")
+        if dividends[0].notna().sum() >= majority:
+            yields = pd.Series(float("nan"), index=numbers.index)
+            numbers[present] = _to_numbers(dividends[0])
+            yields[present] = _to_numbers(dividends[1])
+            base = column[: -len(" (Yield)")] if column.endswith(" (Yield)") else column
+            columns[base] = numbers.astype("float64")
+            columns[_suffixed(base, "Yield")] = yields.astype("float64")
+            continue
+
+        single = text.str.extract("^" + NUMBER + "([KMBT%]?)$")
+        if single[0].notna().sum() >= majority:
+            numbers[present] = _to_numbers(single[0], single[1])
+            columns[column] = numbers.astype("float64")
+            continue
+
+        columns[column] = values
+
+    return pd.DataFrame(columns, index=data.index)
+
+
+def _to_numbers(numbers, suffixes=None):
+    values = pd.to_numeric(numbers.str.replace(",", "", regex=False), errors="coerce")
+    values = values.astype("float64")
+
+    if suffixes is not None:
+        values = values * suffixes.map(MULTIPLIERS).fillna(1.0).astype("float64")
+
+    return values
+
+
+def check_workers(max_workers, processes):
+    """Checks the max_workers and processes arguments of the batch functions, see `retrieve_information`."""
+    if (
+        not isinstance(max_workers, int)
+        or isinstance(max_workers, bool)
+        or max_workers < 1
+    ):
+        raise ValueError("ERR#0152: max_workers argument can just be an int > 0.")
+
+    if processes is not None and (
+        not isinstance(processes, int) or isinstance(processes, bool) or processes < 1
+    ):
+        raise ValueError("ERR#0163: processes argument can just be None or an int > 0.")
+
+
+def _suffixed(column, suffix):
+    # The updated information fields are camel cased, e.g. `weekRange` is split into `weekRangeLow`
+    if " " not in column and column[:1].islower():
+        return column + suffix
+    return column + " " + suffix
+
+
+def _parse(job):
+    parser, html, name, args = job
+
+    try:
+        return parser(html, name, *args), None
+    except Exception as e:
+        return None, str(e)
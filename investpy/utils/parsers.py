@@ -0,0 +1,311 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+from lxml import etree
+from lxml.html import fromstring
+
+from . import constant as cst
+
+HISTORICAL_ROWS = etree.XPath(".//table[@id='curr_table']/tbody/tr")
+TECHNICAL_ROWS = etree.XPath(
+    ".//table[contains(@class, 'technicalIndicatorsTbl')]/tbody/tr"
+)
+ROW_CELLS = etree.XPath(".//td")
+
+PARSER_ENGINES = ["xpath", "target"]
+
+NO_RESULTS = "No results found"
+
+_engines = dict(cst.PARSER_ENGINES)
+
+
+def set_parser_engine(endpoint, engine):
+    """
+    This function sets the table extraction engine to be used when parsing the responses of the
+    introduced endpoint. The `xpath` engine builds the full DOM of the response and then queries it
+    with precompiled :obj:`lxml.etree.XPath` expressions, while the `target` engine uses a SAX-style
+    parser target which just keeps the cells of the table of interest, so that no tree is built.
+
+    Args:
+        endpoint (:obj:`str`): name of the endpoint, which can either be `historical` or `technical`.
+        engine (:obj:`str`): name of the extraction engine, which can either be `xpath` or `target`.
+
+    Raises:
+        ValueError: raised if either the introduced endpoint or engine are not valid.
+
+    """
+
+    if endpoint not in _engines:
+        raise ValueError(
+            "ERR#0139: endpoint value not valid, available values are: "
+            + ", ".join(_engines.keys())
+        )
+
+    if engine not in PARSER_ENGINES:
+        raise ValueError(
+            "ERR#0140: parser engine value not valid, available values are: "
+            + ", ".join(PARSER_ENGINES)
+        )
+
+    _engines[endpoint] = engine
+
+
+def get_parser_engine(endpoint):
+    """
+    This function returns the name of the table extraction engine currently in use for the introduced
+    endpoint, which will be the one defined in `investpy.utils.constant.PARSER_ENGINES` unless it was
+    changed via `investpy.utils.parsers.set_parser_engine`.
+
+    """
+
+    return _engines[endpoint]
+
+
+class TableTarget(object):
+    """Parser target which just collects the cells of the rows of a single HTML table.
+
+    This class is meant to be used as the target of an :obj:`lxml.etree.HTMLParser`, so that the
+    parser does not build any tree, but just sends the start/end/data events to this class, which
+    keeps the cells of the rows of the first table matching either the introduced id or class.
+    Every cell is stored as a :obj:`tuple` containing its `class`, its `data-real-value` and its
+    text content (just kept for the cells with no `data-real-value`, so to avoid joining text that
+    will not be used), and every row as a :obj:`list` of cells, so that the parser returns a
+    :obj:`list` of rows or :obj:`None` if the table was not found.
+
+    Args:
+        table_id (:obj:`str`, optional): value of the `id` attribute of the table to collect.
+        table_class (:obj:`str`, optional): value contained in the `class` attribute of the table to collect.
+
+    """
+
+    def __init__(self, table_id=None, table_class=None):
+        self.table_id = table_id
+        self.table_class = table_class
+
+        self.rows = None
+        self.depth = 0
+        self.done = False
+        self.row = None
+        self.cell = None
+        self.text = None
+
+    def _is_table(self, attrib):
+        if self.table_id is not None:
+            return attrib.get("id") == self.table_id
+        return self.table_class in (attrib.get("class") or "")
+
+    def start(self, tag, attrib):
+        if self.done:
+            return
+
+        if tag == "table":
+            if self.depth > 0:
+                self.depth += 1
+            elif self._is_table(attrib):
+                self.depth = 1
+                self.rows = list()
+            return
+
+        if self.depth != 1:
+            return
+
+        if tag == "tr":
+            self.row = list()
+        elif tag == "td" and self.row is not None:
+            value = attrib.get("data-real-value")
+            self.cell = (attrib.get("class"), value)
+            self.text = list() if value is None else None
+
+    def end(self, tag):
+        if self.depth == 0 or self.done:
+            return
+
+        if tag == "table":
+            self.depth -= 1
+            if self.depth == 0:
+                self.done = True
+            return
+
+        if self.depth != 1:
+            return
+
+        if tag == "td" and self.cell is not None:
+            self.row.append(self.cell + ("".join(self.text or ""),))
+            self.cell = self.text = None
+        elif tag == "tr" and self.row is not None:
+            if self.row:
+                self.rows.append(self.row)
+            self.row = None
+
+    def data(self, data):
+        if self.text is not None:
+            self.text.append(data)
+
+    def close(self):
+        return self.rows
+
+
+def _target_rows(html, table_id=None, table_class=None):
+    parser = etree.HTMLParser(
+        target=TableTarget(table_id=table_id, table_class=table_class)
+    )
+    return etree.fromstring(html, parser)
+
+
+def _xpath_rows(path_):
+    rows = list()
+
+    for row in path_:
+        cells = [
+            (cell.get("class"), cell.get("data-real-value"), cell.text_content())
+            for cell in ROW_CELLS(row)
+        ]
+        if cells:
+            rows.append(cells)
+
+    return rows
+
+
+def historical_rows(html, engine=None, text_fallback=False):
+    """
+    This function extracts the values of the cells of the historical data table (`curr_table`) from
+    the HTML response of the `HistoricalDataAjax` endpoint of Investing.com, using either the `xpath`
+    or the `target` engine. By default the engine set for the `historical` endpoint is used.
+
+    Args:
+        html (:obj:`str`): HTML response from Investing.com.
+        engine (:obj:`str`, optional): name of the extraction engine to use, either `xpath` or `target`.
+        text_fallback (:obj:`bool`, optional):
+            if True, the text content of the cells with no `data-real-value` will be returned instead of None.
+
+    Returns:
+        :obj:`list` - rows:
+            The resulting :obj:`list` contains a :obj:`list` with the `data-real-value` of every cell per
+            row, in the same order as displayed in Investing.com (newest first). If Investing.com returned
+            the "No results found" row, an empty :obj:`list` is returned, and if the historical data
+            table was not found in the response, :obj:`None` is returned instead.
+
+    """
+
+    engine = engine or _engines["historical"]
+
+    if engine == "target":
+        rows = _target_rows(html, table_id="curr_table")
+
+        if not rows:
+            return None
+
+        if rows[0][0][2] == NO_RESULTS:
+            return list()
+
+        if text_fallback:
+            return [
+                [value if value is not None else text for _, value, text in row]
+                for row in rows
+            ]
+
+        return [[value for _, value, _ in row] for row in rows]
+
+    if engine != "xpath":
+        raise ValueError(
+            "ERR#0140: parser engine value not valid, available values are: "
+            + ", ".join(PARSER_ENGINES)
+        )
+
+    rows = [
+        cells for cells in map(ROW_CELLS, HISTORICAL_ROWS(fromstring(html))) if cells
+    ]
+
+    if not rows:
+        return None
+
+    if rows[0][0].text_content() == NO_RESULTS:
+        return list()
+
+    if text_fallback:
+        return [
+            [
+                cell.get("data-real-value")
+                if cell.get("data-real-value") is not None
+                else cell.text_content()
+                for cell in cells
+            ]
+            for cells in rows
+        ]
+
+    return [[cell.get("data-real-value") for cell in cells] for cells in rows]
+
+
+def technical_rows(html, engine=None):
+    """
+    This function extracts the technical indicators table (`technicalIndicatorsTbl`) from the HTML
+    response of the `GetTechincalData` endpoint of Investing.com, using either the `xpath` or the
+    `target` engine. By default the engine set for the `technical` endpoint is used.
+
+    Args:
+        html (:obj:`str`): HTML response from Investing.com.
+        engine (:obj:`str`, optional): name of the extraction engine to use, either `xpath` or `target`.
+
+    Returns:
+        :obj:`list` - rows:
+            The resulting :obj:`list` contains a :obj:`tuple` per technical indicator with its name,
+            value and signal as displayed in Investing.com, so all of them are :obj:`str` values.
+
+    """
+
+    engine = engine or _engines["technical"]
+
+    if engine == "target":
+        rows = _target_rows(html, table_class="technicalIndicatorsTbl") or list()
+    elif engine == "xpath":
+        rows = _xpath_rows(TECHNICAL_ROWS(fromstring(html)))
+    else:
+        raise ValueError(
+            "ERR#0140: parser engine value not valid, available values are: "
+            + ", ".join(PARSER_ENGINES)
+        )
+
+    results = list()
+
+    for row in rows:
+        for index, (class_, _, text) in enumerate(row):
+            if class_ is not None and class_.__contains__("symbol"):
+                results.append(
+                    (text.strip(), row[index + 1][2].strip(), row[index + 2][2].strip())
+                )
+
+    return results
+
+
+def overview_cells(row):
+    """
+    This function indexes the cells of a row of an overview table from Investing.com (e.g. the one retrieved
+    by `investpy.get_stocks_overview`) in a single pass over them, so that every value of the row is then
+    accessed by key instead of running an XPath query per value, which had to be built (and so compiled) for
+    every row since the classes of the cells contain the ID of the financial product, e.g. `pid-32237-last`.
+    So on, every cell is indexed by the suffix of its `pid-<id>-<suffix>` class, if any, so that the previous
+    cell is indexed as `last`, and also by every other class it has, e.g. `flag`, `elp` or `symbol`, where the
+    first cell of every key is kept, as the XPath queries did.
+
+    Args:
+        row (:obj:`lxml.html.HtmlElement`): row (`tr`) of the overview table.
+
+    Returns:
+        :obj:`dict` - cells: cells (`td`) of the row, as :obj:`lxml.html.HtmlElement`, indexed by class.
+
+    """
+
+    cells = dict()
+
+    for cell in row:
+        if cell.tag != "td":
+            continue
+
+        for class_ in (cell.get("class") or "").split():
+            if class_.startswith("pid-"):
+                class_ = class_.split("-", 2)[-1]
+
+            if class_ not in cells:
+                cells[class_] = cell
+
+    return cells
@@ -0,0 +1,601 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from importlib import import_module
+from threading import Event, Lock, Thread
+
+import numpy as np
+import pandas as pd
+from unidecode import unidecode
+
+from . import historical
+from .extra import resource_to_data
+from .historical import SCHEMAS, parse_rows
+
+# Resource file, column matched against the introduced name and column sent as header, per product type
+INSTRUMENTS = {
+    "stock": ("stocks.csv", "symbol", "symbol"),
+    "fund": ("funds.csv", "name", "symbol"),
+    "etf": ("etfs.csv", "name", "symbol"),
+    "index": ("indices.csv", "name", "full_name"),
+    "currency_cross": ("currency_crosses.csv", "name", "name"),
+    "bond": ("bonds.csv", "name", "full_name"),
+    "commodity": ("commodities.csv", "name", "full_name"),
+    "crypto": ("cryptos.csv", "name", "name"),
+    "certificate": ("certificates.csv", "name", "symbol"),
+}
+
+# Overview function and columns identifying every row of the overview, per product type
+OVERVIEWS = {
+    "stock": ("get_stocks_overview", ["country", "name"]),
+    "fund": ("get_funds_overview", ["country", "name"]),
+    "etf": ("get_etfs_overview", ["country", "name"]),
+    "index": ("get_indices_overview", ["country", "name"]),
+    "currency_cross": ("get_currency_crosses_overview", ["name"]),
+    "bond": ("get_bonds_overview", ["country", "name"]),
+    "commodity": ("get_commodities_overview", ["country", "name"]),
+    "crypto": ("get_cryptos_overview", ["symbol"]),
+    "certificate": ("get_certificates_overview", ["country", "name"]),
+}
+
+
+class RingBuffer(object):
+    """Fixed-capacity buffer of the latest bars of a financial product.
+
+    This class keeps the latest `capacity` bars of a financial product in a preallocated :obj:`numpy.ndarray`
+    of dates and another one of values (a column per value column), so that appending the new bars retrieved
+    from Investing.com neither copies nor grows the already kept ones. Once the buffer is full, every new bar
+    overwrites the oldest one.
+
+    Args:
+        columns (:obj:`list`): names of the value columns, as in `investpy.utils.historical.HistoricalSchema`.
+        capacity (:obj:`int`): maximum number of bars kept.
+
+    """
+
+    def __init__(self, columns, capacity):
+        self.columns = list(columns)
+        self.capacity = capacity
+
+        self.dates = np.zeros(capacity, dtype="datetime64[D]")
+        self.values = np.full((capacity, len(self.columns)), np.nan, dtype="float64")
+
+        self.start = 0
+        self.size = 0
+
+    @property
+    def last_date(self):
+        if self.size == 0:
+            return None
+        return self.dates[(self.start + self.size - 1) % self.capacity]
+
+    def extend(self, columns):
+        """
+        Appends the introduced bars, sorted descending (newest first) as returned by `parse_rows`, to the buffer,
+        so that the bars older than the last one kept are ignored, the bar of the same date as the last one kept
+        replaces it if any of its values changed, and the newer bars are appended.
+
+        Returns:
+            :obj:`list` - positions: positions of the bars that were either appended or replaced, sorted by date.
+
+        """
+
+        dates = columns["Date"][::-1]
+        values = np.column_stack([columns[column][::-1] for column in self.columns])
+
+        changed = list()
+
+        for date_, row in zip(dates, values):
+            last = self.last_date
+
+            if last is not None and date_ < last:
+                continue
+
+            if last is not None and date_ == last:
+                position = (self.start + self.size - 1) % self.capacity
+                if np.array_equal(self.values[position], row, equal_nan=True):
+                    continue
+            elif self.size < self.capacity:
+                position = (self.start + self.size) % self.capacity
+                self.size += 1
+            else:
+                position = self.start
+                self.start = (self.start + 1) % self.capacity
+
+            self.dates[position] = date_
+            self.values[position] = row
+
+            changed.append(position)
+
+        # Positions overwritten within the same call are just reported once, in chronological order
+        positions, seen = list(), set()
+        for position in reversed(changed):
+            if position not in seen:
+                seen.add(position)
+                positions.append(position)
+
+        return positions[::-1]
+
+    def to_frame(self, positions=None):
+        """Returns the introduced positions (every bar by default) as a :obj:`pandas.DataFrame` sorted ascending."""
+        if positions is None:
+            positions = (self.start + np.arange(self.size)) % self.capacity
+
+        data = pd.DataFrame(
+            self.values[positions],
+            index=pd.DatetimeIndex(self.dates[positions], name="Date"),
+            columns=self.columns,
+        )
+
+        if "Volume" in data.columns:
+            data["Volume"] = data["Volume"].astype("int64")
+
+        return data
+
+
+class Instrument(object):
+    """Financial product watched by a :obj:`investpy.utils.poller.Poller`, with its schedule and its bars."""
+
+    def __init__(self, key, schema, id_, header, cadence, capacity):
+        self.key = key
+        self.schema = schema
+        self.id_ = id_
+        self.header = header
+        self.cadence = cadence
+
+        columns = [
+            column
+            for column in schema.columns
+            if column not in ["Currency", "Exchange"]
+        ]
+
+        self.buffer = RingBuffer(columns, capacity)
+
+        self.next_run = 0.0
+        self.error = None
+
+
+class Poller(object):
+    """Long-running poller which keeps the latest bars of a watchlist of financial products updated.
+
+    This class refreshes the bars of every watched financial product every `cadence` seconds, so that the first
+    refresh retrieves its recent data from Investing.com and the following ones just request the bars since the
+    last one kept, which are appended to a per-instrument :obj:`investpy.utils.poller.RingBuffer`. Every
+    refresh which appends or updates any bar calls the subscribed callbacks with the key of the financial product
+    and a :obj:`pandas.DataFrame` containing just those bars. The refreshes are sent concurrently using up to
+    `max_workers` threads, which share the pooled session of `investpy.utils.extra.pooled_session`.
+
+    Args:
+        interval (:obj:`str`, optional): interval of the bars, either `Daily`, `Weekly` or `Monthly`.
+        cadence (:obj:`int`, optional): default seconds between the refreshes of every financial product.
+        max_workers (:obj:`int`, optional): maximum number of refreshes sent concurrently.
+        capacity (:obj:`int`, optional): maximum number of bars kept per financial product.
+
+    Examples:
+        >>> poller = Poller(cadence=60, max_workers=16)
+        >>> poller.add('stock', 'bbva', country='spain')
+        >>> poller.add('index', 'ibex 35', country='spain', cadence=30)
+        >>> poller.subscribe(lambda key, bars: print(key, bars))
+        >>> poller.start()
+        >>> poller.data(('stock', 'bbva', 'spain')).tail()
+
+    """
+
+    def __init__(self, interval="Daily", cadence=60, max_workers=8, capacity=1024):
+        if not isinstance(interval, str) or interval.lower() not in [
+            "daily",
+            "weekly",
+            "monthly",
+        ]:
+            raise ValueError(
+                "ERR#0073: interval value should be a str type and it can just be either"
+                " 'Daily', 'Weekly' or 'Monthly'."
+            )
+
+        _check_cadence(cadence)
+
+        self.interval = interval.capitalize()
+        self.cadence = cadence
+        self.max_workers = max_workers
+        self.capacity = capacity
+
+        self.instruments = dict()
+        self.callbacks = list()
+
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread = None
+        self._executor = None
+
+    def add(self, product_type, name, country=None, cadence=None):
+        """
+        Adds the introduced financial product to the watchlist, looking it up in the static data files of
+        investpy as done by the historical data functions, and returns the key that identifies it, which is
+        a :obj:`tuple` of the product type, name and country, as introduced but lower cased.
+
+        """
+
+        if product_type not in INSTRUMENTS:
+            raise ValueError(
+                "ERR#0119: introduced product_type value does not exist. Available values"
+                " are: " + ", ".join(INSTRUMENTS.keys())
+            )
+
+        if not isinstance(name, str) or not name:
+            raise ValueError(
+                "ERR#0116: the parameter name must be specified and must be a string."
+            )
+
+        if country is not None and not isinstance(country, str):
+            raise ValueError(
+                "ERR#0117: this parameter can just be None or a string, if required."
+            )
+
+        path, check, header = INSTRUMENTS[product_type]
+
+        data = resource_to_data(path_to_data=path)
+
+        name = unidecode(name.lower().strip())
+
+        if country is not None:
+            country = unidecode(country.lower().strip())
+
+            if "country" not in data.columns or country not in set(
+                data["country"].str.lower()
+            ):
+                raise ValueError(
+                    "ERR#0124: introduced country does not exist or is not available."
+                )
+
+            data = data[data["country"].str.lower() == country]
+
+        matches = data[check].apply(unidecode).str.lower() == name
+
+        if not matches.any():
+            raise ValueError(
+                "ERR#0122: introduced name does not exist in the introduced country (if"
+                " required)."
+            )
+
+        row = data.loc[matches.idxmax()]
+
+        key = (product_type, name, country)
+
+        self.add_instrument(
+            key, SCHEMAS[product_type], int(row["id"]), row[header], cadence=cadence
+        )
+
+        return key
+
+    def add_instrument(self, key, schema, id_, header, cadence=None):
+        """
+        Adds a financial product to the watchlist given the values used by Investing.com to identify it, so with
+        no lookup, where `key` is any hashable value used to identify it in the callbacks and in `data`.
+
+        """
+
+        cadence = self.cadence if cadence is None else cadence
+
+        _check_cadence(cadence)
+
+        with self._lock:
+            self.instruments[key] = Instrument(
+                key, schema, id_, header, cadence, self.capacity
+            )
+
+    def remove(self, key):
+        """Removes the introduced financial product from the watchlist."""
+        with self._lock:
+            self.instruments.pop(key, None)
+
+    def subscribe(self, callback):
+        """Subscribes a callable to the changes, called as `callback(key, bars)` after every change."""
+        self.callbacks.append(callback)
+
+    def data(self, key):
+        """Returns every bar kept of the introduced financial product as a :obj:`pandas.DataFrame`."""
+        return self.instruments[key].buffer.to_frame()
+
+    def errors(self):
+        """Returns the last error of every financial product whose last refresh failed."""
+        return {
+            key: instrument.error
+            for key, instrument in list(self.instruments.items())
+            if instrument.error is not None
+        }
+
+    def poll(self, force=False):
+        """
+        Refreshes every financial product whose refresh is due (or every one if `force` is True), sending up to
+        `max_workers` requests concurrently, and returns the number of financial products whose bars changed.
+
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            due = [
+                instrument
+                for instrument in self.instruments.values()
+                if force or instrument.next_run <= now
+            ]
+
+        if not due:
+            return 0
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        return sum(self._executor.map(self._refresh, due))
+
+    def start(self):
+        """Starts polling on a background thread until `stop` is called."""
+        if self.running:
+            return
+
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="investpy-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stops the background polling, waiting for the running refreshes to finish."""
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.poll()
+
+            with self._lock:
+                next_run = min(
+                    (instrument.next_run for instrument in self.instruments.values()),
+                    default=time.monotonic() + self.cadence,
+                )
+
+            self._stop.wait(max(next_run - time.monotonic(), 0.01))
+
+    def _refresh(self, instrument):
+        instrument.next_run = time.monotonic() + instrument.cadence
+
+        header = instrument.schema.header.format(instrument.header)
+        last = instrument.buffer.last_date
+
+        window = None
+        if last is not None:
+            window = (
+                last.item().strftime("%m/%d/%Y"),
+                (date.today() + timedelta(days=1)).strftime("%m/%d/%Y"),
+            )
+
+        try:
+            rows = historical.fetch_rows(
+                instrument.id_, header, self.interval, window=window
+            )
+        except Exception as e:
+            instrument.error = e
+            return False
+
+        if rows is None:
+            instrument.error = RuntimeError(
+                "ERR#0004: data retrieval error while scraping."
+            )
+            return False
+
+        instrument.error = None
+
+        if not rows:
+            return False
+
+        changed = instrument.buffer.extend(parse_rows(instrument.schema, rows))
+
+        if not changed:
+            return False
+
+        bars = instrument.buffer.to_frame(changed)
+
+        for callback in list(self.callbacks):
+            try:
+                callback(instrument.key, bars)
+            except Exception as e:
+                # A failing callback must not stop the refreshes of the rest of the watchlist
+                instrument.error = e
+
+        return True
+
+
+class OverviewPoller(object):
+    """Long-running poller which publishes just the rows of an overview that changed between refreshes.
+
+    This class refreshes the overview of a financial product type (e.g. `investpy.get_stocks_overview`) every
+    `cadence` seconds, which is the cheapest way to retrieve the live quotes of up to 1000 financial products per
+    request, and compares every refresh against the previous one, see `diff_overview`. Every refresh with any
+    new, changed or removed row calls the subscribed callbacks with a :obj:`pandas.DataFrame` containing just
+    those rows, so that the consumers process the changes instead of the whole overview every time.
+
+    Args:
+        product_type (:obj:`str`): financial product type, e.g. `stock`, see `investpy.utils.poller.OVERVIEWS`.
+        cadence (:obj:`int`, optional): seconds between the refreshes of the overview.
+        **kwargs: arguments of the overview function, e.g. `country='spain', n_results=1000`.
+
+    Examples:
+        >>> poller = OverviewPoller('stock', cadence=30, country='spain', n_results=1000)
+        >>> poller.subscribe(lambda changes: print(changes))
+        >>> poller.start()
+        >>> poller.snapshot.head()
+
+    """
+
+    def __init__(self, product_type, cadence=60, **kwargs):
+        if product_type not in OVERVIEWS:
+            raise ValueError(
+                "ERR#0119: introduced product_type value does not exist. Available values"
+                " are: " + ", ".join(OVERVIEWS.keys())
+            )
+
+        _check_cadence(cadence)
+
+        name, self.key = OVERVIEWS[product_type]
+
+        # Resolved when used so that this module does not import the package on its import
+        self.function = getattr(import_module("investpy"), name)
+        self.kwargs = dict(kwargs, as_json=False)
+
+        self.cadence = cadence
+        self.callbacks = list()
+
+        self.snapshot = None
+        self.error = None
+
+        self._stop = Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        """Subscribes a callable to the changes, called as `callback(changes)` after every change."""
+        self.callbacks.append(callback)
+
+    def poll(self):
+        """
+        Refreshes the overview and returns its rows that changed since the previous refresh, every row on the
+        first refresh, as returned by `diff_overview`, or None if the refresh failed, see `error`.
+
+        """
+
+        timestamp = pd.Timestamp.now(tz="UTC")
+
+        try:
+            current = self.function(**self.kwargs)
+        except Exception as e:
+            self.error = e
+            return None
+
+        self.error = None
+
+        changes = diff_overview(self.snapshot, current, self.key, timestamp=timestamp)
+
+        self.snapshot = current
+
+        if len(changes) > 0:
+            for callback in list(self.callbacks):
+                try:
+                    callback(changes)
+                except Exception as e:
+                    # A failing callback must not stop the following refreshes
+                    self.error = e
+
+        return changes
+
+    def start(self):
+        """Starts polling on a background thread until `stop` is called."""
+        if self.running:
+            return
+
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._run, name="investpy-overview-poller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stops the background polling, waiting for the running refresh to finish."""
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.poll()
+            self._stop.wait(max(self.cadence - (time.monotonic() - started), 0.01))
+
+
+def diff_overview(previous, current, key, timestamp=None):
+    """
+    This function compares two snapshots of an overview, as retrieved by any of the overview functions (e.g.
+    `investpy.get_stocks_overview`), matching their rows by the introduced key columns, so that the values of
+    every row present in both snapshots are compared at once, column by column, instead of row by row.
+
+    Args:
+        previous (:obj:`pandas.DataFrame`): previous snapshot of the overview, or None if there is none.
+        current (:obj:`pandas.DataFrame`): current snapshot of the overview.
+        key (:obj:`list`): columns identifying every row of the overview, e.g. `['country', 'name']`.
+        timestamp (:obj:`pandas.Timestamp`, optional): time of the current snapshot, now by default.
+
+    Returns:
+        :obj:`pandas.DataFrame` - changes:
+            The resulting :obj:`pandas.DataFrame` contains the rows of the current snapshot which are either
+            new or whose values changed, in the same order, followed by the rows of the previous snapshot which
+            are no longer present, with the columns of the overview plus the `event` column, which is either `new`, `changed`
+            or `removed`, and the `timestamp` column.
+
+    """
+
+    if timestamp is None:
+        timestamp = pd.Timestamp.now(tz="UTC")
+
+    columns = list(current.columns)
+
+    current = current.drop_duplicates(subset=key).set_index(key)
+
+    found = np.zeros(len(current), dtype="bool")
+    changed = np.zeros(len(current), dtype="bool")
+
+    removed = current.iloc[:0]
+
+    if previous is not None and len(previous) > 0:
+        previous = previous.drop_duplicates(subset=key).set_index(key)
+        previous = previous.reindex(columns=current.columns)
+
+        found = current.index.isin(previous.index)
+
+        after = current[found]
+        before = previous.loc[after.index]
+
+        # Values are compared all at once, where missing values are equal to each other
+        equal = (after.values == before.values) | (pd.isnull(after) & pd.isnull(before))
+        changed[found] = ~np.asarray(equal).all(axis=1)
+
+        removed = previous[~previous.index.isin(current.index)]
+
+    updated = current[~found | changed]
+
+    changes = pd.concat(
+        [
+            updated.assign(event=np.where(found[~found | changed], "changed", "new")),
+            removed.assign(event="removed"),
+        ]
+    )
+
+    changes["timestamp"] = timestamp
+
+    return changes.reset_index()[columns + ["event", "timestamp"]]
+
+
+def _check_cadence(cadence):
+    if (
+        not isinstance(cadence, (int, float))
+        or isinstance(cadence, bool)
+        or cadence <= 0
+    ):
+        raise ValueError(
+            "ERR#0149: cadence argument can just be a number of seconds > 0."
+        )
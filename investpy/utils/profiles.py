@@ -0,0 +1,175 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from lxml.html import fromstring
+
+from .extra import pooled_session, random_user_agent
+from .information import InformationSchema
+
+PROFILE_SOURCES = {
+    "english": "Investing",
+    "en": "Investing",
+    "spanish": "Bolsa de Madrid",
+    "es": "Bolsa de Madrid",
+}
+
+# Stocks resolved as `get_stock_company_profile` does, keeping their country and ISIN
+PROFILES_SCHEMA = InformationSchema(
+    "stock",
+    "stocks.csv",
+    "symbol",
+    "equities",
+    "Stock Symbol",
+    True,
+    args=["country", "isin"],
+)
+
+
+def fetch_company_profile(source, tag, isin, cache, session=None):
+    """
+    This function retrieves the company profile of a stock from the introduced source, either Investing.com
+    (english), where the profile is identified by the tag of the stock, or Bolsa de Madrid (spanish), where it is
+    identified by its ISIN. Since company profiles barely change, every retrieved profile with a description is kept
+    in the introduced cache per (tag or ISIN, source) pair, so that it is just retrieved again once it expires.
+
+    Args:
+        source (:obj:`str`): source of the company profile, either `Investing` or `Bolsa de Madrid`.
+        tag (:obj:`str`): tag used by Investing.com to identify the stock in its urls.
+        isin (:obj:`str`): ISIN code of the stock.
+        cache (:obj:`investpy.utils.cache.Cache`): cache of the company profiles per (tag or ISIN, source) pair.
+        session (:obj:`requests.Session`, optional): session used to send the request, if None, `requests` is used.
+
+    Returns:
+        :obj:`dict` - company_profile: company profile of the stock, with its `url` and `desc`, as a new :obj:`dict`.
+
+    Raises:
+        ConnectionError: raised if the connection to the source errored (did not return HTTP 200).
+
+    """
+
+    key = (isin if source == "Bolsa de Madrid" else tag, source)
+
+    company_profile = cache.get(key)
+
+    if company_profile is not None:
+        return dict(company_profile)
+
+    session = requests if session is None else session
+
+    company_profile = {"url": None, "desc": None}
+
+    if source == "Bolsa de Madrid":
+        url = "http://www.bolsamadrid.es/esp/aspx/Empresas/FichaValor.aspx?ISIN=" + isin
+    else:
+        url = "https://www.investing.com/equities/" + tag + "-company-profile"
+
+    company_profile["url"] = url
+
+    head = {
+        "User-Agent": random_user_agent(),
+        "X-Requested-With": "XMLHttpRequest",
+        "Accept": "text/html",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    req = session.get(url, headers=head)
+
+    if req.status_code != 200:
+        raise ConnectionError(
+            "ERR#0015: error " + str(req.status_code) + ", try again later."
+        )
+
+    root_ = fromstring(req.text)
+
+    if source == "Bolsa de Madrid":
+        path_ = root_.xpath(".//td[contains(@class, 'Perfil')]/p")
+
+        if path_:
+            text = list()
+            for element_ in path_:
+                if not element_.xpath(".//a"):
+                    text.append(element_.text_content())
+
+            text = "".join(text)
+
+            company_profile["desc"] = " ".join(
+                text.replace("\n", " ").replace("\xa0", " ").split()
+            )
+    else:
+        path_ = root_.xpath('.//*[@id="profile-fullStory-showhide"]')
+
+        if path_:
+            company_profile["desc"] = str(path_[0].text_content())
+
+    # Profiles with no description (e.g. block pages) are not kept, so that they are retrieved again
+    if company_profile["desc"] is not None:
+        cache.set(key, company_profile)
+
+    return dict(company_profile)
+
+
+def retrieve_company_profiles(resolved, source, cache, max_workers=8):
+    """
+    This function retrieves the company profiles of several stocks from the introduced source, so that up to
+    `max_workers` profiles are retrieved concurrently using the pooled session of
+    `investpy.utils.extra.pooled_session`, and the ones kept in the cache are not retrieved again, see
+    `fetch_company_profile`. The stocks whose company profile could not be retrieved are not raised, but
+    reported in the `Error` column.
+
+    Args:
+        resolved (:obj:`list`):
+            stocks as resolved by `investpy.utils.information.resolve_instruments` with `PROFILES_SCHEMA`.
+        source (:obj:`str`): source of the company profiles, either `Investing` or `Bolsa de Madrid`.
+        cache (:obj:`investpy.utils.cache.Cache`): cache of the company profiles per (tag or ISIN, source) pair.
+        max_workers (:obj:`int`, optional): maximum number of company profiles retrieved concurrently.
+
+    Returns:
+        :obj:`pandas.DataFrame` - company_profiles:
+            The resulting :obj:`pandas.DataFrame` contains a row per introduced stock, in the same order, with the
+            `Stock Symbol`, `Country`, `url` and `desc` columns plus the `Error` column, which is null for the
+            stocks whose company profile was retrieved.
+
+    """
+
+    rows = [None] * len(resolved)
+
+    def fetch(position):
+        name, tag, args, error = resolved[position]
+
+        row = {
+            "Stock Symbol": name,
+            "Country": None if args is None else args[0],
+            "url": None,
+            "desc": None,
+            "Error": error,
+        }
+
+        if error is None and source == "Bolsa de Madrid" and args[0] != "spain":
+            row["Error"] = (
+                "ERR#0127: currently spanish company description is just available for"
+                " spanish stocks."
+            )
+
+        if row["Error"] is None:
+            try:
+                row.update(
+                    fetch_company_profile(
+                        source, tag, args[1], cache, session=pooled_session()
+                    )
+                )
+            except Exception as e:
+                row["Error"] = str(e)
+
+        rows[position] = row
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fetch, range(len(resolved))))
+
+    return pd.DataFrame(
+        rows, columns=["Stock Symbol", "Country", "url", "desc", "Error"]
+    )
@@ -2,17 +2,15 @@
 # See LICENSE for details.
 
 import json
-from datetime import date, datetime, timedelta
-from random import randint
+from datetime import date, datetime
 
 import pandas as pd
-import pytz
-import requests
 from lxml.html import fromstring
 
 from .constant import FUNDS_INTERVAL_FILTERS, INTERVAL_FILTERS, OUTDATED2UPDATED
-from .data import Data
-from .extra import random_user_agent
+from .extra import pooled_session, random_user_agent
+from .historical import HistoricalSchema, retrieve_historical_data, retrieve_recent_data
+from .parsers import technical_rows
 
 
 class SearchObj(object):
@@ -38,12 +36,35 @@ class SearchObj(object):
         data (:obj:`pandas.DataFrame`):
             recent or historical data to retrieve from the current financial product, generated
             after calling either self.retrieve_recent_data or self.retrieve_historical_data().
-        info (:obj:`dict`):
+        information (:obj:`dict`):
             contains the information of the current financial product, generated after calling the
             self.retrieve_information() function.
+        technical_indicators (:obj:`pandas.DataFrame`):
+            contains the technical indicators of the current financial product, generated after calling
+            the self.retrieve_technical_indicators() function.
+        default_currency (:obj:`str`):
+            currency in which the current financial product is traded, generated after calling the
+            self.retrieve_currency() function.
+
+    Note that the attributes are declared in `__slots__`, so that the instances have no `__dict__`
+    and no other attributes can be set on them.
 
     """
 
+    __slots__ = (
+        "id_",
+        "name",
+        "symbol",
+        "country",
+        "tag",
+        "pair_type",
+        "exchange",
+        "data",
+        "information",
+        "technical_indicators",
+        "default_currency",
+    )
+
     def __init__(self, id_, name, symbol, tag, country, pair_type, exchange):
         self.id_ = id_
         self.name = name
@@ -54,7 +75,17 @@ class SearchObj(object):
         self.exchange = exchange
 
     def __str__(self):
-        return json.dumps(self.__dict__)
+        return json.dumps(
+            {
+                "id_": self.id_,
+                "name": self.name,
+                "symbol": self.symbol,
+                "country": self.country,
+                "tag": self.tag,
+                "pair_type": self.pair_type,
+                "exchange": self.exchange,
+            }
+        )
 
     def __eq__(self, other):
         return self.id_ == other.id_
@@ -62,7 +93,7 @@ class SearchObj(object):
     def __hash__(self):
         return self.id_
 
-    def retrieve_recent_data(self):
+    def retrieve_recent_data(self, session=None):
         """Class method used to retrieve the recent data from the class instance of any financial product.
 
         This method retrieves the recent data from Investing.com of the financial product of the current class
@@ -70,6 +101,10 @@ class SearchObj(object):
         uses the previously filled data from the `investpy.search_quotes(text, products, countries, n_results)` function
         search results to build the request that it is going to be sent to Investing.com so to retrieve and parse the data.
 
+        Args:
+            session (:obj:`requests.Session`, optional):
+                session used to send the requests, if None, `investpy.utils.extra.pooled_session`.
+
         Returns:
             :obj:`pandas.DataFrame` - data:
                 This method retrieves the recent data from the current class instance of a financial product
@@ -78,23 +113,16 @@ class SearchObj(object):
 
         """
 
-        if self.pair_type in ["stocks", "funds", "etfs", "currencies", "certificates"]:
-            header = f"{self.symbol} Historical Data"
-            headers, params = self._prepare_request(header)
-        elif self.pair_type in ["bonds"]:
-            header = f"{self.name} Bond Yield Historical Data"
-            headers, params = self._prepare_request(header)
-        elif self.pair_type in ["indices", "commodities", "cryptos", "fxfutures"]:
-            header = f"{self.name} Historical Data"
-            headers, params = self._prepare_request(header)
+        schema, header = self._historical_schema()
 
-        self.data = self._data_retrieval(
-            product=self.pair_type, headers=headers, params=params
+        self.data = retrieve_recent_data(
+            schema, id_=self.id_, name=self.name, header=header, session=session
         )
-        self._convert2df()
         return self.data
 
-    def retrieve_historical_data(self, from_date, to_date):
+    def retrieve_historical_data(
+        self, from_date, to_date, interval="Daily", session=None
+    ):
         """Class method used to retrieve the historical data from the class instance of any financial product.
 
         This method retrieves the historical data from Investing.com of the financial product of the current class
@@ -103,9 +131,17 @@ class SearchObj(object):
         `investpy.search_quotes(text, products, countries, n_results)` function search results to build the request
         that it is going to be sent to Investing.com so to retrieve and parse the data.
 
+        Note that long date ranges are split into as many windows as needed, which are requested concurrently
+        and merged in order, and that the weekly and monthly intervals need fewer windows for the same range.
+
         Args:
             from_date (:obj:`str`): date from which data will be retrieved, specified in dd/mm/yyyy format.
             to_date (:obj:`str`): date until data will be retrieved, specified in dd/mm/yyyy format.
+            interval (:obj:`str`, optional):
+                value to define the historical data interval to retrieve, by default `Daily`, but it can also be
+                `Weekly` or `Monthly`.
+            session (:obj:`requests.Session`, optional):
+                session used to send the requests, if None, `investpy.utils.extra.pooled_session`.
 
         Returns:
             :obj:`pandas.DataFrame` - data:
@@ -142,45 +178,31 @@ class SearchObj(object):
                 " 'dd/mm/yyyy'."
             )
 
-        if self.pair_type in ["stocks", "funds", "etfs", "currencies", "certificates"]:
-            header = f"{self.symbol} Historical Data"
-        elif self.pair_type in ["bonds"]:
-            header = f"{self.name} Bond Yield Historical Data"
-        elif self.pair_type in ["indices", "commodities", "cryptos", "fxfutures"]:
-            header = f"{self.name} Historical Data"
-
-        if to_date.year - from_date.year > 19:
-            intervals = self._calculate_intervals(from_date, to_date)
-
-            self.data = list()
-
-            for interval in intervals:
-                headers, params = self._prepare_historical_request(
-                    header=header, from_date=interval["from"], to_date=interval["to"]
-                )
-                try:
-                    self.data += self._data_retrieval(
-                        product=self.pair_type, headers=headers, params=params
-                    )
-                except:
-                    continue
-
-            if len(self.data) < 1:
-                raise IndexError("ERR#0033: information unavailable or not found.")
-        else:
-            headers, params = self._prepare_historical_request(
-                header=header,
-                from_date=from_date.strftime("%m/%d/%Y"),
-                to_date=to_date.strftime("%m/%d/%Y"),
-            )
-            self.data = self._data_retrieval(
-                product=self.pair_type, headers=headers, params=params
+        if not isinstance(interval, str) or interval.lower() not in [
+            "daily",
+            "weekly",
+            "monthly",
+        ]:
+            raise ValueError(
+                "ERR#0073: interval value should be a str type and it can just be"
+                " either 'Daily', 'Weekly' or 'Monthly'."
             )
 
-        self._convert2df()
+        schema, header = self._historical_schema()
+
+        self.data = retrieve_historical_data(
+            schema,
+            id_=self.id_,
+            name=self.name,
+            header=header,
+            from_date=from_date,
+            to_date=to_date,
+            interval=interval,
+            session=session,
+        )
         return self.data
 
-    def retrieve_information(self):
+    def retrieve_information(self, session=None):
         """Class method used to retrieve the information from the class instance of any financial product.
 
         This method retrieves the information from Investing.com of the financial product of the current class
@@ -189,6 +211,10 @@ class SearchObj(object):
         function search results to build the request that it is going to be sent to Investing.com so to retrieve and
         parse the information, since the product tag is required.
 
+        Args:
+            session (:obj:`requests.Session`, optional):
+                session used to send the request, if None, `investpy.utils.extra.pooled_session`.
+
         Returns:
             :obj:`dict` - info:
                 This method retrieves the information from the current class instance of a financial product
@@ -211,7 +237,9 @@ class SearchObj(object):
             "Connection": "keep-alive",
         }
 
-        req = requests.get(url, headers=headers)
+        session = pooled_session() if session is None else session
+
+        req = session.get(url, headers=headers)
 
         if req.status_code != 200:
             raise ConnectionError(
@@ -299,7 +327,7 @@ class SearchObj(object):
 
         return self.information
 
-    def retrieve_technical_indicators(self, interval="daily"):
+    def retrieve_technical_indicators(self, interval="daily", session=None):
         """Class method used to retrieve the technical indicators from the class instance of any financial product.
 
         This method retrieves the technical indicators from Investing.com for the financial product of the current
@@ -313,6 +341,8 @@ class SearchObj(object):
                 time interval of the technical indicators' calculations, available values are: `5mins`, `15mins`,
                 `30mins`, `1hour`, `5hours`, `daily`, `weekly` and `monthly`. Note that for funds just the intervals:
                 `daily`, `weekly` and `monthly` are available.
+            session (:obj:`requests.Session`, optional):
+                session used to send the request, if None, `investpy.utils.extra.pooled_session`.
 
         Returns:
             :obj:`pd.DataFrame` - technical_indicators:
@@ -363,40 +393,34 @@ class SearchObj(object):
 
         url = "https://www.investing.com/instruments/Service/GetTechincalData"
 
-        req = requests.post(url, headers=headers, data=params)
+        session = pooled_session() if session is None else session
+
+        req = session.post(url, headers=headers, data=params)
 
         if req.status_code != 200:
             raise ConnectionError(
                 f"ERR#0015: error {req.status_code}, try again later."
             )
 
-        root_ = fromstring(req.text)
-        table_ = root_.xpath(
-            ".//table[contains(@class, 'technicalIndicatorsTbl')]/tbody/tr"
-        )
+        table_ = technical_rows(req.text)
 
         if not table_:
             raise RuntimeError("ERR#0004: data retrieval error while scraping.")
 
-        self.technical_indicators = pd.DataFrame()
-
-        for row in table_:
-            for value in row.xpath("td"):
-                if value.get("class").__contains__("symbol"):
-                    self.technical_indicators = self.technical_indicators.append(
-                        {
-                            "indicator": value.text_content().strip(),
-                            "value": float(value.getnext().text_content().strip()),
-                            "signal": (
-                                value.getnext().getnext().text_content().strip().lower()
-                            ).replace(" ", "_"),
-                        },
-                        ignore_index=True,
-                    )
+        self.technical_indicators = pd.DataFrame(
+            [
+                {
+                    "indicator": indicator,
+                    "value": float(value),
+                    "signal": signal.lower().replace(" ", "_"),
+                }
+                for indicator, value, signal in table_
+            ]
+        )
 
         return self.technical_indicators
 
-    def retrieve_currency(self):
+    def retrieve_currency(self, session=None):
         """Class method used to retrieve the default currency from the class instance of any financial product.
 
         This method retrieves the default currency from Investing.com of the financial product of the current class
@@ -404,6 +428,10 @@ class SearchObj(object):
         function search results to build the request that it is going to be sent to Investing.com so to retrieve and
         parse the information, since the product tag is required.
 
+        Args:
+            session (:obj:`requests.Session`, optional):
+                session used to send the request, if None, `investpy.utils.extra.pooled_session`.
+
         Returns:
             :obj:`str` - default_currency:
                 This method retrieves the default currency from the current class instance of a financial product
@@ -425,7 +453,9 @@ class SearchObj(object):
             "Connection": "keep-alive",
         }
 
-        req = requests.get(url, headers=headers)
+        session = pooled_session() if session is None else session
+
+        req = session.get(url, headers=headers)
 
         if req.status_code != 200:
             raise ConnectionError(
@@ -465,146 +495,21 @@ class SearchObj(object):
         self.default_currency = path_[-1].text_content().strip()
         return self.default_currency
 
-    def _prepare_request(self, header):
-        headers = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
-
-        params = {
-            "curr_id": self.id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "interval_sec": "Daily",
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data",
-        }
-
-        return headers, params
-
-    def _prepare_historical_request(self, header, from_date, to_date):
-        headers = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
-
-        params = {
-            "curr_id": self.id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": from_date,
-            "end_date": to_date,
-            "interval_sec": "Daily",
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data",
-        }
-
-        return headers, params
-
-    def _calculate_intervals(self, from_date, to_date):
-        intervals = list()
-
-        while True:
-            diff = to_date.year - from_date.year
-
-            if diff > 19:
-                intervals.append(
-                    {
-                        "from": from_date.strftime("%m/%d/%Y"),
-                        "to": from_date.replace(year=from_date.year + 19).strftime(
-                            "%m/%d/%Y"
-                        ),
-                    }
-                )
-
-                from_date = from_date.replace(year=from_date.year + 19) + timedelta(
-                    days=1
-                )
-            else:
-                intervals.append(
-                    {
-                        "from": from_date.strftime("%m/%d/%Y"),
-                        "to": to_date.strftime("%m/%d/%Y"),
-                    }
-                )
-
-                break
-
-        return intervals
-
-    def _data_retrieval(self, product, headers, params):
-        has_volume = (
-            True
-            if product
-            in ["stocks", "etfs", "indices", "cryptos", "commodities", "fxfutures"]
-            else False
+    def _historical_schema(self):
+        if self.pair_type in ["stocks", "funds", "etfs", "currencies", "certificates"]:
+            header_format, header = "{} Historical Data", self.symbol
+        elif self.pair_type in ["bonds"]:
+            header_format, header = "{} Bond Yield Historical Data", self.name
+        elif self.pair_type in ["indices", "commodities", "cryptos", "fxfutures"]:
+            header_format, header = "{} Historical Data", self.name
+
+        schema = HistoricalSchema(
+            product=self.pair_type,
+            header=header_format,
+            error="ERR#0033: information unavailable or not found.",
+            volume=self.pair_type
+            in ["stocks", "etfs", "indices", "cryptos", "commodities", "fxfutures"],
+            change_pct=True,  # Every financial product has it
         )
-        has_change_pct = True  # Every financial product has it
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=headers, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError(
-                f"ERR#0015: error {req.status_code}, try again later."
-            )
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-        if not path_:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-        results = list()
-
-        for elements_ in path_:
-            info = []
-
-            for nested_ in elements_.xpath(".//td"):
-                val = (
-                    nested_.get("data-real-value")
-                    if nested_.get("data-real-value") is not None
-                    else nested_.text_content()
-                )
-                if val == "No results found":
-                    raise IndexError("ERR#0033: information unavailable or not found.")
-                info.append(val)
-
-            result = {
-                "Date": datetime.strptime(
-                    str(
-                        datetime.fromtimestamp(
-                            int(info[0]), tz=pytz.timezone("GMT")
-                        ).date()
-                    ),
-                    "%Y-%m-%d",
-                ),
-                "Open": float(info[2].replace(",", "")),
-                "High": float(info[3].replace(",", "")),
-                "Low": float(info[4].replace(",", "")),
-                "Close": float(info[1].replace(",", "")),
-            }
-
-            if has_volume and has_change_pct:
-                result["Volume"] = int(info[5])
-                result["Change Pct"] = float(info[6].replace(",", "").replace("%", ""))
-
-            if not has_volume and has_change_pct:
-                result["Change Pct"] = float(info[5].replace(",", "").replace("%", ""))
-
-            results.append(result)
-
-        return results[::-1]
 
-    def _convert2df(self):
-        self.data = pd.DataFrame(self.data)
-        self.data.set_index("Date", inplace=True)
+        return schema, header
@@ -0,0 +1,111 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import os
+import pickle
+import tempfile
+import time
+from urllib.parse import quote
+
+from .cache import Cache
+
+
+class Store(object):
+    """Local store of the data retrieved from Investing.com, kept across calls and optionally across processes.
+
+    Unlike :obj:`investpy.utils.cache.Cache`, the entries of this store are not discarded once `ttl` seconds
+    have passed since they were stored, they are just no longer fresh, so that the functions using it can
+    return the stored data as is while it is fresh, and then update it incrementally (e.g. retrieving just the
+    dividends newer than the stored ones) instead of retrieving it again from scratch. If `path` is set, every
+    entry is also pickled into a file of that directory, so that the stored data is kept across processes.
+
+    Args:
+        ttl (:obj:`int`, optional): seconds while an entry is fresh, if None, entries are always fresh.
+        maxsize (:obj:`int`, optional): maximum number of entries kept in memory, if None, it is unbounded.
+        path (:obj:`str`, optional): directory where the entries are pickled, if None, they are not pickled.
+
+    Examples:
+        >>> investpy.stocks.DIVIDENDS.path = '~/.investpy/dividends'
+
+    """
+
+    def __init__(self, ttl=None, maxsize=None, path=None):
+        self.ttl = ttl
+        self.path = path
+
+        self._entries = Cache(maxsize=maxsize)
+
+    def _file(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        name = "_".join(quote(str(value), safe="") for value in key)
+
+        return os.path.join(os.path.expanduser(self.path), name + ".pickle")
+
+    def _entry(self, key):
+        entry = self._entries.get(key)
+
+        if entry is None and self.path is not None:
+            try:
+                with open(self._file(key), "rb") as f:
+                    entry = (os.path.getmtime(self._file(key)), pickle.load(f))
+            except (OSError, EOFError, pickle.UnpicklingError):
+                return None
+
+            self._entries.set(key, entry)
+
+        return entry
+
+    def get(self, key, default=None):
+        entry = self._entry(key)
+
+        return default if entry is None else entry[1]
+
+    def fresh(self, key):
+        entry = self._entry(key)
+
+        if entry is None:
+            return False
+
+        return self.ttl is None or time.time() - entry[0] <= self.ttl
+
+    def set(self, key, value):
+        self._entries.set(key, (time.time(), value))
+
+        if self.path is not None:
+            os.makedirs(os.path.expanduser(self.path), exist_ok=True)
+
+            # Written aside and then renamed, so that no process reads a partial file, into a
+            # file unique per call, since other threads or processes may be storing the same key
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.expanduser(self.path),
+                prefix=os.path.basename(self._file(key)) + ".",
+                delete=False,
+            ) as f:
+                pickle.dump(value, f)
+
+            os.replace(f.name, self._file(key))
+
+    def pop(self, key, default=None):
+        entry = self._entry(key)
+
+        self._entries.pop(key)
+
+        if self.path is not None:
+            try:
+                os.remove(self._file(key))
+            except OSError:
+                pass
+
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        # Just the entries kept in memory, the pickled ones may be used elsewhere
+        self._entries.clear()
+
+    def __contains__(self, key):
+        return self._entry(key) is not None
+
+    def __len__(self):
+        return len(self._entries)
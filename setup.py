@@ -48,7 +48,8 @@ setup(
     python_requires='>=3.7',
     extras_require={
         "tests": requirements(filename='requirements/tests-requirements.txt'),
-        "docs": requirements(filename='requirements/docs-requirements.txt')
+        "docs": requirements(filename='requirements/docs-requirements.txt'),
+        "json": requirements(filename='requirements/json-requirements.txt')
     },
     keywords=', '.join([
         'investing', 'investing-api', 'historical-data',
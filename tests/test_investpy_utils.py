@@ -0,0 +1,1843 @@
+# Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import collections
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from lxml.html import fromstring
+
+import investpy
+from investpy import search
+from investpy.utils import constant as cst
+from investpy.utils import (
+    dividends,
+    extra,
+    financials,
+    historical,
+    information,
+    profiles,
+    search_obj,
+)
+from investpy.utils.adjustment import adjust_columns, adjust_panel
+from investpy.utils.cache import Cache
+from investpy.utils.historical import (
+    DAILY_DATA,
+    RECENT_DATA,
+    SCHEMAS,
+    format_data,
+    parse_rows,
+    plan_windows,
+    resample_columns,
+    resample_data,
+    retrieve_historical_data,
+    retrieve_recent_data,
+    write_json,
+)
+from investpy.utils.parsers import (
+    get_parser_engine,
+    historical_rows,
+    overview_cells,
+    set_parser_engine,
+    technical_rows,
+)
+from investpy.utils.poller import OverviewPoller, Poller, RingBuffer, diff_overview
+from investpy.utils.search_obj import SearchObj
+from investpy.utils.store import Store
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_investpy_parsers():
+    """
+    This function checks that every table extraction engine returns the same values from the recorded responses.
+    """
+
+    html = load_fixture("historical_data.html")
+
+    for text_fallback in [True, False]:
+        rows = historical_rows(html, engine="xpath", text_fallback=text_fallback)
+
+        assert len(rows) == 10
+        assert rows == historical_rows(
+            html, engine="target", text_fallback=text_fallback
+        )
+
+    assert historical_rows(html, engine="target")[0] == [
+        "1573776000",
+        "4.813",
+        "4.740",
+        "4.830",
+        "4.736",
+        "26630000",
+        None,
+    ]
+    assert historical_rows(html, engine="target", text_fallback=True)[0][-1] == "1.54%"
+
+    html = load_fixture("historical_data_no_results.html")
+
+    for engine in ["xpath", "target"]:
+        assert historical_rows(html, engine=engine) == []
+        assert historical_rows("<div></div>", engine=engine) is None
+
+    html = load_fixture("technical_data.html")
+
+    rows = technical_rows(html, engine="xpath")
+
+    assert len(rows) == 12
+    assert rows == technical_rows(html, engine="target")
+    assert rows[7] == ("ATR(14)", "0.0939", "Less Volatility")
+
+    default = get_parser_engine("historical")
+
+    set_parser_engine("historical", "xpath")
+    assert get_parser_engine("historical") == "xpath"
+    set_parser_engine("historical", default)
+
+    params = [
+        {"endpoint": "error", "engine": "xpath"},
+        {"endpoint": "historical", "engine": "error"},
+    ]
+
+    for param in params:
+        with pytest.raises(ValueError):
+            set_parser_engine(endpoint=param["endpoint"], engine=param["engine"])
+
+
+def test_investpy_historical():
+    """
+    This function checks that the historical data engine plans, parses and formats the data of every product type.
+    """
+
+    windows = plan_windows(datetime(1980, 1, 1), datetime(2019, 1, 1))
+
+    assert windows == [
+        ("01/01/1980", "01/01/1999"),
+        ("01/02/1999", "01/02/2018"),
+        ("01/03/2018", "01/01/2019"),
+    ]
+
+    assert plan_windows(
+        datetime(1980, 1, 1), datetime(2019, 1, 1), interval="Weekly"
+    ) == [
+        ("01/01/1980", "01/01/2019"),
+    ]
+
+    windows = plan_windows(
+        datetime(1800, 1, 1), datetime(2019, 1, 1), interval="monthly"
+    )
+
+    assert windows == [("01/01/1800", "01/01/2019")]
+
+    rows = historical_rows(
+        load_fixture("historical_data.html"), engine="target", text_fallback=True
+    )
+
+    for product, schema in SCHEMAS.items():
+        columns = parse_rows(schema, rows)
+
+        df = format_data(
+            schema, columns, "BBVA", "historical", currency="EUR", exchange="Madrid"
+        )
+
+        assert df.columns.tolist() == schema.columns
+        assert df.index.name == "Date"
+        assert df.index.is_monotonic_increasing
+        assert df.loc["2019-11-15", "Close"] == 4.813
+
+        data = json.loads(
+            format_data(
+                schema,
+                columns,
+                "BBVA",
+                "historical",
+                currency="EUR",
+                exchange="Madrid",
+                as_json=True,
+                order="descending",
+            )
+        )
+
+        assert data["name"] == "BBVA"
+        assert data["historical"][0]["date"] == "15/11/2019"
+        assert len(data["historical"]) == len(df)
+
+
+def test_investpy_json():
+    """
+    This function checks that the columnar json writer returns the same output as dumping a dict per row.
+    """
+
+    rows = historical_rows(
+        load_fixture("historical_data.html"), engine="target", text_fallback=True
+    )
+
+    for product, schema in SCHEMAS.items():
+        columns = parse_rows(schema, rows)
+
+        df = format_data(
+            schema, columns, "BBVA", "historical", currency="EUR", exchange="Madrid"
+        )
+
+        expected = list()
+        for date, values in zip(df.index, df.to_dict(orient="records")):
+            row = {"date": date.strftime("%d/%m/%Y")}
+            for column in schema.columns:
+                key = schema.currency_key if column == "Currency" else column.lower()
+                row[key] = int(values[column]) if column == "Volume" else values[column]
+            expected.append(row)
+
+        expected = json.dumps(
+            {"name": 'BBVA "%"', "historical": expected}, sort_keys=False
+        )
+
+        params = {
+            "schema": schema,
+            "columns": columns,
+            "name": 'BBVA "%"',
+            "key": "historical",
+            "currency": "EUR",
+            "exchange": "Madrid",
+            "as_json": True,
+        }
+
+        assert format_data(**params) == expected
+
+        fp = io.StringIO()
+
+        assert format_data(fp=fp, **params) is None
+        assert fp.getvalue() == expected
+
+        assert json.loads(format_data(compact=True, **params)) == json.loads(expected)
+
+    columns = {key: values[::-1] for key, values in columns.items()}
+
+    fp = io.StringIO()
+    write_json(schema, columns, 'BBVA "%"', "historical", fp=fp, chunk_size=3)
+
+    assert fp.getvalue() == expected
+
+
+def test_investpy_slots():
+    """
+    This function checks that the search class keeps its attributes without a `__dict__`.
+    """
+
+    obj = SearchObj(
+        id_=32237,
+        name="BBVA",
+        symbol="BBVA",
+        tag="/equities/bbva",
+        country="spain",
+        pair_type="stocks",
+        exchange="Madrid",
+    )
+
+    assert not hasattr(obj, "__dict__")
+    assert json.loads(str(obj)) == {
+        "id_": 32237,
+        "name": "BBVA",
+        "symbol": "BBVA",
+        "country": "spain",
+        "tag": "/equities/bbva",
+        "pair_type": "stocks",
+        "exchange": "Madrid",
+    }
+
+    obj.default_currency = "EUR"
+
+    with pytest.raises(AttributeError):
+        obj.unknown = None
+
+
+def test_investpy_resample():
+    """
+    This function checks that the weekly and monthly data is resampled locally from the daily data.
+    """
+
+    rows = historical_rows(
+        load_fixture("historical_data.html"), engine="target", text_fallback=True
+    )
+
+    schema = SCHEMAS["stock"]
+    columns = parse_rows(schema, rows)
+
+    DAILY_DATA.set(
+        (schema.product, 32237),
+        (datetime(2019, 11, 1), datetime(2019, 11, 30), columns),
+    )
+
+    params = {
+        "schema": schema,
+        "id_": 32237,
+        "name": "BBVA",
+        "header": "BBVA",
+        "from_date": datetime(2019, 11, 4),
+        "to_date": datetime(2019, 11, 30),
+        "currency": "EUR",
+        "resample": True,
+    }
+
+    daily = format_data(schema, columns, "BBVA", "historical", currency="EUR")
+
+    weekly = retrieve_historical_data(interval="Weekly", **params)
+
+    assert weekly.index.strftime("%Y-%m-%d").tolist() == ["2019-11-03", "2019-11-10"]
+    assert weekly.columns.tolist() == daily.columns.tolist()
+
+    # Investing.com weeks start on Sunday
+    weeks = daily.index - pd.to_timedelta((daily.index.dayofweek + 1) % 7, unit="D")
+
+    for (_, week), (_, data) in zip(weekly.iterrows(), daily.groupby(weeks)):
+        assert week["Open"] == data["Open"].iloc[0]
+        assert week["High"] == data["High"].max()
+        assert week["Low"] == data["Low"].min()
+        assert week["Close"] == data["Close"].iloc[-1]
+        assert week["Volume"] == data["Volume"].sum()
+
+    monthly = retrieve_historical_data(interval="Monthly", order="descending", **params)
+
+    assert monthly.index.strftime("%Y-%m-%d").tolist() == ["2019-11-01"]
+    assert monthly.equals(resample_data(daily, "Monthly"))
+    assert weekly.equals(resample_data(daily.iloc[::-1], "Weekly").iloc[::-1])
+
+    columns = resample_columns(
+        {
+            "Date": columns["Date"],
+            "Close": columns["Close"],
+            "Open": columns["Open"],
+            "High": columns["High"],
+            "Low": columns["Low"],
+            "Change Pct": np.full(len(columns["Date"]), 1.0),
+        },
+        "Weekly",
+    )
+
+    close = daily["Close"].tolist()
+
+    assert columns["Change Pct"][-1] == round(
+        (close[4] / (close[0] / 1.01) - 1) * 100, 2
+    )
+    assert columns["Change Pct"][0] == round((close[-1] / close[4] - 1) * 100, 2)
+
+    DAILY_DATA.clear()
+
+    with pytest.raises(ValueError):
+        resample_data(daily, "Daily")
+
+    with pytest.raises(ValueError):
+        investpy.get_stock_historical_data(
+            stock="BBVA",
+            country="spain",
+            from_date="01/01/2019",
+            to_date="01/01/2020",
+            interval="Weekly",
+            resample="error",
+        )
+
+
+def test_investpy_adjustment():
+    """
+    This function checks the dividend-adjusted close values and the total return index against a loop.
+    """
+
+    rows = historical_rows(
+        load_fixture("historical_data.html"), engine="target", text_fallback=True
+    )
+
+    schema = SCHEMAS["stock"].replace(adjusted=True, total_return=True)
+
+    dividends = pd.DataFrame(
+        {
+            "Date": [
+                datetime(2019, 11, 2),
+                datetime(2019, 11, 9),
+                datetime(2019, 11, 12),
+            ],
+            "Dividend": [0.5, 0.1, 0.2],
+        }
+    )
+
+    columns = adjust_columns(
+        parse_rows(schema, rows), dividends, adjusted=True, total_return=True
+    )
+
+    df = format_data(schema, columns, "BBVA", "historical", currency="EUR")
+
+    assert df.columns.tolist() == schema.columns
+
+    close = df["Close"].tolist()
+    paid = [0.0] * len(close)
+    paid[df.index.get_loc(pd.Timestamp("2019-11-11"))] = 0.1
+    paid[df.index.get_loc(pd.Timestamp("2019-11-12"))] = 0.2
+
+    factor, expected = 1.0, list()
+    for index in reversed(range(len(close))):
+        expected.insert(0, close[index] * factor)
+        if paid[index]:
+            factor *= 1 - paid[index] / close[index - 1]
+
+    assert np.allclose(df["Adj Close"], expected)
+
+    value, expected = close[0], [close[0]]
+    for index in range(1, len(close)):
+        value *= (close[index] + paid[index]) / close[index - 1]
+        expected.append(value)
+
+    assert np.allclose(df["Total Return"], expected)
+
+    data = json.loads(
+        format_data(schema, columns, "BBVA", "historical", currency="EUR", as_json=True)
+    )
+
+    assert data["historical"][-1]["adj_close"] == df["Adj Close"].iloc[-1]
+
+    panel = pd.DataFrame({"BBVA": df["Close"], "SAN": df["Close"] * 2})
+    panel.iloc[0, 1] = np.nan
+
+    adjusted = adjust_panel(panel, {"BBVA": dividends})
+
+    assert np.allclose(adjusted["BBVA"], df["Adj Close"])
+    assert adjusted["SAN"].iloc[1:].equals(panel["SAN"].iloc[1:])
+    assert np.isnan(adjusted["SAN"].iloc[0])
+
+    total_return = adjust_panel(panel, {"BBVA": dividends}, total_return=True)
+
+    assert np.allclose(total_return["BBVA"], df["Total Return"])
+
+    with pytest.raises(ValueError):
+        investpy.get_stock_historical_data(
+            stock="BBVA",
+            country="spain",
+            from_date="01/01/2019",
+            to_date="01/01/2020",
+            adjusted="error",
+        )
+
+
+def test_investpy_panel():
+    """
+    This function checks that the historical data of several financial products is aligned on a common calendar.
+    """
+
+    rows = historical_rows(
+        load_fixture("historical_data.html"), engine="target", text_fallback=True
+    )
+
+    stock = format_data(
+        SCHEMAS["stock"], parse_rows(SCHEMAS["stock"], rows), "BBVA", "historical"
+    )
+    bond = stock[["Open", "Close"]].iloc[2:] * 2
+    crypto = pd.DataFrame(
+        {
+            "Open": np.arange(14, dtype="float64"),
+            "Close": np.arange(14, dtype="float64"),
+        },
+        index=pd.date_range("2019-11-03", periods=14, name="Date"),
+    )
+
+    frames = {"stock": stock, "bond": bond, "crypto": crypto}
+
+    panel = investpy.build_panel(frames)
+
+    assert panel.columns.tolist() == ["stock", "bond", "crypto"]
+    assert len(panel) == 14
+    assert panel["stock"].dropna().equals(stock["Close"].rename("stock"))
+    assert np.isnan(panel.loc["2019-11-09", "stock"])
+
+    panel = investpy.build_panel(frames, calendar="intersection")
+
+    assert panel.index.equals(bond.index)
+    assert (panel["bond"] == 2 * panel["stock"]).all()
+
+    panel = investpy.build_panel(frames, calendar="daily", fill="ffill", fill_limit=1)
+
+    assert panel.loc["2019-11-09", "stock"] == stock.loc["2019-11-08", "Close"]
+    assert np.isnan(panel.loc["2019-11-10", "stock"])
+    assert np.isnan(panel.loc["2019-11-03", "stock"])
+
+    panel = investpy.build_panel(
+        frames, fields=("Open", "Close"), calendar="stock", dtype="float32"
+    )
+
+    assert panel.index.equals(stock.index)
+    assert panel.columns.tolist() == [
+        (field, name) for field in ["Open", "Close"] for name in frames
+    ]
+    assert panel.dtypes.eq("float32").all()
+
+    values, dates, names = investpy.build_panel(
+        list(frames.values()), fields="Close", calendar="business", as_array=True
+    )
+
+    assert values.shape == (len(dates), 3)
+    assert names == [0, 1, 2]
+    assert not dates.dayofweek.isin([5, 6]).any()
+
+    params = [
+        {"frames": None},
+        {"frames": frames, "fields": ("Currency",)},
+        {"frames": frames, "calendar": "error"},
+        {"frames": frames, "fill": "error"},
+        {"frames": frames, "dtype": "error"},
+    ]
+
+    for param in params:
+        with pytest.raises(ValueError):
+            investpy.build_panel(**param)
+
+    with pytest.raises(ValueError, match="ERR#0162"):
+        investpy.build_panel(frames, fill="ffill", fill_limit=0)
+
+
+def test_investpy_recent_tail(monkeypatch):
+    """
+    This function checks that the recent data is kept in memory and just refreshed with the newest bars.
+    """
+
+    rows = historical_rows(
+        load_fixture("historical_data.html"), engine="target", text_fallback=True
+    )
+
+    responses, windows = [rows[2:], rows[:3]], list()
+
+    def fetch_rows(id_, header, interval, window=None, session=None):
+        windows.append(window)
+        return responses.pop(0)
+
+    monkeypatch.setattr(historical, "fetch_rows", fetch_rows)
+
+    RECENT_DATA.clear()
+
+    params = {
+        "schema": SCHEMAS["stock"],
+        "id_": 32237,
+        "name": "BBVA",
+        "header": "BBVA",
+        "currency": "EUR",
+        "order": "descending",
+    }
+
+    first = retrieve_recent_data(**params)
+
+    assert len(first) == 8
+    assert retrieve_recent_data(**params).equals(first)
+    assert windows == [None]
+
+    monkeypatch.setattr(cst, "RECENT_DATA_FRESHNESS", 0)
+
+    data = retrieve_recent_data(**params)
+
+    assert windows[-1][0] == first.index[0].strftime("%m/%d/%Y")
+    assert len(data) == 8
+    expected = format_data(
+        params["schema"],
+        parse_rows(params["schema"], rows[:8]),
+        "BBVA",
+        "recent",
+        currency="EUR",
+        order="descending",
+    )
+
+    assert data.equals(expected)
+
+    RECENT_DATA.clear()
+
+
+def test_investpy_poller(monkeypatch):
+    """
+    This function checks that the poller appends just the new bars of every financial product and publishes them.
+    """
+
+    rows = historical_rows(
+        load_fixture("historical_data.html"), engine="target", text_fallback=True
+    )
+
+    schema = SCHEMAS["stock"]
+
+    buffer = RingBuffer(["Open", "High", "Low", "Close", "Volume"], capacity=4)
+
+    assert buffer.extend(parse_rows(schema, rows[3:])) == [3, 0, 1, 2]
+    assert buffer.extend(parse_rows(schema, rows[3:5])) == list()
+    assert len(buffer.extend(parse_rows(schema, rows[:4]))) == 3
+
+    frame = buffer.to_frame()
+
+    assert frame.index.is_monotonic_increasing
+    assert frame.index[-1] == pd.Timestamp("2019-11-15")
+    assert len(frame) == 4
+
+    responses = {32237: [rows[3:], rows[:4]], 32238: [None]}
+    windows = list()
+
+    def fetch_rows(id_, header, interval, window=None, session=None):
+        windows.append((id_, window))
+        return responses[id_].pop(0)
+
+    monkeypatch.setattr(historical, "fetch_rows", fetch_rows)
+
+    published = list()
+
+    poller = Poller(cadence=60, max_workers=2)
+    poller.add_instrument("BBVA", schema, 32237, "BBVA")
+    poller.add_instrument("SAN", schema, 32238, "SAN")
+    poller.subscribe(lambda key, bars: published.append((key, len(bars))))
+
+    assert poller.poll() == 1
+    assert poller.poll() == 0
+    assert published == [("BBVA", 7)]
+    assert isinstance(poller.errors()["SAN"], RuntimeError)
+
+    poller.remove("SAN")
+
+    assert poller.poll(force=True) == 1
+    assert published[-1] == ("BBVA", 3)
+    assert windows[-1] == (32237, ("11/12/2019", windows[-1][1][1]))
+    assert poller.data("BBVA").equals(
+        format_data(schema, parse_rows(schema, rows), "BBVA", "recent").drop(
+            columns="Currency"
+        )
+    )
+
+    poller.stop()
+
+    params = [
+        {"interval": "error"},
+        {"cadence": 0},
+    ]
+
+    for param in params:
+        with pytest.raises(ValueError):
+            Poller(**param)
+
+    with pytest.raises(ValueError):
+        poller.add("stock", "error", country="spain")
+
+
+def test_investpy_dtypes():
+    """
+    This function checks that the historical data can be retrieved with reduced precision and custom dtypes.
+    """
+
+    rows = historical_rows(
+        load_fixture("historical_data.html"), engine="target", text_fallback=True
+    )
+
+    schema = SCHEMAS["etf"]
+    columns = parse_rows(schema, rows)
+
+    default = format_data(
+        schema, columns, "ETF", "historical", currency="EUR", exchange="Madrid"
+    )
+    compact = format_data(
+        schema,
+        columns,
+        "ETF",
+        "historical",
+        currency="EUR",
+        exchange="Madrid",
+        dtypes="compact",
+    )
+
+    assert list(compact.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert (compact[["Open", "High", "Low", "Close"]].dtypes == "float32").all()
+    assert compact["Volume"].dtype == "int32"
+    assert compact.attrs == {"Currency": "EUR", "Exchange": "Madrid"}
+    assert compact.index.equals(default.index)
+    assert np.allclose(compact["Close"], default["Close"])
+    assert (
+        compact.memory_usage(deep=True).sum() * 2
+        < default.memory_usage(deep=True).sum()
+    )
+
+    custom = format_data(
+        schema,
+        columns,
+        "ETF",
+        "historical",
+        currency="EUR",
+        exchange="Madrid",
+        dtypes={"Close": "float32", "Currency": "category", "Exchange": None},
+    )
+
+    assert list(custom.columns) == [
+        "Open",
+        "High",
+        "Low",
+        "Close",
+        "Volume",
+        "Currency",
+    ]
+    assert custom["Close"].dtype == "float32"
+    assert custom["Open"].dtype == "float64"
+    assert isinstance(custom["Currency"].dtype, pd.CategoricalDtype)
+    assert (custom["Currency"] == "EUR").all()
+    assert custom.attrs == {"Exchange": "Madrid"}
+
+    with pytest.raises(ValueError):
+        format_data(schema, columns, "ETF", "historical", dtypes={"Close": "error"})
+
+    # Just the constant columns can be moved into `attrs`, and every column must exist
+    for dtypes in [{"Volume": None}, {"Adj. Close": "float32"}]:
+        with pytest.raises(ValueError, match="ERR#0150"):
+            format_data(schema, columns, "ETF", "historical", dtypes=dtypes)
+
+    # Integer dtypes must fit every value instead of wrapping them around
+    for dtypes in [{"Volume": "int8"}, {"Volume": "uint16"}, {"Volume": "Int16"}]:
+        with pytest.raises(ValueError, match="ERR#0150"):
+            format_data(schema, columns, "ETF", "historical", dtypes=dtypes)
+
+    custom = format_data(
+        schema, columns, "ETF", "historical", dtypes={"Volume": "int32"}
+    )
+
+    assert (custom["Volume"] == default["Volume"]).all()
+
+    with pytest.raises(ValueError):
+        investpy.get_etf_recent_data(etf="error", country="spain", dtypes="error")
+
+
+def test_investpy_information_batch(monkeypatch):
+    """
+    This function checks that the information of several financial products is retrieved at once, reporting errors.
+    """
+
+    html = load_fixture("stock_information.html")
+
+    class Response(object):
+        def __init__(self, status_code, text=""):
+            self.status_code = status_code
+            self.text = text
+
+    class Session(object):
+        def get(self, url, headers=None):
+            if url == information.INFORMATION_URL + "equities/bbva":
+                return Response(200, html)
+            return Response(404)
+
+    monkeypatch.setattr(information, "pooled_session", lambda: Session())
+
+    single = investpy.get_stock_information(stock="bbva", country="spain", as_json=True)
+
+    assert single["Stock Symbol"] == "BBVA"
+    assert single["Next Earnings Date"] == "31/01/2020"
+
+    stocks = ["bbva", "san", "error", ("bbva", "error"), ("bbva", None)]
+
+    for processes in [None, 2]:
+        data = investpy.get_stocks_information(
+            stocks=stocks, country="spain", processes=processes, numeric=False
+        )
+
+        assert list(data["Stock Symbol"]) == ["BBVA", "SAN", "error", "bbva", "bbva"]
+        assert data.columns[-1] == "Error"
+        assert data["Error"].isnull().tolist() == [True, False, False, False, False]
+        assert data["Error"][1].startswith("ERR#0015")
+        assert data["Error"][2].startswith("ERR#0122")
+        assert data["Error"][3].startswith("ERR#0034")
+        assert data["Error"][4].startswith("ERR#0039")
+
+        for key, value in single.items():
+            assert value == data[key][0] or (value is None and pd.isnull(data[key][0]))
+
+    data = investpy.get_stocks_information(stocks=stocks, country="spain")
+
+    assert data["Todays Range Low"][0] == 4.76
+    assert data["52 wk Range High"][0] == 5.55
+    assert data["Dividend"][0] == 0.26
+    assert data["Dividend Yield"][0] == 5.4
+    assert data["1-Year Change"][0] == -9.45
+    assert data["Next Earnings Date"][0] == "31/01/2020"
+    assert data["Dividend"].dtype == "float64"
+    assert data["Todays Range Low"].isnull().tolist()[1:] == [True] * 4
+    assert "Todays Range" not in data.columns
+
+    # The cells that do not follow the format of the rest of the column are NaN
+    data = information.normalize_information(
+        pd.DataFrame(
+            {
+                "1-Year Change": ["-9.45%", "3 %", "12.5%"],
+                "Next Earnings Date": ["31/01/2020", "1.5", None],
+            }
+        )
+    )
+
+    assert data["1-Year Change"].tolist()[::2] == [-9.45, 12.5]
+    assert np.isnan(data["1-Year Change"][1])
+    assert data["Next Earnings Date"][0] == "31/01/2020"
+
+    data = investpy.get_stocks_information(
+        stocks=["bbva"], country="spain", as_json=True
+    )
+
+    assert data[0]["Error"] is None
+    assert data[0]["Market Cap"] == single["Market Cap"]
+
+    params = [
+        {"stocks": [], "country": "spain"},
+        {"stocks": "bbva", "country": "spain"},
+        {"stocks": ["bbva"], "country": 0},
+        {"stocks": ["bbva"], "country": "spain", "as_json": "error"},
+        {"stocks": ["bbva"], "country": "spain", "max_workers": 0},
+        {"stocks": ["bbva"], "country": "spain", "processes": "error"},
+        {"stocks": ["bbva"], "country": "spain", "numeric": "error"},
+    ]
+
+    for param in params:
+        with pytest.raises(ValueError):
+            investpy.get_stocks_information(**param)
+
+    with pytest.raises(ValueError, match="ERR#0163"):
+        investpy.get_stocks_information(stocks=["bbva"], country="spain", processes=0)
+
+
+def test_investpy_overview_poller(monkeypatch):
+    """
+    This function checks that the overview poller publishes just the rows that changed between refreshes.
+    """
+
+    snapshots = [
+        pd.DataFrame(
+            {
+                "country": ["spain"] * 3,
+                "name": ["BBVA", "Santander", "Repsol"],
+                "last": [4.813, 3.701, None],
+                "currency": ["EUR"] * 3,
+            }
+        ),
+        pd.DataFrame(
+            {
+                "country": ["spain"] * 3,
+                "name": ["BBVA", "Repsol", "Iberdrola"],
+                "last": [4.813, 14.2, 9.1],
+                "currency": ["EUR"] * 3,
+            }
+        ),
+    ]
+
+    calls = list()
+
+    def get_stocks_overview(**kwargs):
+        calls.append(kwargs)
+        if not snapshots:
+            raise ConnectionError("ERR#0015: error 500, try again later.")
+        return snapshots[0] if len(snapshots) == 1 else snapshots.pop(0)
+
+    monkeypatch.setattr(investpy, "get_stocks_overview", get_stocks_overview)
+
+    published = list()
+
+    poller = OverviewPoller("stock", cadence=30, country="spain", n_results=1000)
+    poller.subscribe(published.append)
+
+    changes = poller.poll()
+
+    assert calls[0] == {"country": "spain", "n_results": 1000, "as_json": False}
+    assert list(changes["event"]) == ["new"] * 3
+    assert list(changes.columns) == [
+        "country",
+        "name",
+        "last",
+        "currency",
+        "event",
+        "timestamp",
+    ]
+
+    changes = poller.poll()
+
+    assert list(changes["name"]) == ["Repsol", "Iberdrola", "Santander"]
+    assert list(changes["event"]) == ["changed", "new", "removed"]
+    assert changes["last"][2] == 3.701
+
+    assert len(poller.poll()) == 0
+    assert len(published) == 2
+
+    snapshots.clear()
+
+    assert poller.poll() is None
+    assert isinstance(poller.error, ConnectionError)
+
+    snapshot = pd.DataFrame({"name": ["A", "A"], "last": [np.nan, 1.0]})
+
+    assert len(diff_overview(snapshot, snapshot.copy(), ["name"])) == 0
+
+    params = [
+        {"product_type": "error"},
+        {"product_type": "stock", "cadence": -1},
+    ]
+
+    for param in params:
+        with pytest.raises(ValueError):
+            OverviewPoller(**param)
+
+
+def test_investpy_overview(monkeypatch):
+    """
+    This function checks that the rows of the recorded overview tables are parsed in a single pass over their cells.
+    """
+
+    row = fromstring(load_fixture("overview_stocks.html")).xpath(".//tbody/tr")[0]
+
+    cells = overview_cells(row)
+
+    assert cells["last"].text_content() == "4.813"
+    assert cells["pc"] is not cells["pcp"]
+    assert cells["elp"].find("a").text_content() == "BBVA"
+
+    routes = {
+        "StocksFilter": "overview_stocks.html",
+        "-etfs": "overview_etfs.html",
+        "-indices": "overview_indices.html",
+        "commodities/": "overview_commodities.html",
+        "crypto/currencies": "overview_cryptos.html",
+        "ChangeCurrency": "overview_currency_crosses.json",
+    }
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, text):
+            self.text = text
+
+        def json(self):
+            return json.loads(self.text)
+
+    def get(url, *args, **kwargs):
+        return Response(
+            load_fixture(next(value for key, value in routes.items() if key in url))
+        )
+
+    monkeypatch.setattr(requests, "get", get)
+
+    data = investpy.get_stocks_overview(country="spain")
+
+    assert list(data["symbol"]) == ["BBVA", "SAN", "REP"]
+    assert list(data["turnover"]) == [25320000, 48100000, 6450]
+    assert data["currency"].unique().tolist() == ["EUR"]
+
+    data = investpy.get_etfs_overview(country="spain")
+
+    assert list(data["symbol"]) == ["2INVE", "BBVAI", "IBEXA"]
+    assert data["full_name"][0] == "Lyxor UCITS Ibex 35 Doble Inverso Diario"
+
+    data = investpy.get_indices_overview(country="spain", as_json=True)
+
+    assert data[0]["name"] == "IBEX 35"
+    assert data[0]["high"] == 9351.0
+
+    data = investpy.get_commodities_overview(group="metals")
+
+    assert list(data["name"]) == ["Gold", "Copper", "Silver"]
+    assert list(data["last_close"]) == [1471.8, 2.652, 16.996]
+
+    data = investpy.get_cryptos_overview(n_results=100)
+
+    assert list(data["status"]) == ["available", "available", "unavailable"]
+    assert data["market_cap"][0] == 154000000000.0
+
+    data = investpy.get_currency_crosses_overview(currency="EUR")
+
+    assert list(data["symbol"]) == ["EUR/USD", "EUR/JPY", "EUR/GBP"]
+    assert data["name"][0] == "Euro US Dollar"
+    assert data["ask"][2] == 0.8566
+
+
+def test_investpy_dividends(monkeypatch, tmp_path):
+    """
+    This function checks that the stored dividends are updated by retrieving just the pages with newer dividends.
+    """
+
+    html = load_fixture("stock_dividends.html")
+    pages = json.loads(load_fixture("stock_dividends_history.json"))
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, text):
+            self.text = text
+
+        def json(self):
+            return json.loads(self.text)
+
+    calls = list()
+
+    def get(url, *args, **kwargs):
+        calls.append(url)
+        return Response(html)
+
+    def post(url, *args, params=None, **kwargs):
+        calls.append(params)
+        # The first history page goes on from the last dividend of the dividends page
+        page = pages[0] if params["last_timestamp"] == 1539129600 else pages[1]
+        return Response(json.dumps(page))
+
+    monkeypatch.setattr(requests, "get", get)
+    monkeypatch.setattr(requests, "post", post)
+
+    store = Store(ttl=60, path=str(tmp_path))
+
+    monkeypatch.setattr(investpy.stocks, "DIVIDENDS", store)
+
+    data = investpy.get_stock_dividends(stock="BBVA", country="spain")
+
+    assert len(calls) == 3
+    assert len(data) == 8
+    assert data["Date"].is_monotonic_decreasing
+    assert data["Dividend"][3] == 0.3839
+
+    calls.clear()
+
+    pd.testing.assert_frame_equal(
+        investpy.get_stock_dividends(stock="BBVA", country="spain", incremental=True),
+        data,
+    )
+    assert len(calls) == 0
+
+    store.ttl = -1
+
+    for stored, requests_ in [(2, 1), (4, 2), (8, 3)]:
+        store.set(("spain", "bbva"), data.iloc[stored:].reset_index(drop=True))
+        calls.clear()
+
+        pd.testing.assert_frame_equal(
+            investpy.get_stock_dividends(
+                stock="BBVA", country="spain", incremental=True
+            ),
+            data,
+        )
+        assert len(calls) == requests_
+
+    pd.testing.assert_frame_equal(
+        Store(path=str(tmp_path)).get(("spain", "bbva")), data
+    )
+
+    # Every write goes through its own temporary file, even for the same key
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: store.set(("spain", "bbva"), data), range(32)))
+
+    assert os.listdir(tmp_path) == ["spain_bbva.pickle"]
+
+    with pytest.raises(ValueError):
+        investpy.get_stock_dividends(stock="BBVA", country="spain", incremental=None)
+
+
+def test_investpy_dividends_batch(monkeypatch):
+    """
+    This function checks that the dividends of several stocks are retrieved concurrently into a single DataFrame.
+    """
+
+    html = load_fixture("stock_dividends.html")
+    pages = json.loads(load_fixture("stock_dividends_history.json"))
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, text):
+            self.text = text
+
+        def json(self):
+            return json.loads(self.text)
+
+    class Session:
+        def get(self, url, headers=None):
+            # Just BBVA has dividends, the pages of other stocks have no dividends
+            return Response(html if url.endswith("/bbva-dividends") else "<div></div>")
+
+        def post(self, url, headers=None, params=None):
+            first = params["last_timestamp"] == 1539129600
+            return Response(json.dumps(pages[0] if first else pages[1]))
+
+    monkeypatch.setattr(dividends, "pooled_session", lambda: Session())
+    monkeypatch.setattr(requests, "get", Session().get)
+    monkeypatch.setattr(requests, "post", Session().post)
+    monkeypatch.setattr(investpy.stocks, "DIVIDENDS", Store(ttl=60))
+
+    data = investpy.get_stocks_dividends(
+        stocks=["BBVA", ("xxx", "spain"), ("AAPL", "united states"), "bbva"],
+        country="spain",
+        max_workers=2,
+    )
+
+    assert list(data.columns) == [
+        "Stock Symbol",
+        "Country",
+        "Date",
+        "Dividend",
+        "Type",
+        "Payment Date",
+        "Yield",
+        "Error",
+    ]
+    assert len(data) == 8 + 1 + 1 + 8
+    assert data["Error"][:8].isnull().all()
+    assert data["Error"][8].startswith("ERR#0122")
+    assert data["Error"][9].startswith("ERR#0061")
+    assert data["Country"][9] == "united states"
+    assert data["Date"][0] == pd.Timestamp("2019-10-11")
+    assert data["Yield"][0] == 5.67
+    assert data["Payment Date"].dtype == data["Date"].dtype
+
+    single = investpy.get_stock_dividends(stock="BBVA", country="spain")
+
+    pd.testing.assert_series_equal(data["Date"][:8], single["Date"], check_names=False)
+
+    data = investpy.get_stocks_dividends(
+        stocks=["BBVA"], country="spain", as_json=True, numeric=False
+    )
+
+    assert data[0]["Yield"] == "5.67%"
+
+    params = [
+        {"stocks": "BBVA", "country": "spain"},
+        {"stocks": ["BBVA"], "country": "spain", "max_workers": 0},
+        {"stocks": ["BBVA"], "country": "spain", "incremental": None},
+        {"stocks": ["BBVA"], "country": "spain", "numeric": None},
+    ]
+
+    for param in params:
+        with pytest.raises(ValueError):
+            investpy.get_stocks_dividends(**param)
+
+
+def test_investpy_financial_summary(monkeypatch):
+    """
+    This function checks that every financial summary table is served from the same response.
+    """
+
+    class Response:
+        status_code = 200
+        text = load_fixture("financial_summary.html")
+
+    calls = list()
+
+    def get(url, params=None, headers=None):
+        calls.append(params["period_type"])
+        return Response()
+
+    monkeypatch.setattr(requests, "get", get)
+    monkeypatch.setattr(investpy.stocks, "FINANCIAL_SUMMARIES", Cache(ttl=60))
+
+    income = investpy.get_stock_financial_summary(
+        stock="AAPL", country="united states", summary_type="income_statement"
+    )
+
+    assert list(income.columns) == [
+        "Total Revenue",
+        "Gross Profit",
+        "Operating Income",
+        "Net Income",
+    ]
+    assert income.index[0] == datetime(2019, 9, 28)
+
+    balance = investpy.get_stock_financial_summary(
+        stock="AAPL", country="united states", summary_type="balance_sheet"
+    )
+
+    assert list(balance.columns) == [
+        "Total Assets",
+        "Total Liabilities",
+        "Total Equity",
+    ]
+    assert calls == ["Annual"]
+
+    summaries = investpy.get_stock_financial_summary(
+        stock="AAPL", country="united states", summary_type="all"
+    )
+
+    assert list(summaries.keys()) == list(cst.FINANCIAL_SUMMARY_TYPES.keys())
+    pd.testing.assert_frame_equal(summaries["income_statement"], income)
+    pd.testing.assert_frame_equal(summaries["balance_sheet"], balance)
+    assert calls == ["Annual"]
+
+    investpy.get_stock_financial_summary(
+        stock="AAPL", country="united states", summary_type="all", period="quarterly"
+    )
+
+    assert calls == ["Annual", "Interim"]
+
+    # Responses with no tables raise and are not kept, so they are requested again
+    Response.text = "<html><body>Access denied</body></html>"
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="ERR#0004"):
+            investpy.get_stock_financial_summary(
+                stock="MSFT", country="united states", summary_type="all"
+            )
+
+    assert calls == ["Annual", "Interim", "Annual", "Annual"]
+
+    with pytest.raises(ValueError):
+        investpy.get_stock_financial_summary(
+            stock="AAPL", country="united states", summary_type="everything"
+        )
+
+
+def test_investpy_financial_summary_batch(monkeypatch, tmp_path):
+    """
+    This function checks that the financial summaries of several stocks are retrieved in long format and resumed.
+    """
+
+    calls = list()
+
+    class Response:
+        status_code = 200
+        text = load_fixture("financial_summary.html")
+
+    class Session:
+        def get(self, url, params=None, headers=None):
+            calls.append((params["pid"], params["period_type"]))
+            return Response()
+
+    monkeypatch.setattr(financials, "pooled_session", lambda: Session())
+    monkeypatch.setattr(investpy.stocks, "FINANCIAL_SUMMARIES", Cache(ttl=60))
+
+    data = investpy.get_stocks_financial_summary(
+        stocks=["AAPL", "MSFT", "XXXX"],
+        country="united states",
+        max_workers=3,
+        resume=str(tmp_path),
+    )
+
+    assert len(calls) == 4
+    assert list(data.columns) == [
+        "Stock Symbol",
+        "Country",
+        "Period",
+        "Statement",
+        "Field",
+        "Date",
+        "Value",
+        "Error",
+    ]
+    # 11 fields of 4 dates per stock and period, and one row per unknown pair
+    assert len(data) == 2 * 2 * 11 * 4 + 2
+    assert data["Value"].dtype == "float64"
+    assert data["Error"].notnull().sum() == 2
+    assert list(data["Period"].unique()) == ["annual", "quarterly"]
+
+    wide = investpy.get_stock_financial_summary(
+        stock="AAPL", country="united states", summary_type="cash_flow_statement"
+    )
+    rows = data[
+        (data["Stock Symbol"] == "AAPL")
+        & (data["Period"] == "annual")
+        & (data["Statement"] == "cash_flow_statement")
+    ]
+
+    pd.testing.assert_frame_equal(
+        rows.pivot(index="Date", columns="Field", values="Value"),
+        wide[sorted(wide.columns)].sort_index(),
+        check_names=False,
+        check_column_type=False,
+    )
+
+    # Resumed from the stored financial summaries, with no request sent
+    calls.clear()
+    monkeypatch.setattr(investpy.stocks, "FINANCIAL_SUMMARIES", Cache(ttl=60))
+
+    resumed = investpy.get_stocks_financial_summary(
+        stocks=["AAPL", "MSFT", "XXXX"], country="united states", resume=str(tmp_path)
+    )
+
+    assert len(calls) == 0
+    pd.testing.assert_frame_equal(resumed, data)
+
+    data = investpy.get_stocks_financial_summary(
+        stocks=[("AAPL", "united states")], periods="Quarterly"
+    )
+
+    assert calls == [(6408, "Interim")]
+    assert data["Period"].unique().tolist() == ["quarterly"]
+
+    params = [
+        {"stocks": "AAPL", "country": "united states"},
+        {"stocks": ["AAPL"], "country": "united states", "periods": "monthly"},
+        {"stocks": ["AAPL"], "country": "united states", "periods": []},
+        {"stocks": ["AAPL"], "country": "united states", "max_workers": 0},
+        {"stocks": ["AAPL"], "country": "united states", "resume": 1},
+    ]
+
+    for param in params:
+        with pytest.raises(ValueError):
+            investpy.get_stocks_financial_summary(**param)
+
+    # Responses with no tables are reported per pair and not stored, so they are retried
+    Response.text = "<html><body>Access denied</body></html>"
+
+    blocked = investpy.get_stocks_financial_summary(
+        stocks=["MSFT"],
+        country="united states",
+        periods="annual",
+        resume=str(tmp_path / "blocked"),
+    )
+
+    assert len(blocked) == 1
+    assert blocked["Error"][0].startswith("ERR#0004")
+    assert not (tmp_path / "blocked").exists()
+
+    with pytest.raises(RuntimeError, match="ERR#0004"):
+        financials.melt_financial_summaries(Response.text)
+
+
+def test_investpy_company_profile(monkeypatch):
+    """
+    This function checks that the company profiles are kept in memory and retrieved in batches.
+    """
+
+    calls = list()
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, url):
+            self.text = load_fixture(
+                "company_profile_bolsamadrid.html"
+                if "bolsamadrid" in url
+                else "company_profile.html"
+            )
+
+    class Session:
+        def get(self, url, headers=None):
+            calls.append(url)
+            return Response(url)
+
+    monkeypatch.setattr(profiles, "pooled_session", lambda: Session())
+    monkeypatch.setattr(investpy.stocks, "COMPANY_PROFILES", Cache(ttl=60))
+
+    data = investpy.get_stocks_company_profile(
+        stocks=["BBVA", "SAN", "XXXX", ("AAPL", "united states")],
+        country="spain",
+        language="spanish",
+        max_workers=4,
+    )
+
+    assert len(calls) == 2
+    assert list(data.columns) == ["Stock Symbol", "Country", "url", "desc", "Error"]
+    assert data["Error"].notnull().tolist() == [False, False, True, True]
+    assert data.loc[3, "Error"].startswith("ERR#0127")
+    assert data.loc[0, "url"].endswith("ISIN=ES0113211835")
+    assert data.loc[0, "desc"] == (
+        "Banco Bilbao Vizcaya Argentaria, S.A. es una entidad financiera. Opera en"
+        " banca minorista, banca mayorista y gestion de activos."
+    )
+
+    # Served from memory, with no request sent
+    calls.clear()
+
+    monkeypatch.setattr(requests, "get", Session().get)
+
+    profile = investpy.get_stock_company_profile(
+        stock="BBVA", country="spain", language="spanish"
+    )
+
+    assert calls == []
+    assert profile == data.loc[0, ["url", "desc"]].to_dict()
+
+    # Every language is kept apart, since it is retrieved from a different source
+    profile = investpy.get_stock_company_profile(
+        stock="BBVA", country="spain", language="english"
+    )
+
+    assert calls == ["https://www.investing.com/equities/bbva-company-profile"]
+    assert profile["desc"].startswith("Banco Bilbao Vizcaya Argentaria, S.A. (BBVA)")
+
+    records = investpy.get_stocks_company_profile(
+        stocks=["BBVA"], country="spain", as_json=True
+    )
+
+    assert len(calls) == 1
+    assert records[0]["desc"] == profile["desc"]
+
+    # Profiles with no description are not kept, so they are retrieved again
+    calls.clear()
+
+    monkeypatch.setattr(
+        Response, "__init__", lambda self, url: setattr(self, "text", "<html></html>")
+    )
+
+    for _ in range(2):
+        profile = investpy.get_stock_company_profile(
+            stock="SAN", country="spain", language="english"
+        )
+
+        assert profile["desc"] is None
+
+    assert len(calls) == 2
+
+
+def test_investpy_search_pages(monkeypatch):
+    """
+    This function checks that the search result pages are requested concurrently and merged in order.
+    """
+
+    # The first quote of the second page repeats the first one, as Investing.com sometimes does
+    quotes = [
+        {
+            "pairId": 0 if i == 270 else i,
+            "name": "Quote " + str(i),
+            "symbol": "Q" + str(i),
+            "flag": "Spain" if i % 3 else "Germany",
+            "link": "/equities/quote-" + str(i),
+            "pair_type": "equities" if i % 2 else "etf",
+            "exchange": "Madrid",
+        }
+        for i in range(700)
+    ]
+
+    offsets = list()
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, offset):
+            self.offset = offset
+
+        def json(self):
+            return {
+                "total": {"quotes": len(quotes)},
+                "quotes": quotes[self.offset : self.offset + 270],
+            }
+
+    class Session:
+        def post(self, url, headers=None, data=None):
+            offsets.append(data["offset"])
+            return Response(data["offset"])
+
+    monkeypatch.setattr(search, "pooled_session", lambda: Session())
+    monkeypatch.setattr(search, "SEARCH_RESULTS", Cache(maxsize=0))
+
+    results = investpy.search_quotes(text="quote", max_workers=2)
+
+    assert sorted(offsets) == [0, 270, 540]
+    assert [result.id_ for result in results] == list(range(270)) + list(
+        range(271, 700)
+    )
+
+    offsets.clear()
+
+    results = investpy.search_quotes(
+        text="quote", products=["stocks"], countries=["spain"], n_results=200
+    )
+
+    expected = [
+        quote["pairId"]
+        for quote in quotes
+        if quote["flag"] == "Spain" and quote["pair_type"] == "equities"
+    ]
+
+    assert [result.id_ for result in results] == expected[:200]
+    assert {result.pair_type for result in results} == {"stocks"}
+
+    # Just the pages up to `n_results` are requested if the results are not filtered
+    offsets.clear()
+
+    results = investpy.search_quotes(text="quote", n_results=300)
+
+    assert sorted(offsets) == [0, 270]
+    assert len(results) == 300
+
+    offsets.clear()
+
+    result = investpy.search_quotes(text="quote", countries=["germany"], n_results=1)
+
+    assert offsets == [0]
+    assert result.id_ == 0
+
+    # No more pages are requested once enough search results were yielded
+    offsets.clear()
+
+    results = investpy.iter_search_quotes(text="quote", countries=["spain"])
+
+    assert offsets == []
+    assert [next(results).id_ for _ in range(3)] == [1, 2, 4]
+    assert offsets == [0]
+
+    results.close()
+
+    offsets.clear()
+
+    results = list(
+        investpy.iter_search_quotes(text="quote", products=["etfs"], n_results=200)
+    )
+
+    assert sorted(offsets) == [0, 270]
+    etfs = [quote["pairId"] for quote in quotes if quote["pair_type"] == "etf"]
+
+    assert [result.id_ for result in results] == list(dict.fromkeys(etfs))[:200]
+
+    with pytest.raises(ValueError, match="ERR#0074"):
+        investpy.iter_search_quotes(text=None)
+
+
+def test_investpy_search_catalog(monkeypatch):
+    """
+    This function checks that the search results are looked up locally first and kept in memory.
+    """
+
+    texts = list()
+
+    class Response:
+        status_code = 200
+
+        def json(self):
+            return {
+                "total": {"quotes": 1},
+                "quotes": [
+                    {
+                        "pairId": 6408,
+                        "name": "Apple Inc",
+                        "symbol": "AAPL",
+                        "flag": "USA",
+                        "link": "/equities/apple-computer-inc",
+                        "pair_type": "equities",
+                        "exchange": "NASDAQ",
+                    }
+                ],
+            }
+
+    class Session:
+        def post(self, url, headers=None, data=None):
+            texts.append(data["search_text"])
+            return Response()
+
+    monkeypatch.setattr(search, "pooled_session", lambda: Session())
+    monkeypatch.setattr(search, "SEARCH_RESULTS", Cache(ttl=60))
+
+    result = investpy.search_quotes(
+        text="aapl",
+        products=["stocks"],
+        countries=["united states"],
+        n_results=1,
+        exact=True,
+    )
+
+    assert texts == []
+    assert (result.id_, result.symbol, result.country) == (
+        6408,
+        "AAPL",
+        "united states",
+    )
+    assert result.tag == "/equities/apple-computer-inc"
+
+    # A new instance per search, since the retrieved data is kept in it
+    again = investpy.search_quotes(
+        text="AAPL", countries=["united states"], n_results=1, exact=True
+    )
+
+    assert again == result and again is not result
+
+    # The home listings come first, as ranked by Investing.com, no matter the order of the static data files
+    results = investpy.search_quotes(text="bbva", products=["stocks"], exact=True)
+
+    assert [result.country for result in results[:3]] == [
+        "spain",
+        "united states",
+        "mexico",
+    ]
+
+    # The currency crosses have their name as symbol, which their historical data requests need
+    result = investpy.search_quotes(text="eur/usd", n_results=1, exact=True)
+
+    assert (result.symbol, result.pair_type) == ("EUR/USD", "currencies")
+    assert result._historical_schema()[1] == "EUR/USD"
+
+    # Investing.com is searched if nothing matches locally, and its results kept in memory
+    for _ in range(2):
+        results = investpy.search_quotes(text="apple inc nasdaq", exact=True)
+
+        assert [result.id_ for result in results] == [6408]
+
+    assert texts == ["apple inc nasdaq"]
+
+    with pytest.raises(ValueError, match="ERR#0156"):
+        investpy.search_quotes(text="aapl", exact=1)
+
+
+def test_investpy_retrieve_all(monkeypatch):
+    """
+    This function checks that the data of several search results is retrieved concurrently, reporting errors.
+    """
+
+    calls, periods, acquired = list(), list(), list()
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, text):
+            self.text = text
+
+    class Session:
+        def get(self, url, headers=None):
+            calls.append(url)
+            return Response(load_fixture("stock_information.html"))
+
+        def post(self, url, headers=None, data=None):
+            calls.append(url)
+            if "GetTechincalData" in url:
+                periods.append(data["period"])
+                return Response(load_fixture("technical_data.html"))
+            return Response(load_fixture("historical_data.html"))
+
+    monkeypatch.setattr(historical, "pooled_session", lambda: Session())
+    monkeypatch.setattr(search_obj, "pooled_session", lambda: Session())
+    monkeypatch.setattr(search, "pooled_session", lambda: Session())
+    monkeypatch.setattr(extra.RateLimiter, "acquire", lambda self: acquired.append(1))
+
+    def build(id_):
+        return SearchObj(
+            id_=id_,
+            name="BBVA",
+            symbol="BBVA",
+            tag="/equities/bbva",
+            country="spain",
+            pair_type="stocks",
+            exchange="Madrid",
+        )
+
+    objs = [build(32237), build(32238), build(32237)]
+
+    results = investpy.retrieve_all(
+        objs,
+        what=("historical", "technical_indicators", "information"),
+        from_date="01/01/1980",
+        to_date="01/01/2020",
+        technical_interval="weekly",
+        max_workers=4,
+        rate_limit=100,
+    )
+
+    # Every financial product is just retrieved once per id, in 3 historical windows
+    assert sorted(results) == [32237, 32238]
+    assert len(calls) == 10
+
+    # Every request (and not just every retrieval) is rate limited
+    assert len(acquired) == len(calls)
+
+    assert periods == ["week", "week"]
+
+    for id_, result in results.items():
+        assert result["historical"].index.name == "Date"
+        assert list(result["technical_indicators"].columns) == [
+            "indicator",
+            "value",
+            "signal",
+        ]
+        assert result["information"] is None
+        assert list(result["errors"]) == ["information"]
+        assert result["errors"]["information"].startswith("ERR#0004")
+
+    # The retrieved data is also kept in the retrieved instances
+    assert objs[0].data is results[32237]["historical"]
+    assert objs[1].technical_indicators is results[32238]["technical_indicators"]
+
+    # The retrievals of the same financial product never overlap
+    active, overlapped = collections.Counter(), list()
+
+    def retrieval(self, *args, **kwargs):
+        active[self.id_] += 1
+        overlapped.append(active[self.id_] > 1)
+        time.sleep(0.01)
+        active[self.id_] -= 1
+
+    for method in ["retrieve_recent_data", "retrieve_information", "retrieve_currency"]:
+        monkeypatch.setattr(SearchObj, method, retrieval)
+
+    results = investpy.retrieve_all(
+        objs, what=("recent", "information", "currency"), max_workers=6
+    )
+
+    assert len(overlapped) == 6 and not any(overlapped)
+    assert all(not result["errors"] for result in results.values())
+
+    with pytest.raises(ValueError, match="ERR#0158"):
+        investpy.retrieve_all(objs, what="dividends")
+
+    with pytest.raises(ValueError, match="ERR#0011"):
+        investpy.retrieve_all(objs, what="historical", to_date="01/01/2020")
+
+    with pytest.raises(ValueError, match="ERR#0159"):
+        investpy.retrieve_all(objs, what="currency", rate_limit=0)
+
+    with pytest.raises(ValueError, match="ERR#0164"):
+        investpy.retrieve_all(
+            objs, what="technical_indicators", technical_interval="Daily"
+        )
+
+
+def test_investpy_search_obj_windows(monkeypatch):
+    """
+    This function checks that the historical data windows of search results are requested concurrently and merged.
+    """
+
+    requested = list()
+
+    class Response:
+        status_code = 200
+        text = load_fixture("historical_data.html")
+
+    class Session:
+        def post(self, url, headers=None, data=None):
+            requested.append((data["interval_sec"], data["st_date"], data["end_date"]))
+            return Response()
+
+    monkeypatch.setattr(historical, "pooled_session", lambda: Session())
+
+    obj = SearchObj(
+        id_=32237,
+        name="BBVA",
+        symbol="BBVA",
+        tag="/equities/bbva",
+        country="spain",
+        pair_type="stocks",
+        exchange="Madrid",
+    )
+
+    daily = obj.retrieve_historical_data(from_date="01/01/1960", to_date="01/01/2019")
+
+    assert len(requested) == 4
+    assert len(daily) == 4 * 10
+
+    requested.clear()
+
+    # Weekly data fits in fewer windows, which are requested in ascending order
+    weekly = obj.retrieve_historical_data(
+        from_date="01/01/1900", to_date="01/01/2019", interval="weekly"
+    )
+
+    assert sorted(requested, key=lambda window: window[1][-4:]) == [
+        ("Weekly", "01/01/1900", "01/01/1994"),
+        ("Weekly", "01/02/1994", "01/01/2019"),
+    ]
+    assert len(weekly) == 2 * 10
+    assert obj.data is weekly
+
+    with pytest.raises(ValueError, match="ERR#0073"):
+        obj.retrieve_historical_data(
+            from_date="01/01/1900", to_date="01/01/2019", interval="hourly"
+        )
+
+    # An empty last window (e.g. a non-trading stretch) keeps the data of the rest
+    class Empty:
+        status_code = 200
+        text = ""
+
+    def post(self, url, headers=None, data=None):
+        return Empty() if data["end_date"] == "01/01/2019" else Response()
+
+    monkeypatch.setattr(Session, "post", post)
+
+    daily = obj.retrieve_historical_data(from_date="01/01/1960", to_date="01/01/2019")
+
+    assert len(daily) == 3 * 10
+
+
+def test_investpy_json_fp(monkeypatch):
+    """
+    This function checks that the public historical data functions write the :obj:`json` to the introduced file.
+    """
+
+    class Response:
+        status_code = 200
+        text = load_fixture("historical_data.html")
+
+    class Session:
+        def post(self, url, headers=None, data=None):
+            return Response()
+
+    monkeypatch.setattr(historical, "pooled_session", lambda: Session())
+
+    params = {
+        "stock": "BBVA",
+        "country": "spain",
+        "from_date": "01/01/2019",
+        "to_date": "01/02/2019",
+        "as_json": True,
+    }
+
+    expected = investpy.get_stock_historical_data(**params)
+
+    fp = io.StringIO()
+
+    assert investpy.get_stock_historical_data(fp=fp, **params) is None
+    assert fp.getvalue() == expected
+
+    # The compact output is a str, whether orjson is installed or not
+    for module in [historical.orjson, None]:
+        monkeypatch.setattr(historical, "orjson", module)
+
+        compact = investpy.get_stock_historical_data(compact=True, **params)
+
+        assert isinstance(compact, str)
+        assert json.loads(compact) == json.loads(expected)
+
+        fp = io.StringIO()
+
+        assert investpy.get_stock_historical_data(fp=fp, compact=True, **params) is None
+        assert fp.getvalue() == compact
+
+    with pytest.raises(ValueError, match="ERR#0160"):
+        investpy.get_stock_historical_data(compact="yes", **params)
+
+    with pytest.raises(ValueError, match="ERR#0161"):
+        investpy.get_stock_historical_data(fp="data.json", **params)
+
+    with pytest.raises(ValueError, match="ERR#0161"):
+        investpy.get_stock_recent_data(stock="BBVA", country="spain", fp=io.StringIO())
+
+    DAILY_DATA.clear()
+
+
+def test_investpy_adjusted_errors(monkeypatch):
+    """
+    This function checks that just the stocks with no dividends are adjusted with no dividends.
+    """
+
+    class Response:
+        status_code = 200
+        text = load_fixture("historical_data.html")
+
+    class Session:
+        def post(self, url, headers=None, data=None):
+            return Response()
+
+    monkeypatch.setattr(historical, "pooled_session", lambda: Session())
+    monkeypatch.setattr(investpy.stocks, "DIVIDENDS", Store(ttl=60))
+
+    def get_stock_dividends(stock, country, incremental=False):
+        raise RuntimeError(error)
+
+    monkeypatch.setattr(investpy.stocks, "get_stock_dividends", get_stock_dividends)
+
+    params = {
+        "stock": "BBVA",
+        "country": "spain",
+        "from_date": "01/01/2019",
+        "to_date": "01/02/2019",
+        "adjusted": True,
+    }
+
+    error = "ERR#0061: introduced stock has no dividend's data to display."
+
+    data = investpy.get_stock_historical_data(**params)
+
+    assert np.allclose(data["Adj Close"], data["Close"])
+
+    error = "ERR#0004: data retrieval error while scraping."
+
+    with pytest.raises(RuntimeError, match="ERR#0004"):
+        investpy.get_stock_historical_data(**params)
+
+    DAILY_DATA.clear()